@@ -11,6 +11,7 @@ from .layout_schema import (
     path_id_to_snake,
 )
 from .code_export import layout_to_python
+from .layout_cache import LayoutIndex, get_layout_index, invalidate_layout_cache
 from .renderer import build_ui_from_layout
 from .skeleton import generate_callback_skeleton, generate_model_schema
 from .layout_model import get_prop_editor_specs
@@ -18,6 +19,9 @@ from .layout_model import get_prop_editor_specs
 __all__ = [
     "layout_to_python",
     "load_layout",
+    "LayoutIndex",
+    "get_layout_index",
+    "invalidate_layout_cache",
     "path_id_to_snake",
     "collect_state_entries",
     "collect_all_widget_path_ids",
@@ -9,6 +9,16 @@ Standard: Eine Kopie in widgets/static/ – alle Apps nutzen /widgets-static/plo
 Aufruf (aus lab_suite):
   python -m app_builder.fetch_plotly_offline
   python -m app_builder.fetch_plotly_offline --target labs/mein_lab/static   # nur bei Bedarf pro App
+
+Schlanker Build: Die Labs brauchen meist nur 2D-Plots (scatter, scattergl, bar, histogram, heatmap).
+Plotly veröffentlicht cartesian und gl2d nur als getrennte Teil-Bundles; ein kombinierter Build
+entsteht im plotly.js-Repository (Version 2.27.0) mit
+  npm run custom-bundle -- --out plotly-kt --traces scatter,scattergl,bar,histogram,heatmap
+und wird mit --from-file dist/plotly-kt.min.js übernommen (Achtung: plotly_3d braucht den vollen Build).
+
+Danach werden die Assets für /widgets-static erzeugt (widgets.static_assets.build_assets):
+Hash-Dateiname, .gz und .br (falls Paket brotli installiert), manifest.json.
+  python -m app_builder.fetch_plotly_offline --assets-only   # nur Assets neu bauen
 """
 from __future__ import annotations
 
@@ -16,10 +26,30 @@ import argparse
 import sys
 from pathlib import Path
 
-PLOTLY_JS_URL = "https://cdn.plot.ly/plotly-2.27.0.min.js"
+PLOTLY_VERSION = "2.27.0"
+PLOTLY_JS_URL = f"https://cdn.plot.ly/plotly-{PLOTLY_VERSION}.min.js"
+# Offizielle Teil-Bundles (je ohne die Trace-Typen des anderen)
+PLOTLY_BUNDLE_URLS = {
+    "full": PLOTLY_JS_URL,
+    "cartesian": f"https://cdn.plot.ly/plotly-cartesian-{PLOTLY_VERSION}.min.js",
+    "gl2d": f"https://cdn.plot.ly/plotly-gl2d-{PLOTLY_VERSION}.min.js",
+}
 OUTPUT_FILENAME = "plotly.min.js"
 
 
+def _build_assets(target_dir: Path) -> None:
+    """Hash-Namen, .gz/.br und manifest.json erzeugen (nur für das gemeinsame widgets/static)."""
+    lab_suite = Path(__file__).resolve().parent.parent
+    if str(lab_suite) not in sys.path:
+        sys.path.insert(0, str(lab_suite))
+    from widgets.static_assets import build_assets
+    manifest = build_assets(target_dir)
+    for name, entry in manifest.items():
+        variants = [s for s in (".gz", ".br") if (target_dir / (entry["file"] + s)).exists()]
+        sizes = ", ".join(f"{s[1:]} {(target_dir / (entry['file'] + s)).stat().st_size // 1024} KB" for s in variants)
+        print(f"Asset: {name} → {entry['file']} ({sizes})")
+
+
 def main() -> int:
     app_builder = Path(__file__).resolve().parent
     lab_suite = app_builder.parent
@@ -33,23 +63,52 @@ def main() -> int:
         default=default_target,
         help=f"Zielordner für plotly.min.js (default: {default_target})",
     )
+    parser.add_argument(
+        "--bundle",
+        choices=sorted(PLOTLY_BUNDLE_URLS),
+        default="full",
+        help="Plotly-Bundle von cdn.plot.ly (default: full)",
+    )
+    parser.add_argument(
+        "--from-file",
+        type=Path,
+        default=None,
+        help="Lokalen (z. B. selbst gebauten) Plotly-Build übernehmen statt Download",
+    )
+    parser.add_argument(
+        "--assets-only",
+        action="store_true",
+        help="Nichts laden, nur Hash-/gzip-/brotli-Assets im Zielordner neu erzeugen",
+    )
     args = parser.parse_args()
     target_dir = Path(args.target).resolve()
     target_dir.mkdir(parents=True, exist_ok=True)
     out_path = target_dir / OUTPUT_FILENAME
+    shared = target_dir == default_target.resolve()
+
+    if not args.assets_only:
+        if args.from_file is not None:
+            try:
+                data = Path(args.from_file).read_bytes()
+            except OSError as e:
+                print(f"Datei nicht lesbar: {e}", file=sys.stderr)
+                return 1
+        else:
+            url = PLOTLY_BUNDLE_URLS[args.bundle]
+            try:
+                import urllib.request
+                req = urllib.request.Request(url, headers={"User-Agent": "KT-lab_suite/1.0"})
+                with urllib.request.urlopen(req, timeout=60) as resp:
+                    data = resp.read()
+            except Exception as e:
+                print(f"Download fehlgeschlagen: {e}", file=sys.stderr)
+                print("Bitte", url, "manuell herunterladen und als", out_path, "speichern.", file=sys.stderr)
+                return 1
+        out_path.write_bytes(data)
+        print(f"Gespeichert: {out_path} ({len(data) // 1024} KB)")
 
-    try:
-        import urllib.request
-        req = urllib.request.Request(PLOTLY_JS_URL, headers={"User-Agent": "KT-lab_suite/1.0"})
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = resp.read()
-    except Exception as e:
-        print(f"Download fehlgeschlagen: {e}", file=sys.stderr)
-        print("Bitte plotly-2.27.0.min.js manuell von cdn.plot.ly herunterladen und als", out_path, "speichern.", file=sys.stderr)
-        return 1
-
-    out_path.write_bytes(data)
-    print(f"Gespeichert: {out_path} ({len(data) // 1024} KB)")
+    if shared:
+        _build_assets(target_dir)
     return 0
 
 
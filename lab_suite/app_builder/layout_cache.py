@@ -0,0 +1,86 @@
+"""
+Prozessweiter Cache für layout.json und alle daraus abgeleiteten Indizes.
+
+build_root() läuft bei jedem Seitenaufruf (neuer Tab, Reload, Reconnect). Statt jedes Mal
+JSON zu parsen und den Baum mehrfach zu traversieren (Binding, Callback-Liste, Path-IDs,
+Widget-Typen), liefert get_layout_index() einen gemeinsamen Eintrag. Neu berechnet wird nur,
+wenn sich mtime/Größe von layout.json ändern oder invalidate_layout_cache() aufgerufen wird
+(z. B. nach „Layout speichern“ im Editor).
+
+Der Eintrag wird von allen Clients geteilt: layout und die Indizes nicht verändern.
+Der Property-Editor arbeitet auf einer eigenen Kopie (copy.deepcopy) und speichert diese.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .layout_schema import (
+    _collect_widgets_from_dashboard,
+    collect_all_widget_path_ids,
+    collect_callback_names,
+    collect_semantic_binding,
+    load_layout,
+)
+
+
+@dataclass(frozen=True)
+class LayoutIndex:
+    """Geparstes Layout plus abgeleitete Indizes (nur lesen, wird von allen Clients geteilt)."""
+    layout: dict
+    semantic_binding: dict[str, str]  # user_id → path_id
+    callback_names: list[tuple[str, str, str, str, str]]  # wie collect_callback_names
+    widget_path_ids: list[str]
+    widget_types: frozenset[str]  # alle vorkommenden widget_type (z. B. Plotly-Preload nur bei Plots)
+    stamp: tuple[int, int]  # (mtime_ns, size) von layout.json beim Laden
+
+
+# Aufgelöster Pfad → LayoutIndex
+_CACHE: dict[str, LayoutIndex] = {}
+_LOCK = threading.Lock()
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def build_layout_index(layout: dict, stamp: tuple[int, int] = (0, 0)) -> LayoutIndex:
+    """Alle Indizes für ein (bereits geparstes) Layout berechnen."""
+    layout.setdefault("appearance", {})
+    return LayoutIndex(
+        layout=layout,
+        semantic_binding=collect_semantic_binding(layout),
+        callback_names=collect_callback_names(layout),
+        widget_path_ids=collect_all_widget_path_ids(layout),
+        widget_types=frozenset(str(wt) for _, wt, _ in _collect_widgets_from_dashboard(layout) if wt),
+        stamp=stamp,
+    )
+
+
+def get_layout_index(path: str | Path) -> LayoutIndex:
+    """LayoutIndex für path; bei unverändertem layout.json nur ein stat() und ein Dict-Lookup."""
+    p = Path(path)
+    key = str(p.resolve())
+    stamp = _file_stamp(p)
+    cached = _CACHE.get(key)
+    if cached is not None and cached.stamp == stamp:
+        return cached
+    with _LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+        index = build_layout_index(load_layout(p), stamp)
+        _CACHE[key] = index
+        return index
+
+
+def invalidate_layout_cache(path: str | Path | None = None) -> None:
+    """Cache-Eintrag verwerfen (path=None: alle), z. B. nach dem Speichern im Editor."""
+    with _LOCK:
+        if path is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(str(Path(path).resolve()), None)
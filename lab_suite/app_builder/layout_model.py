@@ -165,6 +165,8 @@ WIDGET_DEFAULTS: dict[str, dict] = {
     "gain_control_vue": {"type": "widget", "id": "", "widget_type": "gain_control_vue", "props": {"label": "Gain", "min": 0, "max": 10, "value": 1.0}},
     "vu_meter": {"type": "widget", "id": "", "widget_type": "vu_meter", "props": {"min": 0, "max": 1.0, "show_value": True, "width": "120px", "height": "80px"}},
     "led": {"type": "widget", "id": "", "widget_type": "led", "props": {"label": "", "size": 16}},
+    # Wasserfall/Spektrogramm: App schiebt pro Tick eine Spektrumzeile (gui_binding.push_row)
+    "waterfall": {"type": "widget", "id": "", "widget_type": "waterfall", "props": {"rows": 200, "db_min": -100, "db_max": 0, "colormap": "viridis", "height": "300px", "max_bins": 1024, "x_min": "", "x_max": "", "x_unit": "Hz"}},
     "image_icon_demo": {"type": "widget", "id": "", "widget_type": "image_icon_demo", "props": {"image_src": "", "image_alt": "Image", "show_icon": True, "label": ""}},
     # Plotly: generischer Graph (DSP: Plot, PlotXY, Spektrum, Histogram, Scatter); Daten von App per update_figure
     "plotly_graph": {
@@ -191,6 +193,7 @@ WIDGET_DEFAULTS: dict[str, dict] = {
             "line_dash": "solid",
             "line_width": 1.5,
             "responsive": True,
+            "downsample": "auto",
         },
     },
 }
@@ -256,7 +259,7 @@ WIDGET_PROP_HINTS: dict[str, dict[str, dict[str, Any]]] = {
     },
     "plotly_graph": {
         "height": {"label": "Höhe (z. B. 400px, 50vh)", "type": "string"},
-        "plotly_script_url": {"label": "Plotly.js URL (Default: /widgets-static/plotly.min.js für Offline; leer = CDN)", "type": "string"},
+        "plotly_script_url": {"label": "Plotly.js URL (Default: /widgets-static/plotly.min.js, lokal; leer = Default)", "type": "string"},
         "title": {"label": "Titel (über dem Plot)", "type": "string"},
         "xaxis_title": {"label": "X-Achse Label", "type": "string"},
         "yaxis_title": {"label": "Y-Achse Label", "type": "string"},
@@ -274,6 +277,18 @@ WIDGET_PROP_HINTS: dict[str, dict[str, dict[str, Any]]] = {
         "line_dash": {"label": "Linienart", "type": "string", "options": ["solid", "dot", "dash", "longdash", "dashdot", "longdashdot"]},
         "line_width": {"label": "Linienbreite", "type": "number", "min": 0.5, "max": 10},
         "responsive": {"label": "Responsive", "type": "boolean"},
+        "downsample": {"label": "Downsampling (Pixelbreite)", "type": "string", "options": ["auto", "minmax", "lttb", "off"]},
+    },
+    "waterfall": {
+        "rows": {"label": "Zeilen (Verlaufstiefe)", "type": "integer", "min": 10, "max": 2000},
+        "db_min": {"label": "Pegel min (dB)", "type": "number"},
+        "db_max": {"label": "Pegel max (dB)", "type": "number"},
+        "colormap": {"label": "Farbskala", "type": "string", "options": ["viridis", "inferno", "gray"]},
+        "height": {"label": "Höhe (z. B. 300px)", "type": "string"},
+        "max_bins": {"label": "Max. Bins pro Zeile (Block-Maximum)", "type": "integer", "min": 16, "max": 8192},
+        "x_min": {"label": "x-Achse von (z. B. Frequenz)", "type": "string"},
+        "x_max": {"label": "x-Achse bis", "type": "string"},
+        "x_unit": {"label": "x-Einheit", "type": "string"},
     },
 }
 
@@ -45,6 +45,7 @@ WIDGET_STATE_DEFAULTS: dict[str, Any] = {
     "plotly_scatter": None,   # X-Y/Scatter – semantischer Hinweis, wie plotly_graph
     "plotly_histogram": None,
     "plotly_3d": None,        # 3D (Scatter3d, Surface, Mesh3d)
+    "waterfall": None,        # Spektrogramm; Zeilen per push_row von der App, kein Persist
     "table": None,            # Zeilendaten oft von App; State optional (z. B. [])
     "image": None,            # Rastergrafik; reine Anzeige (src in props oder von App)
     "link": None,             # Hyperlink; reine Navigation (url, text in props)
@@ -942,6 +942,35 @@ def _render_widget(
             except ImportError:
                 ui.label("[VuMeter – widgets nicht verfügbar]").classes("text-grey")
 
+        elif widget_type == "waterfall":
+            try:
+                from widgets import Waterfall
+
+                def _num_or_none(v: Any) -> float | None:
+                    if v is None or v == "":
+                        return None
+                    try:
+                        return float(v)
+                    except (TypeError, ValueError):
+                        return None
+
+                el = Waterfall(
+                    rows=int(_to_float(props.get("rows", 200), 200.0)),
+                    db_min=_to_float(props.get("db_min", -100), -100.0),
+                    db_max=_to_float(props.get("db_max", 0), 0.0),
+                    colormap=str(props.get("colormap") or "viridis"),
+                    height=str(props.get("height") or "300px"),
+                    max_bins=int(_to_float(props.get("max_bins", 1024), 1024.0)),
+                    x_min=_num_or_none(props.get("x_min")),
+                    x_max=_num_or_none(props.get("x_max")),
+                    x_unit=str(props.get("x_unit") or "Hz"),
+                )
+                el.classes("w-full")
+                if widget_registry is not None:
+                    widget_registry[path_id] = el
+            except ImportError:
+                ui.label("[Waterfall – widgets nicht verfügbar]").classes("text-grey")
+
         elif widget_type == "led":
             state.setdefault(path_id, props.get("state", "off"))
             val = state.get(path_id, props.get("state", "off"))
@@ -1257,6 +1286,7 @@ def _render_widget(
                     config=config,
                     height=height,
                     plotly_script_url=plotly_script_url,
+                    downsample=_prop_str("downsample", "auto") or "auto",
                 )
                 el.classes("w-full")
                 if widget_registry is not None:
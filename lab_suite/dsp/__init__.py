@@ -0,0 +1,51 @@
+"""
+lab_suite/dsp – Signalverarbeitung für Live-Labs (NumPy, vektorisiert, Timer-tauglich).
+
+Bausteine, die ein Assignment aus timer_tick() pro Block aufruft; Zustand (Phase, Puffer) liegt
+im jeweiligen Objekt, sodass Blöcke nahtlos aneinander anschließen.
+
+Verwendung in einem Assignment:
+  from dsp import Nco, awgn
+  tone = Nco(fs=48000, freq=1000)
+  y = awgn(tone.sine(4800), snr_db=20)
+"""
+from .audio_source import (
+    AudioRingBuffer,
+    AudioSource,
+    DeviceAudioSource,
+    FileAudioSource,
+    SyntheticAudioSource,
+    level_db,
+    open_audio_source,
+    vu_level,
+)
+from .iq_source import IqSource, RecordingSource, RtlSdrSource, open_iq_source
+from .scope import Capture, TriggerScope
+from .signals import Nco, SymbolSource, awgn, constellation, noise, seed
+from .spectrum import SpectrumAnalyzer, enbw_bins, window
+
+__all__ = [
+    "AudioRingBuffer",
+    "AudioSource",
+    "Capture",
+    "DeviceAudioSource",
+    "FileAudioSource",
+    "IqSource",
+    "Nco",
+    "RecordingSource",
+    "RtlSdrSource",
+    "SpectrumAnalyzer",
+    "SymbolSource",
+    "SyntheticAudioSource",
+    "TriggerScope",
+    "awgn",
+    "constellation",
+    "enbw_bins",
+    "level_db",
+    "noise",
+    "open_audio_source",
+    "open_iq_source",
+    "seed",
+    "vu_level",
+    "window",
+]
@@ -0,0 +1,354 @@
+"""
+Audio-Eingang für Labs: Soundkarte (sounddevice), Datei (soundfile) oder synthetisch – gleiche Schnittstelle.
+
+timer_tick() holt pro Tick mit read_available() alle seit dem letzten Aufruf angefallenen Frames
+(float32, ±1; mono als 1D, sonst Frames × Kanäle) und füttert damit z. B. SpectrumAnalyzer oder
+über vu_level() (Pegel → 0…1) ein VuMeter. Der NiceGUI-Loop wartet dabei nie auf die Soundkarte.
+
+- AudioRingBuffer: Ringpuffer für genau einen Schreiber (Audio-Callback-Thread) und einen Leser
+  (Tick). Ohne Lock: Schreib- und Lesezähler gehören je einer Seite, jede Seite liest den Zähler der
+  anderen nur. Ist der Puffer voll, verwirft der Schreiber den neuen Block (overruns, Gegendruck
+  statt Überschreiben ungelesener Daten); fill_ratio zeigt den Füllstand.
+- DeviceAudioSource: sounddevice.InputStream, Callback schreibt in den Ringpuffer; Überläufe der
+  Soundkarte zählt stats["device_overflows"].
+- FileAudioSource: WAV/FLAC/OGG per soundfile, im Takt der Wanduhr (speed) mit loop – zum Üben ohne
+  Mikrofon und für reproduzierbare Aufgaben.
+- SyntheticAudioSource: Sinus + Rauschen (dsp.signals), ohne Audio-Hardware und ohne Pakete – für
+  Headless-Rechner und Tests.
+- open_audio_source(spec): "device" bzw. "device:<name|index>", "synthetic" oder Dateipfad; ohne spec
+  aus AUDIO_SOURCE, sonst Soundkarte falls vorhanden, sonst synthetisch.
+"""
+from __future__ import annotations
+
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .signals import Nco, _buffer, noise
+
+# Kleinster angezeigter Pegel (dBFS) für Stille
+_LEVEL_FLOOR_DB = -120.0
+
+
+def rms(block: np.ndarray) -> float:
+    """Effektivwert über alle Samples (alle Kanäle)."""
+    block = np.asarray(block)
+    return math.sqrt(float(np.vdot(block, block).real) / block.size) if block.size else 0.0
+
+
+def level_db(block: np.ndarray, floor_db: float = _LEVEL_FLOOR_DB) -> float:
+    """Pegel in dBFS (Effektivwert, Vollaussteuerung = 0 dB), nach unten auf floor_db begrenzt."""
+    value = rms(block)
+    return max(floor_db, 20.0 * math.log10(value)) if value > 0 else floor_db
+
+
+def vu_level(block: np.ndarray, range_db: float = 60.0) -> float:
+    """Pegel als 0…1 für VuMeter (Default-Bereich): -range_db dBFS → 0, 0 dBFS → 1."""
+    return min(1.0, max(0.0, 1.0 + level_db(block) / range_db))
+
+
+def _frames_buffer(buf: np.ndarray | None, n: int, channels: int) -> np.ndarray:
+    """Puffer Frames × Kanäle (float32) mit mindestens n Frames (wächst nur)."""
+    if buf is None or len(buf) < n:
+        buf = np.empty((max(n, 1), channels), dtype=np.float32)
+    return buf
+
+
+class AudioRingBuffer:
+    """Ringpuffer Frames × Kanäle (float32) für einen Schreiber und einen Leser, ohne Lock."""
+
+    def __init__(self, capacity: int, channels: int = 1) -> None:
+        self.capacity = max(1, int(capacity))
+        self.channels = max(1, int(channels))
+        self._data = np.zeros((self.capacity, self.channels), dtype=np.float32)
+        # Fortlaufende Zähler (nie zurückgesetzt); Position im Ring = Zähler % capacity
+        self._written = 0  # nur der Schreiber ändert ihn
+        self._read = 0  # nur der Leser ändert ihn
+        self.stats: dict[str, int] = {"written": 0, "read": 0, "overruns": 0, "overrun_frames": 0, "skipped": 0}
+        self._out: np.ndarray | None = None
+
+    @property
+    def available(self) -> int:
+        return self._written - self._read
+
+    @property
+    def fill_ratio(self) -> float:
+        """Füllstand 0…1 (nahe 1: der Leser kommt nicht hinterher)."""
+        return self.available / self.capacity
+
+    def write(self, block: np.ndarray) -> bool:
+        """Schreiber: Block (Frames × Kanäle oder 1D) anhängen; False = voll, Block verworfen."""
+        block = np.asarray(block, dtype=np.float32)
+        if block.ndim == 1:
+            block = block[:, None]
+        n = len(block)
+        if n > self.capacity - (self._written - self._read):
+            self.stats["overruns"] += 1
+            self.stats["overrun_frames"] += n
+            return False
+        start = self._written % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start:start + first] = block[:first]
+        if first < n:
+            self._data[:n - first] = block[first:]
+        # Zähler erst nach den Daten fortschreiben: der Leser sieht nur vollständige Blöcke
+        self._written += n
+        self.stats["written"] += n
+        return True
+
+    def read(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """Leser: bis zu n Frames (Frames × Kanäle); ohne out Sicht auf einen internen Puffer."""
+        n = max(0, min(int(n), self._written - self._read))
+        if out is None:
+            self._out = _frames_buffer(self._out, n, self.channels)
+            out = self._out
+        out = out[:n]
+        start = self._read % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._data[start:start + first]
+        if first < n:
+            out[first:] = self._data[:n - first]
+        self._read += n
+        self.stats["read"] += n
+        return out
+
+    def read_available(self, max_frames: int | None = None) -> np.ndarray:
+        """Leser: alles Vorhandene; mehr als max_frames → die ältesten überspringen (stats["skipped"])."""
+        n = self._written - self._read
+        if max_frames is not None and n > max_frames:
+            self._read += n - max_frames
+            self.stats["skipped"] += n - max_frames
+            n = max_frames
+        return self.read(n)
+
+
+def _shape(block: np.ndarray, channels: int) -> np.ndarray:
+    """Mono als 1D, sonst Frames × Kanäle."""
+    return block[:, 0] if channels == 1 else block
+
+
+class AudioSource(ABC):
+    """Gemeinsame Schnittstelle: start(), stop(), read_available(max_frames); samplerate, channels, stats."""
+
+    samplerate: float = 48000.0
+    channels: int = 1
+
+    def __init__(self) -> None:
+        self.stats: dict[str, int] = {"frames": 0, "dropped": 0}
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def read_available(self, max_frames: int | None = None) -> np.ndarray:
+        """Seit dem letzten Aufruf angefallene Frames (höchstens max_frames); blockiert nicht."""
+
+    def __enter__(self) -> "AudioSource":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+class DeviceAudioSource(AudioSource):
+    """Soundkarten-Eingang: sounddevice.InputStream, Callback-Thread → AudioRingBuffer → read_available()."""
+
+    def __init__(
+        self,
+        samplerate: float = 48000.0,
+        channels: int = 1,
+        *,
+        device: int | str | None = None,
+        blocksize: int = 0,
+        latency: str | float = "low",
+        buffer_sec: float = 2.0,
+    ) -> None:
+        super().__init__()
+        import sounddevice as sd
+
+        self.samplerate = float(samplerate)
+        self.channels = int(channels)
+        self.ring = AudioRingBuffer(int(buffer_sec * self.samplerate), self.channels)
+        self.stats["device_overflows"] = 0
+        self._stream = sd.InputStream(
+            samplerate=self.samplerate,
+            channels=self.channels,
+            device=device,
+            blocksize=blocksize,
+            latency=latency,
+            dtype="float32",
+            callback=self._callback,
+        )
+
+    def _callback(self, indata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
+        # Audio-Thread: nur kopieren und zählen, keine Allokation, kein Lock, kein print
+        if status and status.input_overflow:
+            self.stats["device_overflows"] += 1
+        self.ring.write(indata)
+
+    def start(self) -> None:
+        self._stream.start()
+
+    def stop(self) -> None:
+        self._stream.stop()
+        self._stream.close()
+
+    def read_available(self, max_frames: int | None = None) -> np.ndarray:
+        block = self.ring.read_available(max_frames)
+        self.stats["frames"] += len(block)
+        self.stats["dropped"] = self.ring.stats["overrun_frames"] + self.ring.stats["skipped"]
+        return _shape(block, self.channels)
+
+
+class _PacedSource(AudioSource):
+    """Quelle ohne Hardware: liefert pro Aufruf so viele Frames, wie seit dem letzten Aufruf fällig sind."""
+
+    def __init__(self, speed: float | None) -> None:
+        super().__init__()
+        self.speed = speed
+        self._clock: float | None = None
+        self._due = 0.0
+
+    def start(self) -> None:
+        self._clock = time.monotonic()
+        self._due = 0.0
+
+    def _frames_due(self, max_frames: int | None) -> int:
+        if self.speed is None:
+            return max_frames or int(self.samplerate * 0.1)
+        now = time.monotonic()
+        if self._clock is None:
+            self._clock = now
+            return 0
+        self._due += (now - self._clock) * self.samplerate * self.speed
+        self._clock = now
+        n = int(self._due)
+        self._due -= n
+        if max_frames is not None and n > max_frames:
+            self.stats["dropped"] += n - max_frames
+            self._skip(n - max_frames)
+            n = max_frames
+        return n
+
+    def _skip(self, n: int) -> None:
+        pass
+
+
+class FileAudioSource(_PacedSource):
+    """Audiodatei (WAV/FLAC/OGG, soundfile) als Eingang, im Takt der Wanduhr; loop am Dateiende."""
+
+    def __init__(self, path: str | Path, *, speed: float | None = 1.0, loop: bool = True) -> None:
+        super().__init__(speed)
+        import soundfile as sf
+
+        self.path = Path(path)
+        self._file = sf.SoundFile(str(self.path))
+        self.samplerate = float(self._file.samplerate)
+        self.channels = int(self._file.channels)
+        self.loop = loop
+        self._out: np.ndarray | None = None
+
+    def _skip(self, n: int) -> None:
+        frames = self._file.frames
+        pos = self._file.tell() + n
+        self._file.seek(pos % frames if self.loop and frames else min(pos, frames))
+
+    def read_available(self, max_frames: int | None = None) -> np.ndarray:
+        n = self._frames_due(max_frames)
+        self._out = _frames_buffer(self._out, n, self.channels)
+        out = self._out[:n]
+        done = 0
+        while done < n:
+            got = self._file.read(n - done, dtype="float32", always_2d=True, out=out[done:])
+            done += len(got)
+            if done < n:
+                if not self.loop:
+                    break
+                self._file.seek(0)
+        self.stats["frames"] += done
+        return _shape(out[:done], self.channels)
+
+    def stop(self) -> None:
+        self._file.close()
+
+
+class SyntheticAudioSource(_PacedSource):
+    """Testsignal ohne Hardware: Sinus (freq, level_db dBFS Spitze) plus Rauschen (noise_db dBFS eff.)."""
+
+    def __init__(
+        self,
+        samplerate: float = 48000.0,
+        *,
+        freq: float = 1000.0,
+        level_db: float = -6.0,
+        noise_db: float = -60.0,
+        channels: int = 1,
+        speed: float | None = 1.0,
+    ) -> None:
+        super().__init__(speed)
+        self.samplerate = float(samplerate)
+        self.channels = max(1, int(channels))
+        self.nco = Nco(self.samplerate, freq, amplitude=10.0 ** (level_db / 20.0), dtype=np.float32)
+        self.noise_sigma = 10.0 ** (noise_db / 20.0)
+        self._mono: np.ndarray | None = None
+        self._noise: np.ndarray | None = None
+        self._out: np.ndarray | None = None
+
+    def _skip(self, n: int) -> None:
+        # Phase weiterdrehen, als wären die Frames erzeugt worden
+        self.nco.advance(n)
+
+    def read_available(self, max_frames: int | None = None) -> np.ndarray:
+        n = self._frames_due(max_frames)
+        self._mono = _buffer(self._mono, n, np.float32)
+        self._noise = _buffer(self._noise, n, np.float32)
+        mono = self.nco.sine(n, out=self._mono)
+        if self.noise_sigma > 0:
+            mono += noise(n, self.noise_sigma, out=self._noise)
+        self.stats["frames"] += n
+        if self.channels == 1:
+            return mono
+        self._out = _frames_buffer(self._out, n, self.channels)
+        out = self._out[:n]
+        out[:] = mono[:, None]
+        return out
+
+
+def _default_device_available() -> bool:
+    try:
+        import sounddevice as sd
+        sd.query_devices(kind="input")
+        return True
+    except Exception:
+        return False
+
+
+def open_audio_source(spec: str | None = None, **kwargs: Any) -> AudioSource:
+    """
+    Quelle nach Beschreibung: "device"/"device:<name|index>" → DeviceAudioSource, "synthetic" →
+    SyntheticAudioSource, sonst Dateipfad → FileAudioSource. spec=None: AUDIO_SOURCE, sonst Soundkarte
+    falls ein Eingang existiert, sonst synthetisch. Die Quelle ist bereits gestartet.
+    """
+    spec = (spec if spec is not None else os.environ.get("AUDIO_SOURCE", "")).strip()
+    if not spec:
+        spec = "device" if _default_device_available() else "synthetic"
+    kind, _, arg = spec.partition(":")
+    if kind.lower() == "device":
+        if arg:
+            kwargs.setdefault("device", int(arg) if arg.isdigit() else arg)
+        source: AudioSource = DeviceAudioSource(**kwargs)
+    elif kind.lower() == "synthetic":
+        source = SyntheticAudioSource(**kwargs)
+    else:
+        source = FileAudioSource(spec, **kwargs)
+    source.start()
+    return source
@@ -0,0 +1,369 @@
+"""
+IQ-Quellen für SDR-Labs: Aufnahme-Datei (Memory-Map) oder RTL-SDR-Stick, gleiche Schnittstelle.
+
+Ohne Stick laufen Spektrum- und Demodulationsübungen mit einer Aufnahme; der Lab-Code merkt keinen
+Unterschied (read_available() pro Tick, Blöcke als complex64 im Bereich ±1).
+
+- RecordingSource(path, sample_rate): .cu8 (rtl_sdr), .cs8, .cs16, .cf32 per np.memmap – auch
+  mehrere GB werden nicht geladen, gelesen wird nur der jeweilige Block (cf32: ohne Kopie).
+  Abtastrate/Mittenfrequenz/Format optional aus einer SigMF-Beschreibung (<name>.sigmf-meta).
+  Wiedergabe in Echtzeit (speed=1), beschleunigt (speed=4) oder ungebremst (speed=None);
+  loop=True springt am Ende an den Anfang, seek(sec) positioniert.
+- RtlSdrSource(sample_rate, center_freq): Live-Stick über pyrtlsdr. Ein Hintergrund-Thread liest
+  und puffert (max_buffered_sec); read_available() blockiert den Event-Loop nie, Überläufe werden
+  gezählt (stats["dropped"]). Unter Windows wird rtl-sdr-driver/ (librtlsdr.dll) eingebunden.
+- open_iq_source(spec): "rtlsdr" bzw. "rtlsdr:<index>" oder Dateipfad; ohne spec aus IQ_SOURCE.
+
+Puffer: Ohne out= ist der gelieferte Block eine Sicht auf einen internen Puffer (beim nächsten Aufruf
+überschrieben) bzw. bei cf32 auf die Datei (nur lesen; bleibt auch nach close() gültig).
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Format → (dtype der Rohdaten, Werte pro Sample, Skalierung auf ±1)
+_FORMATS: dict[str, tuple[str, int, float]] = {
+    "cu8": ("u1", 2, 1.0 / 127.5),
+    "cs8": ("i1", 2, 1.0 / 128.0),
+    "cs16": ("<i2", 2, 1.0 / 32768.0),
+    "cf32": ("<c8", 1, 1.0),
+}
+# SigMF core:datatype → Format
+_SIGMF_TYPES = {"cu8": "cu8", "ci8": "cs8", "ci16_le": "cs16", "cf32_le": "cf32"}
+# cu8 → float32 (0…255 → ±1), eine Tabelle für alle Quellen
+_CU8_LUT = ((np.arange(256, dtype=np.float32) - 127.5) / 127.5).astype(np.float32)
+_RTL_DRIVER_DIR = Path(__file__).resolve().parents[2] / "rtl-sdr-driver"
+
+
+def _convert(raw: np.ndarray, fmt: str, out: np.ndarray) -> None:
+    """Rohdaten (verschachtelt I, Q) in complex64 out schreiben (über die float32-Sicht, ohne Zwischenarray)."""
+    flat = out.view(np.float32)
+    if fmt == "cu8":
+        np.take(_CU8_LUT, raw, out=flat)
+    elif fmt == "cf32":
+        out[:] = raw
+    else:
+        np.multiply(raw, _FORMATS[fmt][2], out=flat, casting="unsafe")
+
+
+def _buffer(buf: np.ndarray | None, n: int) -> np.ndarray:
+    if buf is None or len(buf) < n:
+        buf = np.empty(max(n, 1), dtype=np.complex64)
+    return buf
+
+
+def read_sigmf_meta(path: str | Path) -> dict[str, Any]:
+    """SigMF-Beschreibung neben der Aufnahme: {"sample_rate", "center_freq", "format"} (fehlende Werte weggelassen)."""
+    p = Path(path)
+    meta_path = p.with_suffix(".sigmf-meta")
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    out: dict[str, Any] = {}
+    glob = meta.get("global") or {}
+    if "core:sample_rate" in glob:
+        out["sample_rate"] = float(glob["core:sample_rate"])
+    fmt = _SIGMF_TYPES.get(str(glob.get("core:datatype", "")))
+    if fmt:
+        out["format"] = fmt
+    captures = meta.get("captures") or []
+    if captures and "core:frequency" in captures[0]:
+        out["center_freq"] = float(captures[0]["core:frequency"])
+    return out
+
+
+class IqSource(ABC):
+    """Gemeinsame Schnittstelle: read(n), read_available(max_samples), close(); sample_rate, center_freq."""
+
+    sample_rate: float = 0.0
+    center_freq: float = 0.0
+
+    def __init__(self) -> None:
+        self.stats: dict[str, int] = {"samples": 0, "dropped": 0, "loops": 0}
+
+    @abstractmethod
+    def read(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n Samples (complex64)."""
+
+    @abstractmethod
+    def read_available(self, max_samples: int | None = None) -> np.ndarray:
+        """Seit dem letzten Aufruf angefallene Samples; blockiert nicht."""
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "IqSource":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class RecordingSource(IqSource):
+    """IQ-Aufnahme als Memory-Map; liefert Blöcke im Takt der Abtastrate (speed) oder auf Anforderung."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        sample_rate: float | None = None,
+        *,
+        fmt: str | None = None,
+        center_freq: float | None = None,
+        speed: float | None = 1.0,
+        loop: bool = True,
+    ) -> None:
+        super().__init__()
+        self.path = Path(path)
+        meta = read_sigmf_meta(self.path)
+        fmt = fmt or meta.get("format") or self.path.suffix.lstrip(".").lower()
+        if fmt not in _FORMATS:
+            raise ValueError(f"RecordingSource: unbekanntes Format {fmt!r} ({'|'.join(_FORMATS)})")
+        rate = sample_rate or meta.get("sample_rate")
+        if not rate:
+            raise ValueError("RecordingSource: sample_rate fehlt (Argument oder .sigmf-meta)")
+        self.format = fmt
+        self.sample_rate = float(rate)
+        self.center_freq = float(center_freq if center_freq is not None else meta.get("center_freq", 0.0))
+        self.speed = speed
+        self.loop = loop
+        raw_dtype, self._per_sample, _ = _FORMATS[fmt]
+        self._raw = np.memmap(self.path, dtype=raw_dtype, mode="r")
+        self.length = len(self._raw) // self._per_sample  # Samples
+        self._pos = 0
+        self._out: np.ndarray | None = None
+        self._clock: float | None = None
+        self._due = 0.0  # Sample-Bruchteil aus dem Echtzeittakt
+
+    @property
+    def duration_sec(self) -> float:
+        return self.length / self.sample_rate
+
+    def tell(self) -> float:
+        """Position in Sekunden."""
+        return self._pos / self.sample_rate
+
+    def seek(self, seconds: float) -> None:
+        """Auf Zeitpunkt springen (mit loop modulo Länge, sonst begrenzt)."""
+        pos = int(round(seconds * self.sample_rate))
+        self._pos = pos % self.length if self.loop and self.length else min(max(pos, 0), self.length)
+        self._clock = None
+
+    def _raw_slice(self, start: int, count: int) -> np.ndarray:
+        per = self._per_sample
+        return self._raw[start * per:(start + count) * per]
+
+    def read(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n Samples ab der aktuellen Position (mit loop ggf. über das Dateiende; ohne loop kürzer)."""
+        n = max(0, int(n))
+        if not self.length:
+            return np.empty(0, dtype=np.complex64)
+        first = min(n, self.length - self._pos)
+        if first == n and out is None and self.format == "cf32":
+            # Ohne Kopie: Sicht auf die Datei
+            block = self._raw[self._pos:self._pos + n]
+            self._pos += n
+            self.stats["samples"] += n
+            return block
+        if out is None:
+            self._out = _buffer(self._out, n)
+            out = self._out
+        done = 0
+        while done < n:
+            count = min(n - done, self.length - self._pos)
+            if count <= 0:
+                if not self.loop:
+                    break
+                self._pos = 0
+                self.stats["loops"] += 1
+                continue
+            _convert(self._raw_slice(self._pos, count), self.format, out[done:done + count])
+            self._pos += count
+            done += count
+        if self.loop and self._pos >= self.length:
+            self._pos = 0
+            self.stats["loops"] += 1
+        self.stats["samples"] += done
+        return out[:done]
+
+    def read_available(self, max_samples: int | None = None) -> np.ndarray:
+        """
+        Samples seit dem letzten Aufruf (Wanduhr × speed × Abtastrate); speed=None: max_samples.
+        Mehr als max_samples fällig: die ältesten werden übersprungen (stats["dropped"]), wie ein Überlauf.
+        """
+        if self.speed is None:
+            return self.read(max_samples or int(self.sample_rate * 0.1))
+        now = time.monotonic()
+        if self._clock is None:
+            self._clock = now
+            return np.empty(0, dtype=np.complex64)
+        self._due += (now - self._clock) * self.sample_rate * self.speed
+        self._clock = now
+        n = int(self._due)
+        self._due -= n
+        if max_samples is not None and n > max_samples:
+            skip = n - max_samples
+            self.stats["dropped"] += skip
+            self._skip(skip)
+            n = max_samples
+        return self.read(n)
+
+    def _skip(self, n: int) -> None:
+        if self.loop and self.length:
+            self.stats["loops"] += (self._pos + n) // self.length
+            self._pos = (self._pos + n) % self.length
+        else:
+            self._pos = min(self.length, self._pos + n)
+
+    def close(self) -> None:
+        # Memory-Map nicht selbst schließen: gelieferte cf32-Blöcke sind Sichten darauf und halten
+        # sie am Leben; freigegeben wird sie mit dem letzten Verweis.
+        self._raw = np.empty(0, dtype=self._raw.dtype)
+        self.length = 0
+        self._pos = 0
+
+
+def _prepare_rtlsdr_driver() -> None:
+    """Windows: mitgelieferte librtlsdr.dll/libusb-1.0.dll (rtl-sdr-driver/) für pyrtlsdr auffindbar machen."""
+    if sys.platform != "win32" or not _RTL_DRIVER_DIR.is_dir():
+        return
+    path = str(_RTL_DRIVER_DIR)
+    if hasattr(os, "add_dll_directory"):
+        os.add_dll_directory(path)
+    if path not in os.environ.get("PATH", ""):
+        os.environ["PATH"] = path + os.pathsep + os.environ.get("PATH", "")
+
+
+class RtlSdrSource(IqSource):
+    """Live-RTL-SDR: Hintergrund-Thread liest Rohblöcke (cu8) in einen begrenzten Puffer."""
+
+    def __init__(
+        self,
+        sample_rate: float = 2.048e6,
+        center_freq: float = 100e6,
+        *,
+        gain: float | str = "auto",
+        device_index: int = 0,
+        block_size: int = 256 * 1024,
+        max_buffered_sec: float = 1.0,
+    ) -> None:
+        super().__init__()
+        _prepare_rtlsdr_driver()
+        from rtlsdr import RtlSdr
+
+        self._sdr = RtlSdr(device_index)
+        self._sdr.sample_rate = sample_rate
+        self._sdr.center_freq = center_freq
+        self._sdr.gain = gain
+        self.sample_rate = float(self._sdr.sample_rate)
+        self.center_freq = float(self._sdr.center_freq)
+        self._block_size = int(block_size)
+        self._max_buffered = int(max_buffered_sec * self.sample_rate)
+        self._blocks: deque[np.ndarray] = deque()  # Rohblöcke cu8, älteste zuerst
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self._data_ready = threading.Condition(self._lock)
+        self._running = True
+        self._out: np.ndarray | None = None
+        self._thread = threading.Thread(target=self._reader, name="rtlsdr-reader", daemon=True)
+        self._thread.start()
+
+    def set_center_freq(self, freq: float) -> None:
+        self._sdr.center_freq = freq
+        self.center_freq = float(self._sdr.center_freq)
+
+    def _reader(self) -> None:
+        while self._running:
+            try:
+                raw = np.frombuffer(self._sdr.read_bytes(2 * self._block_size), dtype=np.uint8)
+            except Exception:
+                if self._running:
+                    time.sleep(0.05)
+                continue
+            with self._lock:
+                self._blocks.append(raw)
+                self._buffered += len(raw) // 2
+                while self._buffered > self._max_buffered and len(self._blocks) > 1:
+                    dropped = self._blocks.popleft()
+                    self._buffered -= len(dropped) // 2
+                    self.stats["dropped"] += len(dropped) // 2
+                self._data_ready.notify_all()
+
+    def _take(self, n: int, out: np.ndarray) -> int:
+        """Bis zu n gepufferte Samples nach out (Lock gehalten); Rest eines Blocks bleibt vorn."""
+        done = 0
+        while done < n and self._blocks:
+            raw = self._blocks[0]
+            count = min(n - done, len(raw) // 2)
+            _convert(raw[:2 * count], "cu8", out[done:done + count])
+            done += count
+            if count * 2 < len(raw):
+                self._blocks[0] = raw[2 * count:]
+            else:
+                self._blocks.popleft()
+        self._buffered -= done
+        self.stats["samples"] += done
+        return done
+
+    def read(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n Samples; wartet, bis sie da sind (nicht im Event-Loop aufrufen – dort read_available)."""
+        if out is None:
+            self._out = _buffer(self._out, n)
+            out = self._out
+        done = 0
+        with self._data_ready:
+            while done < n and self._running:
+                done += self._take(n - done, out[done:])
+                if done < n:
+                    self._data_ready.wait(timeout=1.0)
+        return out[:done]
+
+    def read_available(self, max_samples: int | None = None) -> np.ndarray:
+        """Alles Gepufferte (höchstens max_samples, ältere werden verworfen); blockiert nicht."""
+        if max_samples is not None and max_samples <= 0:
+            return np.empty(0, dtype=np.complex64)
+        with self._lock:
+            n = self._buffered
+            if max_samples is not None and n > max_samples:
+                # Ganze alte Blöcke verwerfen, solange danach noch max_samples übrig sind
+                while self._buffered - len(self._blocks[0]) // 2 >= max_samples:
+                    dropped = self._blocks.popleft()
+                    self._buffered -= len(dropped) // 2
+                    self.stats["dropped"] += len(dropped) // 2
+                n = min(self._buffered, max_samples)
+            self._out = _buffer(self._out, n)
+            done = self._take(n, self._out)
+        return self._out[:done]
+
+    def close(self) -> None:
+        self._running = False
+        try:
+            self._sdr.cancel_read_async()
+        except Exception:
+            pass
+        self._thread.join(timeout=2.0)
+        self._sdr.close()
+
+
+def open_iq_source(spec: str | None = None, **kwargs: Any) -> IqSource:
+    """
+    Quelle nach Beschreibung: "rtlsdr" / "rtlsdr:<index>" → RtlSdrSource, sonst Dateipfad → RecordingSource.
+    spec=None: Umgebungsvariable IQ_SOURCE. kwargs gehen an den Konstruktor (z. B. sample_rate, center_freq).
+    """
+    spec = (spec if spec is not None else os.environ.get("IQ_SOURCE", "")).strip()
+    if not spec:
+        raise ValueError("open_iq_source: keine Quelle angegeben (Argument oder IQ_SOURCE)")
+    if spec.lower().startswith("rtlsdr"):
+        _, _, index = spec.partition(":")
+        return RtlSdrSource(device_index=int(index or 0), **kwargs)
+    return RecordingSource(spec, **kwargs)
@@ -0,0 +1,207 @@
+"""
+Getriggertes Oszilloskop über fortlaufende Blöcke (Flanke, Pegel, Hysterese, Pre-Trigger, Hold-off).
+
+Ohne Trigger zeigt jeder Tick einfach den aktuellen Puffer – periodische Signale "laufen" über den
+Schirm. TriggerScope sucht in den ankommenden Blöcken die Trigger-Flanke und liefert Aufnahmen
+(Capture) fester Länge, deren Trigger-Zeitpunkt immer bei t = 0 liegt (stehendes Bild).
+
+- Flanke: slope="rising"|"falling" durch level. Hysterese: vor einer steigenden Flanke muss das
+  Signal unter level - hysteresis gewesen sein (Rauschen löst nicht mehrfach aus).
+- pre_trigger: Anteil der Aufnahme vor dem Trigger (0…1). Die Trigger-Zeit wird zwischen zwei
+  Samples linear interpoliert (x0 der Aufnahme), das Bild zittert nicht um ±1 Sample.
+- holdoff_sec: nach einer Aufnahme frühestens so viel später wieder triggern (zusätzlich zur
+  Aufnahmelänge nach dem Trigger).
+- mode: "auto" (ohne Trigger nach auto_timeout_sec eine freilaufende Aufnahme), "normal" (nur
+  getriggert, Anzeige hält das letzte Bild), "single" (eine Aufnahme, dann arm() zum Neustart).
+
+Vektorisiert: Flankensuche mit NumPy über den ganzen Block (Zustand der Hysterese wird über
+Blockgrenzen mitgeführt); Python-Schleifen laufen nur über angenommene Trigger, nicht über Samples.
+push() liefert die neueste Aufnahme des Blocks (eine pro Tick genügt für die Anzeige).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+_SLOPES = ("rising", "falling")
+_MODES = ("auto", "normal", "single")
+
+
+@dataclass(frozen=True)
+class Capture:
+    """Eine Aufnahme: record_len Samples, Zeitachse relativ zum Trigger (t = x0 + i·dx, Trigger bei 0)."""
+    samples: np.ndarray
+    x0: float  # Zeit des ersten Samples in s (negativ bei Pre-Trigger)
+    dx: float  # 1 / fs
+    triggered: bool  # False: freilaufende Auto-Aufnahme
+    sample_index: int  # Trigger-Sample (bzw. erstes Sample bei Auto) seit Start, für Raten/Abstände
+
+    def trace(self, time_scale: float = 1.0, **extra: Any) -> dict[str, Any]:
+        """Trace für update_plot mit impliziter Zeitachse; time_scale=1e3 → Achse in ms."""
+        return {"x0": self.x0 * time_scale, "dx": self.dx * time_scale, "y": self.samples, "mode": "lines", **extra}
+
+
+class TriggerScope:
+    """Trigger-Stufe für Zeitbereichsplots: push(block) pro Tick, Capture bei Trigger (bzw. Auto)."""
+
+    def __init__(
+        self,
+        fs: float,
+        record_len: int,
+        *,
+        level: float = 0.0,
+        slope: str = "rising",
+        hysteresis: float = 0.0,
+        pre_trigger: float = 0.25,
+        holdoff_sec: float = 0.0,
+        mode: str = "auto",
+        auto_timeout_sec: float = 0.1,
+    ) -> None:
+        self.fs = float(fs)
+        self.stats: dict[str, int] = {"triggers": 0, "captures": 0, "auto_captures": 0}
+        self._settings: dict[str, Any] = {}
+        self.configure(
+            record_len=record_len,
+            level=level,
+            slope=slope,
+            hysteresis=hysteresis,
+            pre_trigger=pre_trigger,
+            holdoff_sec=holdoff_sec,
+            mode=mode,
+            auto_timeout_sec=auto_timeout_sec,
+        )
+
+    def configure(self, **settings: Any) -> None:
+        """
+        Einstellungen ändern (record_len, level, slope, hysteresis, pre_trigger, holdoff_sec, mode,
+        auto_timeout_sec). Pegel/Flanke wirken ab dem nächsten Block; record_len und pre_trigger
+        setzen den Puffer zurück.
+        """
+        s = {**self._settings, **settings}
+        if s["slope"] not in _SLOPES:
+            raise ValueError(f"TriggerScope: slope muss {'|'.join(_SLOPES)} sein")
+        if s["mode"] not in _MODES:
+            raise ValueError(f"TriggerScope: mode muss {'|'.join(_MODES)} sein")
+        if int(s["record_len"]) < 2:
+            raise ValueError("TriggerScope: record_len muss ≥ 2 sein")
+        reset = not self._settings or any(
+            s[k] != self._settings.get(k) for k in ("record_len", "pre_trigger", "slope")
+        )
+        self._settings = s
+        self.record_len = int(s["record_len"])
+        self.pre = min(self.record_len - 1, max(0, int(round(float(s["pre_trigger"]) * self.record_len))))
+        self.level = float(s["level"])
+        self.slope = s["slope"]
+        self.hysteresis = abs(float(s["hysteresis"]))
+        self.holdoff = max(0, int(round(float(s["holdoff_sec"]) * self.fs)))
+        self.mode = s["mode"]
+        self.auto_timeout = max(1, int(round(float(s["auto_timeout_sec"]) * self.fs)))
+        if reset:
+            self.reset()
+        self.armed = True
+
+    def reset(self) -> None:
+        """Puffer und Trigger-Zustand verwerfen."""
+        self._tail: np.ndarray | None = None
+        self._tail_start = 0  # Sample-Index von _tail[0] seit Start
+        self._next_search = 0  # ab hier wurde noch nicht nach Flanken gesucht
+        self._rearm = 0  # frühester nächster Trigger (Aufnahmelänge + Hold-off)
+        self._edge_state = 0  # letzter Hysterese-Zustand: -1 unter, +1 über der Schwelle, 0 unbekannt
+        self._last_output = 0  # Sample-Index der letzten ausgegebenen Aufnahme (für Auto-Timeout)
+        self.armed = True
+
+    def arm(self) -> None:
+        """Single-Modus: für die nächste Aufnahme scharf schalten."""
+        self.armed = True
+
+    def _find_edges(self, seg: np.ndarray) -> np.ndarray:
+        """Indizes (in seg) der Flanken mit Hysterese; _edge_state wird fortgeschrieben."""
+        if self.slope == "rising":
+            over = seg >= self.level
+            under = seg < self.level - self.hysteresis if self.hysteresis else ~over
+        else:
+            over = seg <= self.level
+            under = seg > self.level + self.hysteresis if self.hysteresis else ~over
+        # Zustand pro Sample: +1 über, -1 unter der Schwelle, 0 im Hysterese-Band
+        state = over.astype(np.int8) - under.astype(np.int8)
+        n = len(seg)
+        # Letzter Index mit Zustand ≠ 0 bis einschließlich k (−1: keiner im Block)
+        last = np.maximum.accumulate(np.where(state != 0, np.arange(n), -1))
+        prev = np.empty(n, dtype=np.int8)
+        prev[0] = self._edge_state
+        if n > 1:
+            before = last[:-1]
+            prev[1:] = np.where(before >= 0, state[np.maximum(before, 0)], self._edge_state)
+        if n and last[-1] >= 0:
+            self._edge_state = int(state[last[-1]])
+        return np.flatnonzero((state == 1) & (prev == -1))
+
+    def push(self, samples: Any) -> Capture | None:
+        """Block anhängen und auswerten; Rückgabe: neueste Aufnahme dieses Blocks oder None."""
+        x = np.asarray(samples)
+        if x.ndim != 1 or np.iscomplexobj(x):
+            raise ValueError("TriggerScope.push: reeller 1D-Block erwartet")
+        hist = x if self._tail is None or not len(self._tail) else np.concatenate((self._tail, x))
+        start = self._tail_start
+        end = start + len(hist)
+        post = self.record_len - self.pre
+        capture = None
+        # Flanken bei i brauchen x[i-1] (Interpolation) und post Samples ab i
+        s0 = max(self._next_search, start + 1)
+        s1 = end - post + 1
+        if s1 > s0:
+            edges = self._find_edges(hist[s0 - start:s1 - start]) + s0
+            self._next_search = s1
+            edges = edges[edges >= max(self._rearm, start + self.pre)]
+            if self.armed and len(edges):
+                capture = self._accept(hist, start, edges)
+        if capture is None and self.mode == "auto" and self.armed and len(hist) >= self.record_len:
+            if end - self._last_output >= self.auto_timeout:
+                first = end - self.record_len
+                capture = Capture(
+                    samples=hist[first - start:].copy(),
+                    x0=-self.pre / self.fs,
+                    dx=1.0 / self.fs,
+                    triggered=False,
+                    sample_index=first,
+                )
+                self._last_output = end
+                self.stats["auto_captures"] += 1
+        # Rest aufheben: Pre-Trigger für die weitere Suche bzw. eine ganze Aufnahme für Auto
+        keep = max(start, min(self._next_search - self.pre - 1, end - self.record_len))
+        self._tail = hist[keep - start:].copy()
+        self._tail_start = keep
+        return capture
+
+    def _accept(self, hist: np.ndarray, start: int, edges: np.ndarray) -> Capture:
+        """Trigger der Reihe nach annehmen (Aufnahme + Hold-off sperrt); Aufnahme zum letzten."""
+        post = self.record_len - self.pre
+        dead = post + self.holdoff
+        pos = 0
+        while True:
+            i = int(edges[pos])
+            self.stats["triggers"] += 1
+            if self.mode == "single":
+                self.armed = False
+                break
+            pos = int(np.searchsorted(edges, i + dead, side="left"))
+            if pos >= len(edges):
+                break
+        self._rearm = i + dead
+        self._last_output = i + post
+        first = i - self.pre - start
+        samples = hist[first:first + self.record_len].copy()
+        # Schwellendurchgang zwischen i-1 und i interpolieren
+        a, b = float(hist[i - 1 - start]), float(hist[i - start])
+        frac = (self.level - a) / (b - a) if b != a else 1.0
+        frac = min(1.0, max(0.0, frac))
+        self.stats["captures"] += 1
+        return Capture(
+            samples=samples,
+            x0=(1.0 - frac - self.pre) / self.fs,
+            dx=1.0 / self.fs,
+            triggered=True,
+            sample_index=i,
+        )
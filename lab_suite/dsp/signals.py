@@ -0,0 +1,311 @@
+"""
+Signalquellen für Timer-getriebene Labs – vektorisiert (NumPy), mit wiederverwendeten Puffern.
+
+Gedacht für timer_tick(): pro Tick einen Block von n Samples erzeugen, die Phase läuft über die
+Ticks stetig weiter (kein Sprung an Blockgrenzen). Keine Python-Schleifen pro Sample.
+
+- Nco(fs, freq): numerisch gesteuerter Oszillator – sine/cosine/iq (komplex) sowie am/fm/pm
+  mit einem Nachrichtensignal (Träger = Nco). Phase und Frequenz bleiben zwischen Aufrufen erhalten.
+- SymbolSource(scheme, order, sps): zufällige ASK/PSK/QAM-Symbole (Rechteckimpuls, sps Samples pro
+  Symbol) als komplexes Basisband; ein Symbol darf über eine Blockgrenze laufen.
+- awgn(x, snr_db): weißes Gaußsches Rauschen zum Signal addieren (SNR in dB bezogen auf die
+  gemessene oder angegebene Signalleistung); noise(n, sigma): nur das Rauschen.
+
+Puffer: Ohne out= liefern die Methoden eine Sicht auf einen internen Puffer, der beim nächsten Aufruf
+überschrieben wird (keine Allokation pro Tick). Wer den Block aufheben will, kopiert ihn oder übergibt
+ein eigenes out=.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+_TWO_PI = 2.0 * math.pi
+# Gemeinsamer Zufallsgenerator (awgn/noise/SymbolSource ohne eigenen rng)
+_RNG_REF: list = [None]
+# Hilfspuffer für Rauschen: dtype → Array (wächst bei Bedarf)
+_SCRATCH: dict[Any, np.ndarray] = {}
+
+
+def _rng(rng: np.random.Generator | None) -> np.random.Generator:
+    if rng is not None:
+        return rng
+    if _RNG_REF[0] is None:
+        _RNG_REF[0] = np.random.default_rng()
+    return _RNG_REF[0]
+
+
+def seed(value: int | None) -> None:
+    """Gemeinsamen Zufallsgenerator neu setzen (reproduzierbare Übungen)."""
+    _RNG_REF[0] = np.random.default_rng(value)
+
+
+def _buffer(buf: np.ndarray | None, n: int, dtype: Any) -> np.ndarray:
+    """Puffer mit mindestens n Elementen (wächst nur, schrumpft nie); Sicht auf die ersten n."""
+    if buf is None or len(buf) < n or buf.dtype != np.dtype(dtype):
+        buf = np.empty(max(n, 1), dtype=dtype)
+    return buf
+
+
+class Nco:
+    """
+    Phasenstetiger Oszillator: Phase(k) = phase + 2π·freq/fs·k, nach jedem Block fortgeschrieben.
+    dtype: float64 (Default) oder float32 für die reellen Ausgaben (komplex: complex64/complex128).
+    """
+
+    def __init__(
+        self,
+        fs: float,
+        freq: float,
+        *,
+        phase: float = 0.0,
+        amplitude: float = 1.0,
+        dtype: Any = np.float64,
+    ) -> None:
+        self.fs = float(fs)
+        self.freq = float(freq)
+        self.phase = float(phase) % _TWO_PI
+        self.amplitude = float(amplitude)
+        self._dtype = np.dtype(dtype)
+        self._ramp: np.ndarray | None = None  # k·Δφ für k = 0…n-1 (gecacht pro n und freq)
+        self._ramp_key: tuple[int, float] | None = None
+        self._phases: np.ndarray | None = None
+        self._out: np.ndarray | None = None
+        self._out_iq: np.ndarray | None = None
+
+    def set_freq(self, freq: float) -> None:
+        """Frequenz ändern; die Phase läuft stetig weiter (kein Sprung)."""
+        self.freq = float(freq)
+
+    def reset(self, phase: float = 0.0) -> None:
+        self.phase = float(phase) % _TWO_PI
+
+    def advance(self, n: int) -> None:
+        """Phase um n Samples weiterdrehen, ohne sie zu erzeugen (übersprungene Blöcke)."""
+        self.phase = (self.phase + int(n) * self._step) % _TWO_PI
+
+    @property
+    def _step(self) -> float:
+        return _TWO_PI * self.freq / self.fs
+
+    def _advance(self, n: int) -> np.ndarray:
+        """Phasen des nächsten Blocks (float64, interner Puffer) und Phase fortschreiben."""
+        step = self._step
+        if self._ramp_key != (n, step):
+            self._ramp = np.arange(n, dtype=np.float64) * step
+            self._ramp_key = (n, step)
+        self._phases = _buffer(self._phases, n, np.float64)
+        phases = self._phases[:n]
+        np.add(self._ramp, self.phase, out=phases)
+        self.phase = (self.phase + n * step) % _TWO_PI
+        return phases
+
+    def _real_out(self, n: int, out: np.ndarray | None) -> np.ndarray:
+        if out is not None:
+            return out[:n]
+        self._out = _buffer(self._out, n, self._dtype)
+        return self._out[:n]
+
+    def _scale(self, out: np.ndarray) -> np.ndarray:
+        if self.amplitude != 1.0:
+            out *= self.amplitude
+        return out
+
+    def sine(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n Samples amplitude·sin(φ)."""
+        out = self._real_out(n, out)
+        np.sin(self._advance(n), out=out, casting="same_kind")
+        return self._scale(out)
+
+    def cosine(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n Samples amplitude·cos(φ)."""
+        out = self._real_out(n, out)
+        np.cos(self._advance(n), out=out, casting="same_kind")
+        return self._scale(out)
+
+    def iq(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n komplexe Samples amplitude·exp(jφ) (analytisches Signal, z. B. für Mischer/SDR)."""
+        ctype = np.complex64 if self._dtype == np.float32 else np.complex128
+        if out is None:
+            self._out_iq = _buffer(self._out_iq, n, ctype)
+            out = self._out_iq
+        out = out[:n]
+        phases = self._advance(n)
+        np.cos(phases, out=out.real, casting="same_kind")
+        np.sin(phases, out=out.imag, casting="same_kind")
+        return self._scale(out)
+
+    def am(self, message: np.ndarray, depth: float = 0.5, out: np.ndarray | None = None) -> np.ndarray:
+        """Amplitudenmodulation: amplitude·(1 + depth·m)·cos(φ); m typisch in [-1, 1]."""
+        n = len(message)
+        out = self.cosine(n, out)
+        out *= 1.0 + depth * np.asarray(message)
+        return out
+
+    def pm(self, message: np.ndarray, index_rad: float = 1.0, out: np.ndarray | None = None) -> np.ndarray:
+        """Phasenmodulation: amplitude·cos(φ + index_rad·m)."""
+        n = len(message)
+        phases = self._advance(n)
+        phases += index_rad * np.asarray(message)
+        out = self._real_out(n, out)
+        np.cos(phases, out=out, casting="same_kind")
+        return self._scale(out)
+
+    def fm(self, message: np.ndarray, deviation_hz: float, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Frequenzmodulation: Momentanfrequenz freq + deviation_hz·m; die Phase wird aufintegriert
+        (cumsum) und über Blockgrenzen fortgeschrieben.
+        """
+        n = len(message)
+        self._phases = _buffer(self._phases, n, np.float64)
+        phases = self._phases[:n]
+        # Δφ(k) pro Sample; φ(k) = phase + Σ_{i<k} Δφ(i)
+        np.multiply(np.asarray(message), _TWO_PI * deviation_hz / self.fs, out=phases, casting="unsafe")
+        phases += self._step
+        np.cumsum(phases, out=phases)
+        end = self.phase + (float(phases[-1]) if n else 0.0)
+        phases[1:] = phases[:-1]
+        if n:
+            phases[0] = 0.0
+        phases += self.phase
+        out = self._real_out(n, out)
+        np.cos(phases, out=out, casting="same_kind")
+        self.phase = end % _TWO_PI
+        return self._scale(out)
+
+
+def constellation(scheme: str, order: int) -> np.ndarray:
+    """Symbolalphabet (komplex, mittlere Leistung 1) für ask|psk|qam mit order Symbolen."""
+    scheme = scheme.lower()
+    order = int(order)
+    if order < 2:
+        raise ValueError("constellation: order muss ≥ 2 sein")
+    if scheme == "ask":
+        points = np.arange(order, dtype=np.float64).astype(np.complex128)
+    elif scheme == "psk":
+        points = np.exp(1j * _TWO_PI * np.arange(order) / order)
+    elif scheme == "qam":
+        side = int(round(math.sqrt(order)))
+        if side * side != order:
+            raise ValueError("constellation: QAM braucht eine Quadratzahl als order (4, 16, 64, …)")
+        levels = np.arange(side) * 2.0 - (side - 1)
+        points = (levels[None, :] + 1j * levels[:, None]).ravel()
+    else:
+        raise ValueError(f"constellation: unbekanntes Verfahren {scheme!r} (ask|psk|qam)")
+    power = float(np.mean(np.abs(points) ** 2))
+    return points / math.sqrt(power) if power > 0 else points
+
+
+class SymbolSource:
+    """
+    Zufällige Symbolfolge als komplexes Basisband, sps Samples pro Symbol (Rechteckimpuls).
+    block(n) setzt ein angefangenes Symbol im nächsten Block fort; symbols enthält die Symbolindizes
+    des letzten Blocks (für Fehlerraten-Vergleiche).
+    """
+
+    def __init__(
+        self,
+        scheme: str = "psk",
+        order: int = 4,
+        sps: int = 8,
+        *,
+        rng: np.random.Generator | None = None,
+        dtype: Any = np.complex128,
+    ) -> None:
+        if sps < 1:
+            raise ValueError("SymbolSource: sps muss ≥ 1 sein")
+        self.points = constellation(scheme, order).astype(dtype)
+        self.sps = int(sps)
+        self._rng = rng
+        self._dtype = np.dtype(dtype)
+        self._current = 0  # Index des laufenden Symbols
+        self._remaining = 0  # noch offene Samples des laufenden Symbols
+        self._out: np.ndarray | None = None
+        self._scratch: np.ndarray | None = None
+        self.symbols = np.empty(0, dtype=np.int64)
+
+    def block(self, n: int, out: np.ndarray | None = None) -> np.ndarray:
+        """n komplexe Samples."""
+        if out is None:
+            self._out = _buffer(self._out, n, self._dtype)
+            out = self._out
+        out = out[:n]
+        head = min(self._remaining, n)
+        out[:head] = self.points[self._current]
+        self._remaining -= head
+        rest = n - head
+        if rest <= 0:
+            self.symbols = np.empty(0, dtype=np.int64)
+            return out
+        count = -(-rest // self.sps)  # ceil
+        self.symbols = _rng(self._rng).integers(0, len(self.points), size=count)
+        # Symbole × sps in einen Hilfspuffer, dann die benötigten Samples übernehmen
+        self._scratch = _buffer(self._scratch, count * self.sps, self._dtype)
+        frame = self._scratch[:count * self.sps].reshape(count, self.sps)
+        frame[:] = self.points[self.symbols][:, None]
+        out[head:] = self._scratch[:rest]
+        self._current = int(self.symbols[-1])
+        self._remaining = count * self.sps - rest
+        return out
+
+
+def _standard_normal(n: int, real_dtype: Any, complex_: bool, rng: np.random.Generator | None) -> np.ndarray:
+    """Standardnormalverteilte Werte im Hilfspuffer (komplex: Sicht auf 2n reelle Werte, Leistung 2)."""
+    real_dtype = np.dtype(real_dtype)
+    size = 2 * n if complex_ else n
+    buf = _buffer(_SCRATCH.get(real_dtype), size, real_dtype)
+    _SCRATCH[real_dtype] = buf
+    z = buf[:size]
+    _rng(rng).standard_normal(out=z, dtype=real_dtype)
+    return z.view(np.complex64 if real_dtype == np.float32 else np.complex128) if complex_ else z
+
+
+def noise(
+    n: int,
+    sigma: float,
+    *,
+    complex_: bool = False,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Gaußsches Rauschen mit Standardabweichung sigma (komplex: sigma gesamt, je Komponente sigma/√2)."""
+    if out is None:
+        out = np.empty(n, dtype=np.complex128 if complex_ else np.float64)
+    out = out[:n]
+    complex_ = np.iscomplexobj(out)
+    real_dtype = np.float32 if out.dtype in (np.float32, np.complex64) else np.float64
+    z = _standard_normal(n, real_dtype, complex_, rng)
+    np.multiply(z, sigma / math.sqrt(2.0) if complex_ else sigma, out=out, casting="unsafe")
+    return out
+
+
+def awgn(
+    x: np.ndarray,
+    snr_db: float,
+    *,
+    signal_power: float | None = None,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    x + Rauschen mit SNR snr_db. signal_power=None: mittlere Leistung von x messen.
+    out=x addiert in place (keine Kopie, keine Allokation).
+    """
+    x = np.asarray(x)
+    n = len(x)
+    if signal_power is None:
+        signal_power = float(np.vdot(x, x).real) / n if n else 0.0
+    sigma = math.sqrt(signal_power / (10.0 ** (snr_db / 10.0)))
+    if out is None:
+        out = np.array(x, dtype=np.result_type(x.dtype, np.float32))
+    elif out is not x:
+        out[:n] = x
+    out = out[:n]
+    complex_ = np.iscomplexobj(out)
+    real_dtype = np.float32 if out.dtype in (np.float32, np.complex64) else np.float64
+    z = _standard_normal(n, real_dtype, complex_, rng)
+    z *= sigma / math.sqrt(2.0) if complex_ else sigma
+    out += z
+    return out
@@ -0,0 +1,285 @@
+"""
+Streaming-Spektrumanalysator für Live-Labs (Welch-Segmente über fortlaufende Blöcke).
+
+SpectrumAnalyzer(fs, rbw_hz, span_hz, window, averaging) nimmt pro Tick einen Block Samples (reell
+oder komplex) an und liefert dB-Werte pro Frequenz-Bin, direkt für gui_binding.update_plot
+(trace() mit impliziter x-Achse x0/dx, siehe PlotlyGraph).
+
+- FFT-Länge aus der Auflösebandbreite: nfft = nächste Zweierpotenz ≥ ENBW(Fenster) · fs / rbw_hz;
+  rbw_hz des Objekts ist danach die tatsächliche RBW.
+- Welch: überlappende Segmente (overlap, Default 50 %) werden blockübergreifend gebildet; ein Rest
+  wartet auf den nächsten push(). Alle Segmente eines Blocks gehen in einem FFT-Aufruf durch
+  (scipy.fft mit workers, sonst numpy.fft).
+- Mittelung: "linear" (Mittel über avg_count Segmente, danach gleitend), "exponential"
+  (Faktor 1/avg_count pro Segment), "max_hold", "off" (Mittel nur über den letzten Block).
+- Fenster, Frequenzachse und Bin-Auswahl (Span um center_hz) werden pro Konfiguration einmal
+  berechnet (Fenster modulweit gecacht).
+- max_segments: höchstens so viele Segmente pro push() auswerten (die neuesten); bei sehr hohen
+  Raten bleibt die Rechenzeit pro Tick begrenzt (Lücken wie bei einem Hardware-Analysator).
+
+Pegel: 10·log10 der Leistung pro Bin; ein reeller Sinus mit Amplitude A ergibt 10·log10(A²/2) dB.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Cosinus-Summen-Fenster: Koeffizienten a_k in w(n) = Σ (-1)^k a_k cos(2πkn/N) (periodisch)
+_WINDOW_COEFFS = {
+    "rect": (1.0,),
+    "hann": (0.5, 0.5),
+    "hamming": (0.54, 0.46),
+    "blackman": (0.42, 0.5, 0.08),
+    "blackmanharris": (0.35875, 0.48829, 0.14128, 0.01168),
+    "flattop": (0.21557895, 0.41663158, 0.277263158, 0.083578947, 0.006947368),
+}
+_AVERAGING_MODES = ("linear", "exponential", "max_hold", "off")
+# (Fenstername, Länge, dtype) → Fenster
+_WINDOW_CACHE: dict[tuple[str, int, str], np.ndarray] = {}
+# Untergrenze der Leistung vor log10 (-300 dB)
+_POWER_FLOOR = 1e-30
+
+
+def window(name: str, n: int, dtype: Any = np.float64) -> np.ndarray:
+    """Periodisches Fenster der Länge n (gecacht, nicht verändern)."""
+    key = (name, int(n), np.dtype(dtype).str)
+    cached = _WINDOW_CACHE.get(key)
+    if cached is not None:
+        return cached
+    coeffs = _WINDOW_COEFFS.get(name)
+    if coeffs is None:
+        raise ValueError(f"window: unbekanntes Fenster {name!r} ({'|'.join(_WINDOW_COEFFS)})")
+    phase = 2.0 * math.pi * np.arange(n) / n
+    w = np.zeros(n)
+    for k, a in enumerate(coeffs):
+        w += (-1) ** k * a * np.cos(k * phase)
+    w = w.astype(dtype)
+    w.flags.writeable = False
+    _WINDOW_CACHE[key] = w
+    return w
+
+
+def enbw_bins(name: str) -> float:
+    """Äquivalente Rauschbandbreite des Fensters in Bins (rect 1,0; hann 1,5; flattop ≈ 3,77)."""
+    w = window(name, 4096)
+    return float(len(w) * np.sum(w * w) / np.sum(w) ** 2)
+
+
+def _fft_backend() -> tuple[Any, bool]:
+    """(Modul mit fft/rfft, unterstützt workers) – scipy.fft bevorzugt (float32 nativ, Threads)."""
+    try:
+        import scipy.fft as fft
+        return fft, True
+    except ImportError:
+        return np.fft, False
+
+
+class SpectrumAnalyzer:
+    """Fortlaufende Spektrumanalyse: push(block) pro Tick, spectrum_db() bzw. trace() zum Anzeigen."""
+
+    def __init__(
+        self,
+        fs: float,
+        *,
+        rbw_hz: float | None = None,
+        nfft: int | None = None,
+        span_hz: float | None = None,
+        center_hz: float = 0.0,
+        window: str = "hann",
+        averaging: str = "exponential",
+        avg_count: int = 10,
+        overlap: float = 0.5,
+        max_segments: int | None = None,
+        workers: int = -1,
+    ) -> None:
+        self.fs = float(fs)
+        self.workers = workers
+        self.max_segments = max_segments
+        self._fft, self._fft_workers = _fft_backend()
+        self.stats: dict[str, int] = {"segments": 0, "skipped_segments": 0, "pushes": 0}
+        self.configure(
+            rbw_hz=rbw_hz,
+            nfft=nfft,
+            span_hz=span_hz,
+            center_hz=center_hz,
+            window=window,
+            averaging=averaging,
+            avg_count=avg_count,
+            overlap=overlap,
+        )
+
+    def configure(self, **settings: Any) -> None:
+        """
+        Einstellungen ändern (rbw_hz, nfft, span_hz, center_hz, window, averaging, avg_count, overlap);
+        nicht angegebene bleiben. Setzt die Mittelung zurück.
+        """
+        current = getattr(self, "_settings", {})
+        s = {**current, **settings}
+        if s["window"] not in _WINDOW_COEFFS:
+            raise ValueError(f"SpectrumAnalyzer: unbekanntes Fenster {s['window']!r}")
+        if s["averaging"] not in _AVERAGING_MODES:
+            raise ValueError(f"SpectrumAnalyzer: averaging muss {'|'.join(_AVERAGING_MODES)} sein")
+        self._settings = s
+        nfft = s["nfft"]
+        if not nfft:
+            rbw = s["rbw_hz"] or self.fs / 1024 * enbw_bins(s["window"])
+            nfft = 1 << max(4, math.ceil(math.log2(enbw_bins(s["window"]) * self.fs / rbw)))
+        self.nfft = int(nfft)
+        self.rbw_hz = enbw_bins(s["window"]) * self.fs / self.nfft
+        self.hop = max(1, int(round(self.nfft * (1.0 - min(max(float(s["overlap"]), 0.0), 0.95)))))
+        self.averaging = s["averaging"]
+        self.avg_count = max(1, int(s["avg_count"]))
+        self._complex: bool | None = None  # wird beim ersten push() festgelegt
+        # Frequenzachse hängt von reell/komplex ab → erst beim ersten push(); bis dahin leer (x0 = 0)
+        self.freqs = np.empty(0)
+        self.reset()
+
+    def reset(self) -> None:
+        """Mittelung und Segmentrest verwerfen (z. B. nach Umschalten der Quelle)."""
+        self._tail: np.ndarray | None = None
+        self._power: np.ndarray | None = None
+        self._count = 0
+        self._db: np.ndarray | None = None
+        self._segments: np.ndarray | None = None
+
+    def _setup_bins(self, is_complex: bool, dtype: Any) -> None:
+        """Fenster, Skalierung, Frequenzachse und Bin-Auswahl für reelle bzw. komplexe Eingaben."""
+        self._complex = is_complex
+        real_dtype = np.float32 if np.dtype(dtype) in (np.float32, np.complex64) else np.float64
+        self._real_dtype = real_dtype
+        n = self.nfft
+        w = window(self._settings["window"], n, real_dtype)
+        self._window = w
+        # Leistungsspektrum: |X|² / (Σw)²; reell einseitig → doppelt (außer DC/Nyquist)
+        scale = np.full(n if is_complex else n // 2 + 1, 1.0 / float(np.sum(w, dtype=np.float64)) ** 2)
+        if not is_complex:
+            scale[1:n // 2 + (n % 2)] *= 2.0
+        if is_complex:
+            freqs = np.fft.fftshift(np.fft.fftfreq(n, 1.0 / self.fs))
+            order = np.fft.fftshift(np.arange(n))
+        else:
+            freqs = np.fft.rfftfreq(n, 1.0 / self.fs)
+            order = np.arange(n // 2 + 1)
+        center = float(self._settings["center_hz"] or 0.0)
+        span = self._settings["span_hz"]
+        keep = slice(None)
+        if span:
+            lo, hi = np.searchsorted(freqs, [center - span / 2.0, center + span / 2.0], side="left")
+            keep = slice(int(lo), max(int(lo) + 1, int(hi) + 1))
+        order = order[keep]
+        self._bins = order
+        # Zusammenhängend in FFT-Reihenfolge → Slice statt Gather
+        self._bins_slice = (
+            slice(int(order[0]), int(order[-1]) + 1)
+            if len(order) and np.all(np.diff(order) == 1)
+            else None
+        )
+        self._scale = scale[order]
+        self.freqs = freqs[keep]
+        self.freqs.flags.writeable = False
+
+    @property
+    def x0(self) -> float:
+        return float(self.freqs[0]) if len(self.freqs) else 0.0
+
+    @property
+    def dx(self) -> float:
+        return self.fs / self.nfft
+
+    def push(self, samples: Any) -> int:
+        """Block anhängen und alle vollständigen Segmente auswerten; Rückgabe: Anzahl neuer Segmente."""
+        x = np.asarray(samples)
+        if x.ndim != 1:
+            raise ValueError("SpectrumAnalyzer.push: 1D-Block erwartet")
+        is_complex = np.iscomplexobj(x)
+        if self._complex is None or self._complex != is_complex:
+            self.reset()
+            self._setup_bins(is_complex, x.dtype)
+        self.stats["pushes"] += 1
+        buf = x if self._tail is None or not len(self._tail) else np.concatenate((self._tail, x))
+        n, hop = self.nfft, self.hop
+        count = 0 if len(buf) < n else (len(buf) - n) // hop + 1
+        self._tail = buf[count * hop:].copy()
+        if not count:
+            return 0
+        first = 0
+        if self.max_segments and count > self.max_segments:
+            first = count - self.max_segments
+            self.stats["skipped_segments"] += first
+        segs = sliding_window_view(buf, n)[first * hop:(count - 1) * hop + 1:hop]
+        self._accumulate(self._segment_power(segs))
+        self.stats["segments"] += len(segs)
+        return len(segs)
+
+    def _segment_power(self, segs: np.ndarray) -> np.ndarray:
+        """Fensterung und FFT aller Segmente in einem Aufruf → Leistung (Segmente × Bins im Span)."""
+        k = len(segs)
+        work_dtype = (np.complex64 if self._real_dtype == np.float32 else np.complex128) if self._complex else self._real_dtype
+        if self._segments is None or self._segments.shape[0] < k or self._segments.dtype != work_dtype:
+            self._segments = np.empty((k, self.nfft), dtype=work_dtype)
+        frames = self._segments[:k]
+        np.multiply(segs, self._window, out=frames, casting="unsafe")
+        kwargs = {"axis": 1}
+        if self._fft_workers:
+            kwargs["workers"] = self.workers
+            kwargs["overwrite_x"] = True
+        spec = self._fft.fft(frames, **kwargs) if self._complex else self._fft.rfft(frames, **kwargs)
+        spec = spec[:, self._bins_slice] if self._bins_slice is not None else spec[:, self._bins]
+        power = spec.real * spec.real
+        power += spec.imag * spec.imag
+        power *= self._scale
+        return power
+
+    def _accumulate(self, power: np.ndarray) -> None:
+        """Segmentleistungen in die Mittelung übernehmen (vektorisiert über alle Segmente)."""
+        mode = self.averaging
+        if mode == "off":
+            self._power = power.mean(axis=0)
+            return
+        if mode == "max_hold":
+            peak = power.max(axis=0)
+            self._power = peak if self._power is None else np.maximum(self._power, peak)
+            return
+        n_avg = self.avg_count
+        if mode == "linear" and self._count < n_avg:
+            m = min(n_avg - self._count, len(power))
+            total = power[:m].sum(axis=0, dtype=np.float64)
+            if self._power is None:
+                self._power = total / m
+            else:
+                self._power = (self._power * self._count + total) / (self._count + m)
+            self._count += m
+            power = power[m:]
+        elif self._power is None:
+            self._power = power[0].astype(np.float64)
+            self._count = 1
+            power = power[1:]
+        k = len(power)
+        if not k:
+            return
+        # Exponentiell: p ← (1-a)^k·p + Σ a(1-a)^(k-1-i)·P_i
+        a = 1.0 / n_avg
+        weights = a * (1.0 - a) ** np.arange(k - 1, -1, -1, dtype=np.float64)
+        self._power = (1.0 - a) ** k * self._power + weights @ power
+        self._count += k
+
+    def spectrum_db(self) -> np.ndarray | None:
+        """Aktuelles Spektrum in dB (Bins im Span, aufsteigende Frequenz); None vor dem ersten Segment."""
+        if self._power is None:
+            return None
+        if self._db is None or len(self._db) != len(self._power):
+            self._db = np.empty(len(self._power), dtype=np.float32)
+        np.maximum(self._power, _POWER_FLOOR, out=self._db, casting="unsafe")
+        np.log10(self._db, out=self._db)
+        self._db *= 10.0
+        return self._db
+
+    def trace(self, **extra: Any) -> dict[str, Any] | None:
+        """Trace für update_plot: {"x0", "dx", "y": dB, …extra}; nur y wird pro Tick übertragen."""
+        db = self.spectrum_db()
+        if db is None:
+            return None
+        return {"x0": self.x0, "dx": self.dx, "y": db, "mode": "lines", **extra}
@@ -2,7 +2,8 @@
 Layout-basierte App (Template standard_app).
 
 - Layout aus layout.json
-- State aus model_schema (SESSION_STATE_PATH)
+- State aus model_schema (SESSION_STATE_PATH), gespeichert über state_store (Journal, Hintergrund-Thread)
+- Klassenraum-Modus (CLASSROOM_MODE=1): State und Assignment pro Studierenden-ID (classroom, SQLite)
 - Callbacks aus callback_skeleton (User füllt Logik)
 - GUI wird aus Layout gebaut (build_ui_from_layout)
 """
@@ -11,6 +12,7 @@ from __future__ import annotations
 import copy
 import json
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
@@ -25,23 +27,32 @@ from nicegui import Client, app, ui
 
 from app_builder import (
     build_ui_from_layout,
-    collect_all_widget_path_ids,
-    collect_callback_names,
+    get_layout_index,
     get_widget_node_by_path_id,
-    load_layout,
+    invalidate_layout_cache,
 )
 from app_builder.editor_helper import get_editor_context
 
 # Projektbezogene Module (gleicher Ordner)
 from .assignment_registry import (
     get_active_assignment_name,
-    get_assignment,
     list_assignments,
     set_active_assignment,
 )
 from .callback_skeleton import get_callback_registry
+from .classroom import (
+    classroom_enabled,
+    get_student_state,
+    normalize_student_id,
+    student_id_from_client,
+    submit_student_state,
+)
+from .client_perf import install_probe, install_probe_script
+from .debug_view import format_state_view, refresh_interval_sec
 from .gui_binding import update_binding_from_layout
-from .model_schema import load_state, save_state, STATE_DEFAULTS
+from .model_schema import STATE_DEFAULTS
+from .state_store import get_state_store
+from .tick_engine import register_client as register_tick_client
 
 # Property-Editor (wie im Grid-Editor)
 from app_builder import get_prop_editor_specs
@@ -89,19 +100,56 @@ if _static_dir.exists():
     except Exception:
         pass  # Route may already exist
 
-# Gemeinsame Widget-Assets (z. B. plotly.min.js) – eine Kopie für alle Apps
+# Gemeinsame Widget-Assets (z. B. plotly.min.js) – eine Kopie für alle Apps.
+# Hash-Dateinamen (immutable gecacht) und vorkomprimierte .br/.gz-Varianten (widgets.static_assets).
 _widgets_static = _lab_suite_root / "widgets" / "static"
 if _widgets_static.exists():
     try:
-        app.add_static_files("/widgets-static", str(_widgets_static))
+        from widgets.static_assets import register_static_route
+        register_static_route(app, _widgets_static)
     except Exception:
-        pass
+        try:
+            app.add_static_files("/widgets-static", str(_widgets_static))
+        except Exception:
+            pass
+
+# Layout-Typen, die plotly.js brauchen (Preload im <head>)
+_PLOTLY_WIDGET_TYPES = frozenset({"plotly_spectrum", "plotly_graph", "plotly_scatter", "plotly_histogram", "plotly_3d"})
 
 # Gemeinsamer State für alle Clients (ein Tab = eine state-Kopie würde beim Shutdown mit altem Stand überschreiben)
 _SHARED_STATE_REF: list = [None]
 
 
+def _render_student_login() -> None:
+    """Klassenraum-Modus ohne ?student=<id>: ID abfragen und Seite mit ID neu laden."""
+    with ui.card().classes("absolute-center"):
+        ui.label("Studierenden-ID (Kürzel oder Matrikelnummer)")
+        id_input = ui.input(placeholder="z. B. mmuster").props("dense autofocus")
+
+        def _go() -> None:
+            student_id = normalize_student_id(id_input.value)
+            if student_id is None:
+                ui.notify("Ungültige ID (nur Buchstaben, Ziffern, _ . -)", type="warning")
+                return
+            ui.navigate.to(f"/?student={student_id}")
+
+        id_input.on("keydown.enter", _go)
+        ui.button("Weiter", on_click=_go).props("color=primary")
+
+
 async def build_root() -> None:
+    # Head-HTML vor connected(): nur so steht es im initialen HTML der Seite (danach eingefügte
+    # <script>/<link> kommen per DOM-Einfügung zu spät bzw. werden nicht ausgeführt).
+    layout_index = get_layout_index(LAYOUT_PATH)
+    if layout_index.widget_types & _PLOTLY_WIDGET_TYPES:
+        # plotly.js parallel zum Seitenaufbau laden (nicht erst beim Mount des ersten Graphen)
+        try:
+            from widgets.static_assets import preload_html
+            ui.add_head_html(preload_html())
+        except ImportError:
+            pass
+    # Browser-Telemetrie (CLIENT_PERF_PROBE=1): Script muss vor dem Websocket-Aufbau laufen
+    install_probe_script()
     await ui.context.client.connected()
     # Skip building if client already disconnected (e.g. user refreshed); avoids "Client has been deleted" warning.
     try:
@@ -111,16 +159,24 @@ async def build_root() -> None:
     except Exception:
         pass
 
-    layout = load_layout(LAYOUT_PATH)
-    layout.setdefault("appearance", {})
-    update_binding_from_layout(layout)  # SEMANTIC_BINDING aus props.user_id befüllen
-    if _SHARED_STATE_REF[0] is None:
-        _SHARED_STATE_REF[0] = load_state(APP_ROOT / SESSION_STATE_FILENAME)
-    state = _SHARED_STATE_REF[0]
+    # Geparstes Layout + Indizes aus dem prozessweiten Cache (neu nur bei geänderter layout.json).
+    # layout wird von allen Clients geteilt: nicht verändern, der Editor nutzt _editable_layout().
+    layout = layout_index.layout
+    update_binding_from_layout(layout, collected=layout_index.semantic_binding)  # SEMANTIC_BINDING aus props.user_id
+    # Klassenraum-Modus: eigener State pro Studierenden-ID (alle Tabs dieser ID teilen ihn)
+    student_id = student_id_from_client(ui.context.client) if classroom_enabled() else None
+    if classroom_enabled() and student_id is None:
+        _render_student_login()
+        return
+    if student_id is not None:
+        state = get_student_state(student_id)
+    else:
+        if _SHARED_STATE_REF[0] is None:
+            _SHARED_STATE_REF[0] = get_state_store(SESSION_STATE_PATH).load()
+        state = _SHARED_STATE_REF[0]
     callbacks = get_callback_registry()
 
     state_label_holder: list = []
-    _persist_state_timer_ref: list = [None]  # für debounced Save bei Widget-Änderung
     # Edit-Modus: an = Code-Editor-Expansion ist offen (geöffnet per Button oder Klick auf Expansion).
     # Nur im Edit-Modus: Hover über Widget zeigt path_id (title); Auswahlbox (Rahmen); Klick auf Widget setzt Auswahl (ohne Aktion).
     # Edit-Modus aus: Expansion zu (Schließen-Button oder Expansion zuklappen) → Hover/Box aus, Klick auf Widget löst normale Aktion aus.
@@ -134,13 +190,32 @@ async def build_root() -> None:
     debug_mode_ref: list = [False]  # DEBUG MODE: State-Dictionary-Anzeige ein/aus
     debug_mode_checkbox_ref: list = []
     state_label_container_ref: list = []  # Container um State-Label; Sichtbarkeit per DEBUG MODE
+    # State-Anzeige: zuletzt angezeigter Stand (für Änderungen pro Key), Zeitpunkt, geplante Nachzügler-Aktualisierung
+    state_view_prev_ref: list = [None]
+    state_view_last_ref: list = [0.0]
+    state_view_timer_ref: list = [None]
+
+    def _render_state_view() -> None:
+        """State-Label neu füllen (nur bei sichtbarer Anzeige; gekürzte Werte, Änderungen zuerst)."""
+        state_view_timer_ref[0] = None
+        if not debug_mode_ref[0] or not state_label_holder:
+            return
+        text, state_view_prev_ref[0] = format_state_view(state, state_view_prev_ref[0])
+        state_view_last_ref[0] = time.monotonic()
+        el = state_label_holder[0]
+        if el.text != text:
+            el.text = text
+            el.update()
 
     def _refresh_state_display() -> None:
-        if state_label_holder:
-            el = state_label_holder[0]
-            el.text = "State (Keys = Path-IDs): " + str(state)
-            el.update()
-        _schedule_persist_state()  # session_state.json debounced speichern
+        # DEBUG MODE aus → nichts berechnen/senden; sonst höchstens alle DEBUG_STATE_INTERVAL_SEC
+        if debug_mode_ref[0] and state_view_timer_ref[0] is None:
+            wait = state_view_last_ref[0] + refresh_interval_sec() - time.monotonic()
+            if wait <= 0:
+                _render_state_view()
+            else:
+                state_view_timer_ref[0] = ui.timer(wait, _render_state_view, once=True)
+        _schedule_persist_state()  # session_state.json gesammelt im Hintergrund speichern
 
     def _on_edit_select_from_layout(path_id: str) -> None:
         """Wird vom Renderer bei Klick auf Widget im Edit-Modus aufgerufen (Callback-Handler)."""
@@ -149,6 +224,7 @@ async def build_root() -> None:
 
     # State + Widget-Registry am Client: für gui_binding.get/set und direkten Zugriff (path_id → Instanz).
     ui.context.client.state = state
+    ui.context.client.student_id = student_id  # tick_engine/classroom: timer_tick pro ID
     widget_registry = getattr(ui.context.client, "widget_registry", None)
     if widget_registry is None:
         ui.context.client.widget_registry = {}
@@ -263,6 +339,9 @@ async def build_root() -> None:
                 if state_label_container_ref:
                     state_label_container_ref[0].set_visibility(debug_mode_ref[0])
                     state_label_container_ref[0].update()
+                if debug_mode_ref[0]:
+                    state_view_prev_ref[0] = None  # beim Einschalten vollständige Anzeige ohne Änderungsliste
+                    _render_state_view()
 
             dbg_cb = ui.checkbox("DEBUG MODE", value=debug_mode_ref[0]).props("dense")
             debug_mode_checkbox_ref.append(dbg_cb)
@@ -290,31 +369,33 @@ async def build_root() -> None:
         register_markdown_view=lambda src, prev, update=None, always_show_source=False: markdown_views_ref.append((src, prev, update, always_show_source)),
     )
 
-    # Timer für User-Logik (Plot-Updates etc.); Rate über Umgebungsvariable TIMER_INTERVAL_SEC (z. B. 0.1 = 10 Hz)
-    _timer_interval = float(__import__("os").environ.get("TIMER_INTERVAL_SEC", "0.1"))
-    if _timer_interval > 0:
-
-        def _timer_callback() -> None:
-            mod = get_assignment()
-            if mod is not None and hasattr(mod, "timer_tick"):
-                try:
-                    mod.timer_tick()
-                except Exception:
-                    pass
-
-        ui.timer(_timer_interval, _timer_callback)
+    # Timer für User-Logik (Plot-Updates etc.): ein gemeinsamer Tick pro App-Prozess (tick_engine),
+    # Ergebnisse gehen an alle verbundenen Clients. Rate über TIMER_INTERVAL_SEC (z. B. 0.1 = 10 Hz).
+    register_tick_client(ui.context.client)
+    # Browser-Telemetrie (CLIENT_PERF_PROBE=1): Meldungen dieses Clients annehmen (Script steht im Head)
+    install_probe(ui.context.client)
 
     # State-Dictionary-Anzeige (Code bleibt; Sichtbarkeit per DEBUG MODE Checkbox)
     with ui.element("div") as state_label_container:
-        state_label = ui.label("State (Keys = Path-IDs): " + str(state)).classes("text-caption")
+        # Inhalt erst beim Einschalten von DEBUG MODE (kein str(state) pro Seitenaufruf)
+        state_label = ui.label("").classes("text-caption").style("white-space: pre-wrap; font-family: monospace;")
         state_label_holder.append(state_label)
     state_label_container_ref.append(state_label_container)
     state_label_container.set_visibility(debug_mode_ref[0])
 
     # ---- Editor-Modus: CodeMirror (fertiger Editor mit Zeilennummern, Syntax, Scroll) ----
     # Dropdown mit allen Widgets (nicht nur Callback-Widgets), damit z. B. toggle_button, led, vu_meter Properties bearbeitet werden können.
-    callbacks_list = collect_callback_names(layout)
-    path_id_options = {pid: pid for pid in collect_all_widget_path_ids(layout)}
+    callbacks_list = layout_index.callback_names
+    # Klassenraum-Modus: kein Layout-/Code-Editor (gemeinsame Dateien; spart Speicher pro Tab)
+    path_id_options = {} if student_id is not None else {pid: pid for pid in layout_index.widget_path_ids}
+    editable_layout_ref: list = [None]
+
+    def _editable_layout() -> dict:
+        """Layout für den Property-Editor: eigene Kopie beim ersten Zugriff (Cache-Eintrag bleibt unverändert)."""
+        if editable_layout_ref[0] is None:
+            editable_layout_ref[0] = copy.deepcopy(layout)
+        return editable_layout_ref[0]
+
     editor_header_label: list = []
     editor_cm_ref: list = []
     if path_id_options:
@@ -338,7 +419,7 @@ async def build_root() -> None:
             cont = props_container[0]
             cont.clear()
             path_id = path_id_select_ref[0].value if path_id_select_ref else None
-            node = get_widget_node_by_path_id(layout, path_id) if path_id else None
+            node = get_widget_node_by_path_id(_editable_layout(), path_id) if path_id else None
             with cont:
                 ui.label("Widget-Properties (layout.json)").classes("text-weight-medium")
                 if not node:
@@ -457,7 +538,8 @@ async def build_root() -> None:
         def save_layout_json() -> None:
             try:
                 with open(LAYOUT_PATH, "w", encoding="utf-8") as f:
-                    json.dump(layout, f, indent=2, ensure_ascii=False)
+                    json.dump(_editable_layout(), f, indent=2, ensure_ascii=False)
+                invalidate_layout_cache(LAYOUT_PATH)
                 ui.notify("Layout gespeichert. Seite neu laden, um Änderungen zu sehen.", type="positive")
             except Exception as e:
                 ui.notify(f"Layout speichern fehlgeschlagen: {e}", type="negative")
@@ -692,7 +774,7 @@ async def build_root() -> None:
                     if not path_id_select_ref:
                         ui.notify("Select a widget first.", type="warning")
                         return
-                    node = get_widget_node_by_path_id(layout, path_id_select_ref[0].value)
+                    node = get_widget_node_by_path_id(_editable_layout(), path_id_select_ref[0].value)
                     if not node:
                         ui.notify("Select a widget first.", type="warning")
                         return
@@ -707,7 +789,7 @@ async def build_root() -> None:
                     if not path_id_select_ref:
                         ui.notify("Select a widget first.", type="warning")
                         return
-                    node = get_widget_node_by_path_id(layout, path_id_select_ref[0].value)
+                    node = get_widget_node_by_path_id(_editable_layout(), path_id_select_ref[0].value)
                     if not node:
                         ui.notify("Select a widget first.", type="warning")
                         return
@@ -738,7 +820,10 @@ async def build_root() -> None:
                             "Dezente Hintergründe und Abstände für Container (z. B. Zeilen) und Seite. "
                             "Leer = kein Vorgabewert; einzelne Container können weiterhin eigenes style setzen."
                         ).classes("text-caption text-grey")
-                        app_opt = layout.setdefault("appearance", {})
+                        app_opt = layout.get("appearance") or {}  # nur lesen; Änderungen über _set_appearance
+
+                        def _set_appearance(key: str, value: Any) -> None:
+                            _editable_layout().setdefault("appearance", {})[key] = value
 
                         def _appearance_value(val: Any) -> str:
                             """String für Anzeige/Speicherung; layout kann Dict aus Editor speichern."""
@@ -755,7 +840,7 @@ async def build_root() -> None:
                                     value=_appearance_value(app_opt.get(key)),
                                     placeholder=placeholder,
                                 ).classes("flex-grow").props("dense")
-                                inp.on("update:model-value", lambda e, k=key: app_opt.update({k: getattr(e, "args", "") or ""}))
+                                inp.on("update:model-value", lambda e, k=key: _set_appearance(k, getattr(e, "args", "") or ""))
 
                         _appearance_input("Seiten-Padding", "page_padding", "z. B. 16px")
                         _appearance_input("Seiten-Hintergrund", "page_background", "z. B. #fafafa")
@@ -782,7 +867,7 @@ async def build_root() -> None:
                         ).classes("w-full").props("dense")
                         scroll_mode_select.on(
                             "update:model-value",
-                            lambda e: app_opt.update({"scroll_content_mode": _normalize_scroll_content_mode(getattr(e, "args", "fixed"))}),
+                            lambda e: _set_appearance("scroll_content_mode", _normalize_scroll_content_mode(getattr(e, "args", "fixed"))),
                         )
                         with ui.row().classes("items-center gap-2 w-full mt-1"):
                             ui.label("Scrollbereich max. Höhe (nur bei „Fixe Höhe“):").classes("w-48 shrink-0")
@@ -792,7 +877,7 @@ async def build_root() -> None:
                             ).classes("flex-grow").props("dense")
                             scroll_max_inp.on(
                                 "update:model-value",
-                                lambda e: app_opt.update({"scroll_area_max_height": getattr(e, "args", "") or "calc(100vh - 180px)"}),
+                                lambda e: _set_appearance("scroll_area_max_height", getattr(e, "args", "") or "calc(100vh - 180px)"),
                             )
                         ui.label(
                             "Fixe Höhe = nur der Inhaltsbereich scrollt; flexibel = ganze Seite scrollt wie vor Sticky-Header."
@@ -815,7 +900,7 @@ async def build_root() -> None:
             tab_panels.on("update:model-value", _on_tab_change)
 
     def _persist_state() -> None:
-        """Schreibt state in session_state.json (für Disconnect und bei Widget-Änderung)."""
+        """Übergibt state an den StateStore (für Disconnect und bei Widget-Änderung; kein I/O auf dem Loop)."""
         reg = getattr(ui.context.client, "state_input_registry", None)
         if reg:
             for path_id, w in reg.items():
@@ -825,26 +910,17 @@ async def build_root() -> None:
                         state[path_id] = val
                 except Exception:
                     pass
-        save_state(state, APP_ROOT / SESSION_STATE_FILENAME)
+        if student_id is not None:
+            submit_student_state(student_id, state)
+        else:
+            get_state_store(SESSION_STATE_PATH).submit(state)
 
     def _schedule_persist_state() -> None:
-        """Speichert state nach 1,5 s Verzögerung (debounce), damit nicht bei jedem Slider-Tick geschrieben wird."""
-        if _persist_state_timer_ref[0] is not None:
-            try:
-                _persist_state_timer_ref[0].cancel()
-            except Exception:
-                pass
-            _persist_state_timer_ref[0] = None
-
-        def _do_persist() -> None:
-            _persist_state_timer_ref[0] = None
-            try:
-                _persist_state()
-            except Exception:
-                pass
-
-        t = ui.timer(1.5, _do_persist, once=True)
-        _persist_state_timer_ref[0] = t
+        """Speichert state verzögert: der StateStore sammelt Änderungen aller Clients (STATE_SAVE_DELAY_SEC)."""
+        try:
+            _persist_state()
+        except Exception:
+            pass
 
     def _save_before_disconnect():
         _persist_state()
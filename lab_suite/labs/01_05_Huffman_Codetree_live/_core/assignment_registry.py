@@ -4,13 +4,23 @@ Assignment-Registry: Wahlweise eine Fachaufgabe (Assignment) in die App einhäng
 Assignments liegen im Ordner assignments/ (user_template.py, assignment_01.py, …).
 Wenn USE_SUBMISSIONS=1 gesetzt ist (Launcher startet App für Studierende), wird zuerst
 submissions/<name>.py geladen, falls vorhanden – damit Bearbeitungen aus submissions/ genutzt werden.
+
+Cache: get_assignment() wird aus dem Timer (z. B. 10 Hz) aufgerufen. Aktiver Name und geladene
+Module werden gecacht (Schlüssel: Pfad + mtime/Größe, bei Änderung zusätzlich Inhalts-Hash);
+im Normalfall kostet ein Aufruf nur einen Dict-Lookup. Änderungen an assignments/ und
+submissions/ meldet ein watchfiles-Watcher (Hot-Reload); ohne watchfiles wird höchstens
+einmal pro _POLL_INTERVAL_SEC per stat() geprüft. Explizit neu laden: reload_assignment().
+Bei fehlerhaftem Reload (z. B. Syntaxfehler beim Speichern) bleibt das letzte gute Modul aktiv.
 """
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
 import json
 import os
+import threading
+import time
 from pathlib import Path
 from types import ModuleType
 
@@ -25,6 +35,25 @@ _ACTIVE_FILE = _ASSIGNMENTS_DIR / "active.json"
 # Modulnamen, die keine Assignments sind (nur Callbacks/Infrastruktur)
 _NON_ASSIGNMENT_MODULES = frozenset({"user_callbacks", "__init__"})
 
+# Ohne watchfiles: Dateien höchstens so oft per stat() auf Änderungen prüfen (Sekunden)
+_POLL_INTERVAL_SEC = 1.0
+
+# (name, aus submissions?) → (Pfad, (mtime_ns, size), sha1 des Inhalts, Modul)
+_MODULE_CACHE: dict[tuple[str, bool], tuple[Path, tuple[int, int], str, ModuleType]] = {}
+# (name, True) → (Stempel, sha1) einer Abgabe, deren erstes Laden fehlschlug: erst nach Änderung erneut ausführen
+_FAILED_CACHE: dict[tuple[str, bool], tuple[tuple[int, int] | None, str]] = {}
+# active.json: [(mtime_ns, size) | None, Name | None]; None = noch nicht gelesen
+_ACTIVE_CACHE: list = [None]
+# True = Dateien könnten sich geändert haben → beim nächsten Zugriff Stempel prüfen
+_DIRTY_REF: list = [True]
+_LAST_CHECK_REF: list = [0.0]
+# Watcher-Thread (watchfiles) oder None; _WATCHER_STARTED verhindert Mehrfachstart
+_WATCHER_REF: list = [None]
+_WATCHER_STARTED: list = [False]
+# Zähler: wird bei jedem erfolgreichen (Neu-)Laden erhöht (z. B. für Modul-Kopien im Klassenraum-Modus)
+_GENERATION_REF: list = [0]
+_LOCK = threading.Lock()
+
 
 def _parent_package() -> str:
     """Paket der App (development_app), nicht _core, für Import .assignments.<name>."""
@@ -34,21 +63,161 @@ def _parent_package() -> str:
     return pkg
 
 
-def _get_active_name(override: str | None) -> str | None:
-    """Aktives Assignment: override (z. B. aus State) > active.json > ASSIGNMENT."""
-    if override and override.strip():
-        return override.strip()
-    if _ACTIVE_FILE.exists():
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) oder None, wenn die Datei fehlt."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _watch_loop() -> None:
+    """Hintergrund-Thread: markiert den Cache bei jeder Änderung in assignments/ oder submissions/ als dirty."""
+    try:
+        from watchfiles import watch
+    except ImportError:
+        _WATCHER_REF[0] = None
+        return
+    dirs = [str(d) for d in (_ASSIGNMENTS_DIR, APP_ROOT / "submissions") if d.is_dir()]
+    if not dirs:
+        _WATCHER_REF[0] = None
+        return
+    try:
+        for _changes in watch(*dirs):
+            _DIRTY_REF[0] = True
+    except Exception:
+        pass
+    _WATCHER_REF[0] = None  # Watcher beendet → wieder auf Polling zurückfallen
+
+
+def _ensure_watcher() -> None:
+    """Startet den watchfiles-Watcher einmalig (abschaltbar mit ASSIGNMENT_HOT_RELOAD=0)."""
+    if _WATCHER_STARTED[0]:
+        return
+    _WATCHER_STARTED[0] = True
+    if os.environ.get("ASSIGNMENT_HOT_RELOAD", "1").strip().lower() in ("0", "false", "no"):
+        return
+    try:
+        import watchfiles  # noqa: F401
+    except ImportError:
+        return
+    t = threading.Thread(target=_watch_loop, name="assignment-watcher", daemon=True)
+    _WATCHER_REF[0] = t
+    t.start()
+
+
+def _needs_check() -> bool:
+    """True, wenn die Dateistempel geprüft werden müssen (Watcher meldet Änderung bzw. Poll-Intervall abgelaufen)."""
+    if _DIRTY_REF[0]:
+        return True
+    if _WATCHER_REF[0] is not None:
+        return False
+    return time.monotonic() - _LAST_CHECK_REF[0] >= _POLL_INTERVAL_SEC
+
+
+def _read_active_file() -> str | None:
+    """Name aus active.json (gecacht über den Dateistempel)."""
+    stamp = _file_stamp(_ACTIVE_FILE)
+    cached = _ACTIVE_CACHE[0]
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    name = None
+    if stamp is not None:
         try:
             data = json.loads(_ACTIVE_FILE.read_text(encoding="utf-8"))
-            name = (data.get("assignment") or "").strip()
-            if name:
-                return name
+            name = (data.get("assignment") or "").strip() or None
         except Exception:
             pass
+    _ACTIVE_CACHE[0] = (stamp, name)
+    return name
+
+
+def _get_active_name(override: str | None) -> str | None:
+    """Aktives Assignment: override (z. B. aus State) > active.json > ASSIGNMENT."""
+    if override and override.strip():
+        return override.strip()
+    cached = _ACTIVE_CACHE[0]
+    name = cached[1] if cached is not None and not _needs_check() else _read_active_file()
+    if name:
+        return name
     return ASSIGNMENT.strip() or None
 
 
+def _load_submission_module(name: str, sub_path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"submissions_{name}",
+        sub_path,
+        submodule_search_locations=[],
+    )
+    if not spec or not spec.loader:
+        raise ImportError(f"Kein Loader für {sub_path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _resolve(name: str, use_submissions: bool) -> tuple[tuple[str, bool], Path] | None:
+    """Cache-Schlüssel und Quelldatei für das Assignment (submissions/ vor assignments/)."""
+    if use_submissions:
+        sub_path = APP_ROOT / "submissions" / f"{name}.py"
+        if sub_path.is_file():
+            return (name, True), sub_path
+    path = _ASSIGNMENTS_DIR / f"{name}.py"
+    return (name, False), path
+
+
+def _load_or_reload(key: tuple[str, bool], path: Path) -> ModuleType | None:
+    """Modul laden bzw. bei geändertem Inhalt neu laden; bei Fehler letztes gutes Modul behalten."""
+    name, from_submissions = key
+    stamp = _file_stamp(path)
+    cached = _MODULE_CACHE.get(key)
+    if cached is not None and cached[1] == stamp:
+        return cached[3]
+    failed = _FAILED_CACHE.get(key) if cached is None else None
+    if failed is not None and failed[0] == stamp:
+        return None
+    digest = _file_digest(path) if stamp is not None else ""
+    if failed is not None and failed[1] == digest:
+        _FAILED_CACHE[key] = (stamp, digest)
+        return None
+    if cached is not None and digest and cached[2] == digest:
+        # Nur Zeitstempel geändert (touch, git checkout), Inhalt gleich → kein erneutes exec
+        _MODULE_CACHE[key] = (path, stamp, digest, cached[3])
+        return cached[3]
+    try:
+        if from_submissions:
+            mod = _load_submission_module(name, path)
+        else:
+            parent = _parent_package()
+            if not parent:
+                return None
+            if cached is not None:
+                mod = importlib.reload(cached[3])
+            else:
+                mod = importlib.import_module(f".assignments.{name}", package=parent)
+    except Exception as e:
+        if cached is not None:
+            print(f"[assignment_registry] Reload von {path.name} fehlgeschlagen, altes Modul bleibt aktiv: {e}")
+            _MODULE_CACHE[key] = (path, stamp, digest, cached[3])
+            return cached[3]
+        if from_submissions:
+            print(f"[assignment_registry] submissions/{path.name} nicht ladbar, verwende assignments/: {e}")
+            _FAILED_CACHE[key] = (stamp, digest)
+        return None
+    _FAILED_CACHE.pop(key, None)
+    _MODULE_CACHE[key] = (path, stamp, digest, mod)
+    _GENERATION_REF[0] += 1
+    return mod
+
+
 def get_assignment(active_override: str | None = None) -> ModuleType | None:
     """Lädt das aktive Assignment-Modul. Bei USE_SUBMISSIONS zuerst aus submissions/, sonst assignments/."""
     name = _get_active_name(active_override)
@@ -56,28 +225,55 @@ def get_assignment(active_override: str | None = None) -> ModuleType | None:
         return None
     if name in _NON_ASSIGNMENT_MODULES:
         return None
-    if os.environ.get("USE_SUBMISSIONS"):
-        sub_path = APP_ROOT / "submissions" / f"{name}.py"
-        if sub_path.is_file():
-            try:
-                spec = importlib.util.spec_from_file_location(
-                    f"submissions_{name}",
-                    sub_path,
-                    submodule_search_locations=[],
-                )
-                if spec and spec.loader:
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    return mod
-            except Exception:
-                pass
-    parent = _parent_package()
-    if not parent:
-        return None
-    try:
-        return importlib.import_module(f".assignments.{name}", package=parent)
-    except Exception:
-        return None
+    # Launcher setzt USE_SUBMISSIONS=1 für Studierende → Code aus submissions/ verwenden
+    use_submissions = bool(os.environ.get("USE_SUBMISSIONS"))
+    if not _needs_check():
+        # Schneller Pfad (Timer): nur Dict-Lookup
+        cached = _MODULE_CACHE.get((name, use_submissions)) or _MODULE_CACHE.get((name, False))
+        if cached is not None:
+            return cached[3]
+    _ensure_watcher()
+    with _LOCK:
+        _DIRTY_REF[0] = False
+        _LAST_CHECK_REF[0] = time.monotonic()
+        resolved = _resolve(name, use_submissions)
+        if resolved is None:
+            return None
+        key, path = resolved
+        # Datei in submissions/ gelöscht → veralteten Eintrag verwerfen
+        if not key[1]:
+            _MODULE_CACHE.pop((name, True), None)
+        mod = _load_or_reload(key, path)
+        if mod is None and key[1]:
+            # Abgabe schon beim ersten Laden fehlerhaft (kein altes Modul): Vorlage aus assignments/
+            return _load_or_reload((name, False), _ASSIGNMENTS_DIR / f"{name}.py")
+        return mod
+
+
+def reload_assignment(name: str | None = None) -> ModuleType | None:
+    """
+    Hot-Reload erzwingen: Modul beim nächsten Zugriff neu ausführen (Globals werden zurückgesetzt).
+    name=None → aktives Assignment. Gibt das neu geladene Modul zurück.
+    """
+    target = name or _get_active_name(None)
+    with _LOCK:
+        for key in [k for k in _MODULE_CACHE if k[0] == target]:
+            entry = _MODULE_CACHE[key]
+            # Stempel/Hash verwerfen, Modul behalten (importlib.reload braucht es)
+            _MODULE_CACHE[key] = (entry[0], (-1, -1), "", entry[3])
+        _FAILED_CACHE.pop((target, True), None)
+        _DIRTY_REF[0] = True
+    return get_assignment(name)
+
+
+def assignment_generation() -> int:
+    """Ändert sich, sobald ein Assignment-Modul neu ausgeführt wurde (Hot-Reload, Wechsel)."""
+    return _GENERATION_REF[0]
+
+
+def invalidate_cache() -> None:
+    """Beim nächsten get_assignment() Dateistempel prüfen (z. B. nach Speichern im Editor)."""
+    _DIRTY_REF[0] = True
 
 
 def list_assignments() -> list[str]:
@@ -101,3 +297,5 @@ def set_active_assignment(name: str) -> None:
     """Setzt das aktive Assignment (persistent in assignments/active.json)."""
     _ASSIGNMENTS_DIR.mkdir(parents=True, exist_ok=True)
     _ACTIVE_FILE.write_text(json.dumps({"assignment": name.strip()}, indent=2), encoding="utf-8")
+    _ACTIVE_CACHE[0] = None
+    _DIRTY_REF[0] = True
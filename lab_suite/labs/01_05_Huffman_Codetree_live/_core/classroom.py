@@ -0,0 +1,455 @@
+"""
+Klassenraum-Modus: ein Lab-Server für viele Studierende (CLASSROOM_MODE=1).
+
+Ohne Klassenraum-Modus teilen sich alle Tabs einen State (app._SHARED_STATE_REF) und ein
+Assignment-Modul. Mit CLASSROOM_MODE=1 bekommt jede Studierenden-ID (URL ?student=<id>):
+
+- einen eigenen State (Keys = path_ids wie bisher), gespeichert in einer lokalen SQLite-Datei
+  (CLASSROOM_DB, Default <App>/classroom_sessions.sqlite3; Tabelle sessions: student, key, value).
+  Geschrieben wird nur, was sich geändert hat – im Hintergrund-Thread, gesammelt über alle
+  Studierenden (STATE_SAVE_DELAY_SEC wie state_store).
+- eine eigene Instanz des Assignment-Moduls (eigene Globals). Der Code wird pro Generation nur
+  einmal kompiliert; jede Instanz teilt sich das Code-Objekt, nur die Modul-Globals kosten Speicher.
+- Alle Tabs derselben ID teilen sich State und Modul (z. B. Laptop + Tablet).
+
+SEMANTIC_BINDING bleibt global: Es wird aus layout.json abgeleitet und ist für alle gleich.
+Die Tick-Engine ruft timer_tick() pro Studierenden-ID auf (nur IDs mit verbundenem Tab).
+Speicher: get_classroom_stats() liefert geschätzte Bytes pro Studierendem (State + Modul-Globals)
+und den gemessenen RSS-Zuwachs beim Anlegen einer Sitzung. Sitzungen ohne verbundenen Tab werden
+nach CLASSROOM_IDLE_EVICT_SEC (Default 300 s) gespeichert und aus dem Speicher entfernt.
+ASSIGNMENT_ISOLATION wird im Klassenraum-Modus ignoriert (ein Worker pro Prozess, nicht pro ID).
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
+from typing import Any
+
+from .assignment_registry import APP_ROOT, assignment_generation, get_assignment
+from .model_schema import STATE_DEFAULTS, _coerce_like_default
+
+# Erlaubte Studierenden-IDs (Kürzel, Matrikelnummer); alles andere wird abgelehnt
+_STUDENT_ID_RE = re.compile(r"^[A-Za-z0-9_.\-]{1,64}$")
+
+# student_id → {"state": dict, "module": (generation, ModuleType) | None, "last_active": float, "rss_delta": int}
+_SESSIONS: dict[str, dict[str, Any]] = {}
+# (generation, Dateipfad, Code-Objekt): einmal kompiliert, von allen Modul-Instanzen geteilt
+_CODE_REF: list = [None]
+# SqliteSessionStore (einmal pro Prozess)
+_STORE_REF: list = [None]
+_LAST_EVICT_REF: list = [0.0]
+_LOCK = threading.Lock()
+
+
+def classroom_enabled() -> bool:
+    return os.environ.get("CLASSROOM_MODE", "").strip().lower() in ("1", "true", "yes")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def normalize_student_id(value: Any) -> str | None:
+    """Studierenden-ID prüfen (Buchstaben, Ziffern, _ . -; max. 64 Zeichen); ungültig → None."""
+    sid = str(value or "").strip()
+    return sid if _STUDENT_ID_RE.match(sid) else None
+
+
+def student_id_from_client(client: Any) -> str | None:
+    """Studierenden-ID aus der URL (?student=<id>) des NiceGUI-Clients."""
+    try:
+        return normalize_student_id(client.request.query_params.get("student"))
+    except Exception:
+        return None
+
+
+# --- SQLite-Sitzungsspeicher ---
+
+
+class SqliteSessionStore:
+    """State pro Studierenden-ID in SQLite; nur geänderte Keys werden im Writer-Thread geschrieben."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.delay_sec = max(0.0, _env_float("STATE_SAVE_DELAY_SEC", 1.5))
+        self._cond = threading.Condition()
+        # student_id → flache Kopie des States (neuere Aufträge ersetzen ältere)
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._pending_since = 0.0  # Zeitpunkt des ersten noch nicht geschriebenen Auftrags
+        self._flush_requested = False
+        self._writing = False
+        self._closed = False
+        # student_id → zuletzt geschriebene Werte (JSON-Text pro Key)
+        self._persisted: dict[str, dict[str, str]] = {}
+        self._thread: threading.Thread | None = None
+        self.stats: dict[str, Any] = {"submits": 0, "writes": 0, "rows": 0, "errors": 0, "last_write_ms": 0.0}
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " student TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " updated REAL NOT NULL, PRIMARY KEY (student, key))"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def load(self, student_id: str) -> dict[str, Any]:
+        """State der ID: Defaults aus model_schema, überschrieben mit gespeicherten Werten."""
+        out = STATE_DEFAULTS.copy()
+        persisted: dict[str, str] = {}
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute("SELECT key, value FROM sessions WHERE student = ?", (student_id,)).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            self.stats["errors"] += 1
+            rows = []
+        for key, text in rows:
+            if key not in out:
+                continue
+            try:
+                out[key] = _coerce_like_default(json.loads(text), out[key])
+                persisted[key] = text
+            except ValueError:
+                pass
+        with self._cond:
+            self._persisted[student_id] = persisted
+        return out
+
+    def submit(self, student_id: str, state: dict[str, Any]) -> None:
+        """State der ID zum Speichern vormerken (kein I/O)."""
+        with self._cond:
+            if self._closed:
+                return
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending[student_id] = dict(state)
+            self.stats["submits"] += 1
+            self._cond.notify()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="classroom-store", daemon=True)
+            self._thread.start()
+
+    def forget_inactive(self, active_ids: Any) -> None:
+        """Vergleichsbasis aller IDs ohne Sitzung im Speicher (nicht in active_ids) und ohne offene Änderungen verwerfen."""
+        with self._cond:
+            for student_id in list(self._persisted):
+                if student_id not in active_ids and student_id not in self._pending:
+                    del self._persisted[student_id]
+
+    def flush(self, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while (self._pending or self._writing) and self._thread is not None and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._flush_requested = False
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.flush()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self._write(pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                # Änderungen aller Studierenden sammeln: Fenster ab dem ersten Auftrag, submit() beendet
+                # es nicht, nur flush()/close()
+                deadline = self._pending_since + self.delay_sec
+                while not self._closed and not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._flush_requested = False
+                pending, self._pending = self._pending, {}
+                self._writing = True
+            try:
+                self._write(pending)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, pending: dict[str, dict[str, Any]]) -> None:
+        t0 = time.perf_counter()
+        rows: list[tuple[str, str, str, float]] = []
+        now = time.time()
+        with self._cond:
+            persisted_all = {sid: dict(self._persisted.get(sid, {})) for sid in pending}
+        for student_id, state in pending.items():
+            persisted = persisted_all[student_id]
+            for key, value in state.items():
+                try:
+                    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+                except (TypeError, ValueError):
+                    continue
+                if persisted.get(key) != text:
+                    rows.append((student_id, key, text, now))
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO sessions (student, key, value, updated) VALUES (?, ?, ?, ?)"
+                        " ON CONFLICT(student, key) DO UPDATE SET value = excluded.value, updated = excluded.updated",
+                        rows,
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            print(f"[classroom] Speichern fehlgeschlagen ({self.path.name}): {e}")
+            with self._cond:
+                # Erneut vormerken (neuere Aufträge derselben ID haben Vorrang); Vergleichsbasis unverändert
+                for student_id, state in pending.items():
+                    self._pending.setdefault(student_id, state)
+                self._pending_since = time.monotonic()
+        else:
+            # Erst nach dem Commit als gespeichert merken
+            with self._cond:
+                for student_id, key, text, _ in rows:
+                    self._persisted.setdefault(student_id, {})[key] = text
+            self.stats["writes"] += 1
+            self.stats["rows"] += len(rows)
+        self.stats["last_write_ms"] = (time.perf_counter() - t0) * 1000.0
+
+
+def get_session_store() -> SqliteSessionStore:
+    """SQLite-Store (CLASSROOM_DB); schreibt beim App-Shutdown alle offenen Änderungen."""
+    if _STORE_REF[0] is None:
+        store = SqliteSessionStore(os.environ.get("CLASSROOM_DB", "") or APP_ROOT / "classroom_sessions.sqlite3")
+        _STORE_REF[0] = store
+        try:
+            from nicegui import app
+            app.on_shutdown(store.close)
+        except Exception:
+            pass
+    return _STORE_REF[0]
+
+
+# --- Sitzungen (State + Modul-Instanz pro ID) ---
+
+
+def _rss_bytes() -> int:
+    """Resident Set Size des Prozesses (Linux /proc, sonst psutil, sonst 0)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        return 0
+
+
+def get_student_state(student_id: str) -> dict[str, Any]:
+    """State der ID (beim ersten Zugriff aus SQLite geladen); mehrere Tabs erhalten dasselbe Dict."""
+    _evict_idle()
+    with _LOCK:
+        session = _SESSIONS.get(student_id)
+        if session is None:
+            rss_before = _rss_bytes()
+            session = {
+                "state": get_session_store().load(student_id),
+                "module": None,
+                "last_active": time.monotonic(),
+                "rss_delta": 0,
+            }
+            _SESSIONS[student_id] = session
+            _student_module(student_id, session)
+            session["rss_delta"] = max(0, _rss_bytes() - rss_before)
+        session["last_active"] = time.monotonic()
+        return session["state"]
+
+
+def submit_student_state(student_id: str, state: dict[str, Any]) -> None:
+    get_session_store().submit(student_id, state)
+
+
+def _shared_code(base: ModuleType) -> CodeType | None:
+    """Code des aktiven Assignments, einmal pro Generation kompiliert."""
+    generation = assignment_generation()
+    path = getattr(base, "__file__", None)
+    cached = _CODE_REF[0]
+    if cached is not None and cached[0] == generation and cached[1] == path:
+        return cached[2]
+    if not path:
+        return None
+    try:
+        code = compile(Path(path).read_bytes(), path, "exec")
+    except (OSError, SyntaxError):
+        return cached[2] if cached is not None and cached[1] == path else None
+    _CODE_REF[0] = (generation, path, code)
+    return code
+
+
+def _student_module(student_id: str, session: dict[str, Any]) -> ModuleType | None:
+    """Eigene Instanz des aktiven Assignments für die ID (nach Hot-Reload neu ausgeführt)."""
+    base = get_assignment()
+    if base is None:
+        return None
+    generation = assignment_generation()
+    entry = session.get("module")
+    if entry is not None and entry[0] == generation:
+        return entry[1]
+    code = _shared_code(base)
+    if code is None:
+        return base
+    # Eigener Modulname im selben Paket → relative Imports (from .._core import gui_binding) funktionieren;
+    # nicht in sys.modules eingetragen, damit die Instanz beim Entfernen der Sitzung freigegeben wird.
+    spec = importlib.util.spec_from_file_location(f"{base.__name__}__student_{student_id.replace('.', '_')}", base.__file__)
+    if spec is None:
+        return base
+    mod = importlib.util.module_from_spec(spec)
+    mod.__package__ = base.__package__
+    try:
+        exec(code, mod.__dict__)
+    except Exception as e:
+        print(f"[classroom] Assignment für {student_id} konnte nicht ausgeführt werden: {e}")
+        return entry[1] if entry is not None else None
+    session["module"] = (generation, mod)
+    return mod
+
+
+def get_student_assignment(student_id: str | None) -> ModuleType | None:
+    """Assignment-Instanz der ID; ohne ID (oder ohne Klassenraum-Modus) das gemeinsame Modul."""
+    if not student_id or not classroom_enabled():
+        return get_assignment()
+    session = _SESSIONS.get(student_id)
+    if session is None:
+        get_student_state(student_id)
+        session = _SESSIONS.get(student_id)
+        if session is None:
+            return None
+    session["last_active"] = time.monotonic()
+    return _student_module(student_id, session)
+
+
+def current_assignment() -> ModuleType | None:
+    """Assignment für den aktuellen Client-Kontext (Callbacks): pro ID im Klassenraum-Modus."""
+    if not classroom_enabled():
+        return get_assignment()
+    try:
+        from nicegui import ui
+        student_id = getattr(ui.context.client, "student_id", None)
+    except Exception:
+        student_id = None
+    return get_student_assignment(student_id)
+
+
+def group_clients_by_student(clients: list[Any]) -> dict[str, list[Any]]:
+    """Verbundene Clients nach Studierenden-ID gruppieren (Clients ohne ID werden ignoriert)."""
+    groups: dict[str, list[Any]] = {}
+    for client in clients:
+        student_id = getattr(client, "student_id", None)
+        if student_id:
+            groups.setdefault(student_id, []).append(client)
+    return groups
+
+
+def _evict_idle() -> None:
+    """Sitzungen ohne verbundenen Tab nach CLASSROOM_IDLE_EVICT_SEC speichern und freigeben."""
+    now = time.monotonic()
+    if now - _LAST_EVICT_REF[0] < 10.0:
+        return
+    _LAST_EVICT_REF[0] = now
+    idle_sec = _env_float("CLASSROOM_IDLE_EVICT_SEC", 300.0)
+    try:
+        from .tick_engine import connected_clients
+        active = set(group_clients_by_student(connected_clients()))
+    except Exception:
+        return
+    store = get_session_store()
+    with _LOCK:
+        for student_id in list(_SESSIONS):
+            session = _SESSIONS[student_id]
+            if student_id in active:
+                session["last_active"] = now
+                continue
+            if now - session["last_active"] >= idle_sec:
+                store.submit(student_id, session["state"])
+                del _SESSIONS[student_id]
+        in_memory = set(_SESSIONS)
+    store.forget_inactive(in_memory)
+
+
+def _approx_size(obj: Any, seen: set[int], depth: int = 0) -> int:
+    """Grobe Speichergröße (sys.getsizeof rekursiv); geteilte Objekte (Module, Funktionen, Klassen) zählen nicht."""
+    if id(obj) in seen or depth > 6 or isinstance(obj, (ModuleType, FunctionType, type, CodeType)):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _approx_size(k, seen, depth + 1) + _approx_size(v, seen, depth + 1)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            size += _approx_size(v, seen, depth + 1)
+    elif hasattr(obj, "nbytes"):
+        size += int(getattr(obj, "nbytes", 0) or 0)
+    return size
+
+
+def get_classroom_stats() -> dict[str, Any]:
+    """Sitzungen, geschätzte Bytes pro Studierendem (State + Modul-Globals), RSS und RSS-Zuwachs pro Sitzung."""
+    per_student: dict[str, int] = {}
+    rss_deltas: list[int] = []
+    for student_id, session in list(_SESSIONS.items()):
+        seen: set[int] = set()
+        size = _approx_size(session["state"], seen)
+        entry = session.get("module")
+        if entry is not None:
+            # __builtins__ & Co. sind geteilt → nur eigene Globals zählen
+            size += _approx_size({k: v for k, v in vars(entry[1]).items() if not k.startswith("__")}, seen)
+        per_student[student_id] = size
+        if session.get("rss_delta"):
+            rss_deltas.append(session["rss_delta"])
+    sizes = list(per_student.values())
+    return {
+        "students": len(per_student),
+        "approx_bytes_per_student": per_student,
+        "approx_bytes_avg": sum(sizes) / len(sizes) if sizes else 0.0,
+        "approx_bytes_max": max(sizes) if sizes else 0,
+        "rss_bytes": _rss_bytes(),
+        "rss_delta_avg": sum(rss_deltas) / len(rss_deltas) if rss_deltas else 0.0,
+        "store": dict(_STORE_REF[0].stats) if _STORE_REF[0] is not None else None,
+    }
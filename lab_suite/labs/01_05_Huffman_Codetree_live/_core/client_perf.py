@@ -0,0 +1,194 @@
+"""
+Browser-Telemetrie (opt-in): FPS, Long Tasks, Plot-Zeichendauer, Websocket-Rate/-Größe pro Client.
+
+Mit CLIENT_PERF_PROBE=1 setzt build_root() vor client.connected() ein kleines Script in den Head jeder
+Seite (install_probe_script; nur im initialen HTML läuft es vor dem Websocket-Aufbau). Es misst im Browser
+- FPS (requestAnimationFrame), Long Tasks (PerformanceObserver "longtask", > 50 ms),
+- Zeichendauer aller PlotlyGraphs (plotly_graph.js meldet jeden draw an window.__perfProbe),
+- Websocket-Nachrichten empfangen/gesendet pro Sekunde und Bytes pro Sekunde (WebSocket-Hülle),
+und meldet alle CLIENT_PERF_INTERVAL_SEC (Default 2 s) über die bestehende Verbindung (Event client_perf).
+
+get_client_perf() liefert die letzten Meldungen pro Client; get_perf_overview() führt sie mit den
+Tick-Kennzahlen des Servers zusammen (tick_engine.get_scheduler_stats, optional get_perf_stats des
+Assignments) – eine Sicht auf Server- und Browser-Last.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+# client.id → (Zeitpunkt time.monotonic(), Meldung)
+_REPORTS: dict[str, tuple[float, dict[str, Any]]] = {}
+# client.id → student_id (Klassenraum-Modus) für die Anzeige
+_STUDENTS: dict[str, str | None] = {}
+
+# Zahlenfelder einer Meldung (alles andere wird verworfen)
+_FIELDS = (
+    "fps",
+    "long_tasks",
+    "long_task_ms",
+    "plot_draws",
+    "plot_draw_ms_avg",
+    "plot_draw_ms_max",
+    "ws_in_msgs_per_sec",
+    "ws_in_bytes_per_sec",
+    "ws_out_msgs_per_sec",
+    "ws_out_bytes_per_sec",
+    "interval_ms",
+)
+
+
+def probe_enabled() -> bool:
+    return os.environ.get("CLIENT_PERF_PROBE", "").strip().lower() in ("1", "true", "yes")
+
+
+def report_interval_sec() -> float:
+    try:
+        return max(0.5, float(os.environ.get("CLIENT_PERF_INTERVAL_SEC", "") or 2.0))
+    except ValueError:
+        return 2.0
+
+
+def _probe_script(interval_ms: int) -> str:
+    """Script für <head>: muss vor dem Aufbau der Websocket-Verbindung laufen (WebSocket-Hülle)."""
+    return """<script>
+(function () {
+  if (window.__perfProbe) return;
+  var INTERVAL = %d;
+  var c = { frames: 0, longTasks: 0, longMs: 0, draws: 0, drawMs: 0, drawMax: 0, inMsgs: 0, inBytes: 0, outMsgs: 0, outBytes: 0 };
+  function size(d) {
+    if (typeof d === "string") return d.length;
+    if (d && typeof d.byteLength === "number") return d.byteLength;
+    if (d && typeof d.size === "number") return d.size;
+    return 0;
+  }
+  var Native = window.WebSocket;
+  if (Native) {
+    window.WebSocket = class extends Native {
+      constructor(url, protocols) {
+        super(url, protocols);
+        this.addEventListener("message", function (ev) { c.inMsgs++; c.inBytes += size(ev.data); });
+      }
+      send(data) { c.outMsgs++; c.outBytes += size(data); return super.send(data); }
+    };
+  }
+  function frame() { c.frames++; requestAnimationFrame(frame); }
+  requestAnimationFrame(frame);
+  try {
+    new PerformanceObserver(function (list) {
+      list.getEntries().forEach(function (e) { c.longTasks++; c.longMs += e.duration; });
+    }).observe({ type: "longtask", buffered: false });
+  } catch (err) { /* Browser ohne Long-Task-API */ }
+  window.__perfProbe = {
+    plotDraw: function (ms) { c.draws++; c.drawMs += ms; if (ms > c.drawMax) c.drawMax = ms; },
+  };
+  var last = performance.now();
+  setInterval(function () {
+    if (typeof emitEvent !== "function" || document.visibilityState === "hidden") return;
+    var now = performance.now();
+    var sec = Math.max(0.001, (now - last) / 1000);
+    emitEvent("client_perf", {
+      fps: c.frames / sec,
+      long_tasks: c.longTasks,
+      long_task_ms: c.longMs,
+      plot_draws: c.draws,
+      plot_draw_ms_avg: c.draws ? c.drawMs / c.draws : 0,
+      plot_draw_ms_max: c.drawMax,
+      ws_in_msgs_per_sec: c.inMsgs / sec,
+      ws_in_bytes_per_sec: c.inBytes / sec,
+      ws_out_msgs_per_sec: c.outMsgs / sec,
+      ws_out_bytes_per_sec: c.outBytes / sec,
+      interval_ms: now - last,
+    });
+    last = now;
+    for (var k in c) c[k] = 0;
+  }, INTERVAL);
+})();
+</script>""" % interval_ms
+
+
+def install_probe_script() -> None:
+    """In build_root() vor await client.connected() aufrufen: Script in den Head (nur mit CLIENT_PERF_PROBE=1)."""
+    if not probe_enabled():
+        return
+    from nicegui import ui
+    ui.add_head_html(_probe_script(int(report_interval_sec() * 1000)))
+
+
+def install_probe(client: Any) -> None:
+    """In build_root() nach connected() aufrufen: Meldungen dieses Clients annehmen (nur mit CLIENT_PERF_PROBE=1)."""
+    if not probe_enabled():
+        return
+    from nicegui import ui
+    client_id = client.id
+    student = getattr(client, "student_id", None)
+    ui.on("client_perf", lambda e: record_client_perf(client_id, e.args, student))
+
+
+def record_client_perf(client_id: str, payload: Any, student: str | None = None) -> None:
+    """Meldung eines Browsers übernehmen (nur bekannte Zahlenfelder); Clients ohne Meldung werden nicht geführt."""
+    if not isinstance(payload, dict):
+        return
+    report: dict[str, Any] = {}
+    for key in _FIELDS:
+        try:
+            report[key] = float(payload.get(key) or 0.0)
+        except (TypeError, ValueError):
+            report[key] = 0.0
+    _REPORTS[client_id] = (time.monotonic(), report)
+    _STUDENTS[client_id] = student
+
+
+def get_client_perf() -> dict[str, dict[str, Any]]:
+    """client.id → letzte Meldung (+ age_sec, student); veraltete und getrennte Clients werden entfernt."""
+    max_age = 3.0 * report_interval_sec()
+    now = time.monotonic()
+    try:
+        from nicegui import Client
+        instances = Client.instances
+    except Exception:
+        instances = None
+    out: dict[str, dict[str, Any]] = {}
+    for cid, (t, report) in list(_REPORTS.items()):
+        if now - t > max_age or (instances is not None and cid not in instances):
+            _REPORTS.pop(cid, None)
+            _STUDENTS.pop(cid, None)
+            continue
+        out[cid] = {**report, "age_sec": now - t, "student": _STUDENTS.get(cid)}
+    return out
+
+
+def get_perf_overview(server_stats: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Server- und Browser-Last in einer Sicht:
+    {"server": Tick-Kennzahlen (+ server_stats, z. B. get_perf_stats() des Assignments),
+     "clients": get_client_perf(), "summary": schlechtester FPS-Wert, Long-Task-Zeit, Websocket-Summen}.
+    """
+    from .tick_engine import get_scheduler_stats
+    server: dict[str, Any] = dict(get_scheduler_stats() or {})
+    if server_stats:
+        server.update(server_stats)
+    clients = get_client_perf()
+    reports = list(clients.values())
+    summary = {
+        "clients": len(reports),
+        "fps_min": min((r["fps"] for r in reports), default=None),
+        "long_task_ms_max": max((r["long_task_ms"] for r in reports), default=0.0),
+        "plot_draw_ms_max": max((r["plot_draw_ms_max"] for r in reports), default=0.0),
+        "ws_in_bytes_per_sec": sum(r["ws_in_bytes_per_sec"] for r in reports),
+        "ws_in_msgs_per_sec": sum(r["ws_in_msgs_per_sec"] for r in reports),
+    }
+    return {"server": server, "clients": clients, "summary": summary}
+
+
+def format_client_perf_line() -> str:
+    """Kurzfassung für die Konsole, z. B. für den [perf]-Ausdruck; leer ohne Meldungen."""
+    clients = get_client_perf()
+    if not clients:
+        return ""
+    fps = min(r["fps"] for r in clients.values())
+    draw = max(r["plot_draw_ms_max"] for r in clients.values())
+    kb = sum(r["ws_in_bytes_per_sec"] for r in clients.values()) / 1024.0
+    longt = max(r["long_task_ms"] for r in clients.values())
+    return f"Browser({len(clients)}): fps_min={fps:.0f}, draw_max={draw:.1f} ms, long_tasks={longt:.0f} ms, ws_in={kb:.1f} KB/s"
@@ -0,0 +1,75 @@
+"""
+DEBUG-MODE-Anzeige des State-Dicts: gekürzte Werte und Änderungen pro Key.
+
+Statt str(state) über das ganze Dict (lange Markdown-Antworten, große Arrays) wird jeder Wert
+einzeln und gekürzt dargestellt (DEBUG_STATE_MAX_CHARS, Default 80). format_state_view() vergleicht
+mit dem zuletzt angezeigten Stand und listet geänderte Keys zuerst (alt → neu).
+Die App rendert nur, wenn die Anzeige sichtbar ist, und höchstens alle DEBUG_STATE_INTERVAL_SEC.
+"""
+from __future__ import annotations
+
+import os
+from typing import Any
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def refresh_interval_sec() -> float:
+    """Mindestabstand zwischen zwei Aktualisierungen der Anzeige (DEBUG_STATE_INTERVAL_SEC, Default 0.5 s)."""
+    return max(0.0, _env_float("DEBUG_STATE_INTERVAL_SEC", 0.5))
+
+
+def max_value_chars() -> int:
+    return max(8, int(_env_float("DEBUG_STATE_MAX_CHARS", 80)))
+
+
+def short_repr(value: Any, max_chars: int) -> str:
+    """Gekürzte Darstellung; große Container/Arrays nur mit Typ und Größe (ohne sie zu serialisieren)."""
+    shape = getattr(value, "shape", None)
+    if shape is not None and hasattr(value, "dtype"):
+        return f"<{type(value).__name__} shape={tuple(shape)} dtype={value.dtype}>"
+    if isinstance(value, (list, tuple, dict, set)) and len(value) > 16:
+        return f"<{type(value).__name__} len={len(value)}>"
+    if isinstance(value, str) and len(value) > max_chars:
+        return repr(value[:max_chars]) + f"… ({len(value)} Zeichen)"
+    text = repr(value)
+    if len(text) > max_chars:
+        return text[:max_chars] + f"… ({len(text)} Zeichen)"
+    return text
+
+
+def _differs(a: Any, b: Any) -> bool:
+    if a is b:
+        return False
+    try:
+        return bool(a != b)
+    except Exception:
+        return True  # z. B. NumPy-Arrays unterschiedlicher Form
+
+
+def format_state_view(state: dict[str, Any], previous: dict[str, Any] | None) -> tuple[str, dict[str, Any]]:
+    """
+    Text für die Anzeige und neuer Vergleichsstand (flache Kopie von state).
+    previous=None: erste Anzeige, keine Änderungsliste.
+    """
+    max_chars = max_value_chars()
+    lines: list[str] = []
+    if previous is not None:
+        changed = [k for k in state if k not in previous or _differs(state[k], previous[k])]
+        removed = [k for k in previous if k not in state]
+        if changed or removed:
+            lines.append(f"Geändert ({len(changed) + len(removed)}):")
+            for k in changed:
+                old = short_repr(previous[k], max_chars) if k in previous else "–"
+                lines.append(f"  {k}: {old} → {short_repr(state[k], max_chars)}")
+            for k in removed:
+                lines.append(f"  {k}: entfernt")
+    lines.append(f"State (Keys = Path-IDs, {len(state)} Einträge):")
+    for k, v in state.items():
+        lines.append(f"  {k}: {short_repr(v, max_chars)}")
+    return "\n".join(lines), dict(state)
@@ -0,0 +1,137 @@
+"""
+Tick-Scheduler: driftkompensierter Takt mit budgetabhängiger Plot-Rate.
+
+- Die Fachlogik (timer_tick) läuft mit der Nennrate (TICK_TARGET_HZ bzw. TIMER_INTERVAL_SEC).
+  Fällige Zeitpunkte werden absolut fortgeschrieben (kein Aufsummieren von Verzögerungen);
+  liegt ein Tick mehr als eine Periode zurück, werden verpasste Ticks verworfen statt nachgeholt.
+- Gemessen wird die Laufzeit pro Tick (gleitender Mittelwert) gegen das Budget (= Periode).
+  Ist der Headroom negativ, werden Plot-Updates dezimiert (nur jeder N-te Tick ist ein Plot-Frame),
+  bis hinunter zu TICK_MIN_HZ. Bei genügend Reserve wird die Plot-Rate wieder erhöht.
+- Client-Sättigung: report_client_load() übernimmt die Zeichendauer der Browser (PlotlyGraph,
+  plot_stats). Braucht ein Browser pro Plot-Frame länger als der Plot-Abstand oder werden viele
+  Frames zusammengefasst, wird die Plot-Rate ebenfalls gesenkt.
+- Assignments können im Modul TICK_TARGET_HZ und TICK_MIN_HZ deklarieren (siehe user_template.py).
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# Gewicht des neuesten Messwerts im gleitenden Mittel der Tick-Dauer
+_EMA_ALPHA = 0.2
+# Mindestanzahl Ticks zwischen zwei Anpassungen des Plot-Teilers (Hysterese)
+_ADAPT_COOLDOWN_TICKS = 10
+# Plot-Rate erst wieder erhöhen, wenn die mittlere Tick-Dauer unter diesem Anteil des Budgets liegt
+_RELAX_BELOW_BUDGET = 0.5
+# Anteil zusammengefasster (nicht gezeichneter) Plot-Versionen im Browser, ab dem der Client als überlastet gilt
+_CLIENT_DROP_LIMIT = 0.2
+
+
+class TickScheduler:
+    """Driftkompensierter Taktgeber mit adaptivem Plot-Teiler (reine Logik, ohne NiceGUI)."""
+
+    def __init__(self, target_hz: float, min_hz: float | None = None) -> None:
+        self.plot_divider = 1
+        self.configure(target_hz, min_hz)
+        self._next: float | None = None
+        self._tick_index = 0
+        self._ticks_since_adapt = 0
+        self._ema_ms: float | None = None
+        self.last_ms = 0.0
+        self.missed_ticks = 0
+        self.lag_ms = 0.0
+        self.client_draw_ms = 0.0
+        self.client_drop_ratio = 0.0
+
+    def configure(self, target_hz: float, min_hz: float | None = None) -> None:
+        """Nennrate und minimale Plot-Rate setzen (z. B. wenn ein anderes Assignment aktiv wird)."""
+        self.target_hz = max(0.1, float(target_hz))
+        self.min_hz = min(self.target_hz, max(0.1, float(min_hz))) if min_hz else self.target_hz
+        self.period = 1.0 / self.target_hz
+        self.max_divider = max(1, int(round(self.target_hz / self.min_hz)))
+        self.plot_divider = min(self.plot_divider, self.max_divider)
+
+    @property
+    def budget_ms(self) -> float:
+        return self.period * 1000.0
+
+    def next_delay(self, now: float) -> float:
+        """Wartezeit bis zum nächsten fälligen Tick (Sekunden); now = time.perf_counter()."""
+        if self._next is None:
+            self._next = now
+        else:
+            self._next += self.period
+        lag = now - self._next
+        if lag > self.period:
+            # Zu spät: verpasste Ticks verwerfen (keine Warteschlange von Timer-Callbacks)
+            missed = int(math.floor(lag / self.period))
+            self.missed_ticks += missed
+            self._next += missed * self.period
+            lag = now - self._next
+        self.lag_ms = max(0.0, lag) * 1000.0
+        return max(0.0, self._next - now)
+
+    def begin_tick(self) -> bool:
+        """Tick beginnen; True = Plot-Frame (Plot-Updates werden gesendet)."""
+        plot_frame = self._tick_index % self.plot_divider == 0
+        self._tick_index += 1
+        return plot_frame
+
+    @property
+    def plot_period_ms(self) -> float:
+        """Abstand zweier Plot-Frames (ms) bei aktuellem Plot-Teiler."""
+        return self.budget_ms * self.plot_divider
+
+    def report_client_load(self, draw_ms: float, drop_ratio: float) -> None:
+        """Zeichendauer (Mittel) und Anteil zusammengefasster Frames der Browser übernehmen."""
+        self.client_draw_ms = max(0.0, float(draw_ms))
+        self.client_drop_ratio = max(0.0, float(drop_ratio))
+
+    def _client_saturated(self) -> bool:
+        return self.client_draw_ms > self.plot_period_ms or self.client_drop_ratio > _CLIENT_DROP_LIMIT
+
+    def _client_idle(self) -> bool:
+        # Bei kleinerem Teiler halbiert sich der Plot-Abstand ungefähr – dann muss der Browser noch mithalten
+        next_period_ms = self.budget_ms * max(1, self.plot_divider - 1)
+        return self.client_draw_ms < _RELAX_BELOW_BUDGET * next_period_ms and self.client_drop_ratio <= _CLIENT_DROP_LIMIT / 2
+
+    def end_tick(self, duration_sec: float) -> None:
+        """Laufzeit des Ticks erfassen und Plot-Teiler anpassen."""
+        ms = duration_sec * 1000.0
+        self.last_ms = ms
+        self._ema_ms = ms if self._ema_ms is None else (1 - _EMA_ALPHA) * self._ema_ms + _EMA_ALPHA * ms
+        self._ticks_since_adapt += 1
+        if self._ticks_since_adapt < _ADAPT_COOLDOWN_TICKS:
+            return
+        overloaded = self._ema_ms > self.budget_ms or self._client_saturated()
+        if overloaded and self.plot_divider < self.max_divider:
+            self.plot_divider += 1
+            self._ticks_since_adapt = 0
+        elif (
+            not overloaded
+            and self._ema_ms < _RELAX_BELOW_BUDGET * self.budget_ms
+            and self._client_idle()
+            and self.plot_divider > 1
+        ):
+            self.plot_divider -= 1
+            self._ticks_since_adapt = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Kennzahlen für Perf-Anzeige: Raten, Laufzeit, Budget, Headroom, verpasste Ticks."""
+        avg_ms = self._ema_ms or 0.0
+        headroom_ms = self.budget_ms - avg_ms
+        return {
+            "target_hz": self.target_hz,
+            "min_hz": self.min_hz,
+            "plot_hz": self.target_hz / self.plot_divider,
+            "plot_divider": self.plot_divider,
+            "last_ms": self.last_ms,
+            "avg_ms": avg_ms,
+            "budget_ms": self.budget_ms,
+            "headroom_ms": headroom_ms,
+            "headroom_pct": headroom_ms / self.budget_ms * 100.0 if self.budget_ms > 0 else 100.0,
+            "lag_ms": self.lag_ms,
+            "missed_ticks": self.missed_ticks,
+            "client_draw_ms": self.client_draw_ms,
+            "client_drop_ratio": self.client_drop_ratio,
+        }
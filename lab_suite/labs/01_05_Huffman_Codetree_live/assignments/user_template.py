@@ -16,9 +16,10 @@ Stand get() / set() / update_plot():
 - Wenn SEMANTIC_BINDING korrekt befüllt ist (user_id pro Widget gesetzt), reicht
   get("power"), set("led_status", "on"), update_plot("sine_plot", data) etc.
 
-Timer: Die App startet einen Timer (einstellbare Rate, z. B. 10 Hz) und ruft
-timer_tick() in diesem Modul auf, falls vorhanden. So können Plots/Logik periodisch
-laufen, unabhängig von Button-Callbacks.
+Timer: Die App startet einen gemeinsamen Timer pro App-Prozess (tick_engine, einstellbare
+Rate, z. B. 10 Hz) und ruft timer_tick() in diesem Modul einmal pro Periode auf, falls
+vorhanden; set()/update_plot() wirken dabei auf alle offenen Tabs. So können Plots/Logik
+periodisch laufen, unabhängig von Button-Callbacks.
 
 Performance: ENABLE_PERF_STATS=True oder DEBUG_PERF=1 aktiviert Laufzeit-Messung
 (perf_counter) und optional Prozess-CPU (psutil). Budget = Timer-Intervall;
@@ -10,47 +10,269 @@ Hier findet die Kopplung zwischen User-Logik und GUI statt. Statt path_ids
   Dann wird das Binding automatisch erzeugt – kein manuelles Dict nötig.
 - get(key): Liest den aktuellen Wert aus dem State.
 - set(key, value): Schreibt in State und aktualisiert Output-Widgets (LED, VU-Meter) über die Registry.
+- broadcast(clients): Während eines gemeinsamen Ticks (tick_engine) wirken set()/update_plot()
+  auf alle übergebenen Clients statt nur auf den aktuellen Client-Kontext.
+- plot_frame(enabled): Vom Tick-Scheduler gesetzt; außerhalb von Plot-Frames werden update_plot()-Aufrufe
+  verworfen (Plot-Rate wird bei Überlast dezimiert, Fachlogik läuft weiter mit Nennrate).
+- Änderungserkennung: set() aktualisiert ein Widget nur, wenn sich der angezeigte Wert geändert hat
+  (Strings per Gleichheit, Zahlen optional mit Totband: set_deadband(key, rel=0.005)).
+  Unterdrückte Updates zählt SET_STATS; Überblick: get_binding_stats().
+- append_plot(key, trace_idx, x, y, max_points): Strip-Chart – nur neue Samples an eine Trace anhängen
+  (PlotlyGraph.append_samples, Ringpuffer im Browser). Wird nicht dezimiert (sonst fehlen Samples).
+- push_row(key, row_db): Wasserfall/Spektrogramm – eine neue dB-Zeile senden (Waterfall.push_rows,
+  uint8-quantisiert); wie append_plot nicht dezimiert.
+- batch(): Anzeige-Updates sammeln und am Ende einmal pro Element ausführen (letzter Wert gewinnt);
+  State wird sofort geschrieben. append_plot-Blöcke werden pro Trace verkettet, push_row-Zeilen gesammelt. Tick-Engine und call_assignment() legen batch() um jeden Aufruf.
+- recording(state) / apply_ops(ops): Im Worker-Prozess (isolation) zeichnen set()/update_plot()
+  nur auf (reine Daten); der UI-Prozess spielt die Operationen mit apply_ops() ein.
 
 Analogie Qt: Wie QObject.property(name) / setProperty(name, value); user_id = logischer Name.
 """
 from __future__ import annotations
 
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
 
 
 # Logischer Name (fachliche Größe) → path_id. Wird bei App-Start aus Layout (props.user_id) befüllt;
 # du kannst zusätzlich Einträge hier setzen (bleiben erhalten, wenn update_binding_from_layout(merge=True)).
 SEMANTIC_BINDING: dict[str, str] = {}
 
+# Ziel-Clients während eines gemeinsamen Ticks (None = aktueller Client aus ui.context)
+_BROADCAST_CLIENTS_REF: list = [None]
+# False = aktueller Tick ist kein Plot-Frame (Scheduler dezimiert Plot-Updates)
+_PLOT_FRAME_REF: list = [True]
+# Anzahl verworfener update_plot-Aufrufe (Dezimierung)
+PLOT_STATS: dict[str, int] = {"suppressed": 0}
+# Worker-Prozess: {"state": path_id → Wert, "ops": [...]} statt GUI-Zugriff (None = normaler GUI-Modus)
+_RECORDER_REF: list = [None]
+# Aktiver batch(): id(Widget) bzw. (id(Widget), "append") → [Widget, Art, Argumente] (None = Updates sofort ausführen)
+_BATCH_REF: list = [None]
+# Zähler: angeforderte vs. tatsächlich ausgeführte Anzeige-Updates (Batching)
+BATCH_STATS: dict[str, int] = {"requested": 0, "flushed": 0}
+# Totband pro fachlichem Key: key → (relativ, absolut); Zahlwerte innerhalb gelten als unverändert
+DEADBAND: dict[str, tuple[float, float]] = {}
+# Zähler der Änderungserkennung: gesendet / unterdrückt (gesamt und pro Key)
+SET_STATS: dict[str, Any] = {"sent": 0, "suppressed": 0, "suppressed_by_key": {}}
+# Attribut am Widget: zuletzt angezeigter Wert (stirbt mit dem Widget, kein globales Dict)
+_LAST_SENT_ATTR = "_gui_binding_last_sent"
+_NOTHING = object()
 
-def update_binding_from_layout(layout: dict, merge: bool = False) -> None:
+
+def update_binding_from_layout(layout: dict, merge: bool = False, collected: dict[str, str] | None = None) -> None:
     """
     Befüllt SEMANTIC_BINDING aus dem Layout: für jedes Widget mit props.user_id (nicht leer)
     wird user_id → path_id eingetragen. Bei merge=True bleiben bestehende Einträge erhalten;
     bei merge=False (Default) wird das Dict zuerst geleert (Layout ist dann die einzige Quelle).
+    collected: bereits berechnetes Binding (z. B. LayoutIndex.semantic_binding) – spart die Traversierung.
     """
-    from app_builder import collect_semantic_binding
-    collected = collect_semantic_binding(layout)
+    if collected is None:
+        from app_builder import collect_semantic_binding
+        collected = collect_semantic_binding(layout)
+    if not merge and SEMANTIC_BINDING == collected:
+        return  # Reconnect / weiterer Tab: Binding unverändert
     if not merge:
         SEMANTIC_BINDING.clear()
     SEMANTIC_BINDING.update(collected)
 
 
+def _state_and_registries_of(client: Any) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
+    """State, Widget-Registry und State-Input-Registry eines NiceGUI-Clients."""
+    if client is None:
+        return None, None, None
+    state = getattr(client, "state", None)
+    registry = getattr(client, "widget_registry", None)
+    state_input_registry = getattr(client, "state_input_registry", None)
+    return state, registry, state_input_registry
+
+
 def _client_state_and_registry() -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
     """State, Widget-Registry und State-Input-Registry aus dem aktuellen Client-Kontext (NiceGUI)."""
+    clients = _BROADCAST_CLIENTS_REF[0]
+    if clients is not None:
+        return _state_and_registries_of(clients[0]) if clients else (None, None, None)
     try:
         from nicegui import ui
-        client = ui.context.client
-        if client is None:
-            return None, None, None
-        state = getattr(client, "state", None)
-        registry = getattr(client, "widget_registry", None)
-        state_input_registry = getattr(client, "state_input_registry", None)
-        return state, registry, state_input_registry
+        return _state_and_registries_of(ui.context.client)
     except Exception:
         return None, None, None
 
 
+def _target_contexts() -> list[tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]]:
+    """Alle Ziele für Setter: im broadcast alle Clients, sonst nur der aktuelle Client."""
+    clients = _BROADCAST_CLIENTS_REF[0]
+    if clients is not None:
+        return [_state_and_registries_of(c) for c in clients]
+    return [_client_state_and_registry()]
+
+
+@contextmanager
+def broadcast(clients: Iterable[Any]) -> Iterator[None]:
+    """
+    Setter (set, update_plot, clear_markdown) innerhalb des with-Blocks an alle clients verteilen.
+    Wird von der Tick-Engine um timer_tick() gelegt; get() liest aus dem State des ersten Clients.
+    """
+    prev = _BROADCAST_CLIENTS_REF[0]
+    _BROADCAST_CLIENTS_REF[0] = list(clients)
+    try:
+        yield
+    finally:
+        _BROADCAST_CLIENTS_REF[0] = prev
+
+
+@contextmanager
+def plot_frame(enabled: bool) -> Iterator[None]:
+    """update_plot() innerhalb des with-Blocks nur ausführen, wenn enabled (Plot-Frame des Schedulers)."""
+    prev = _PLOT_FRAME_REF[0]
+    _PLOT_FRAME_REF[0] = bool(enabled)
+    try:
+        yield
+    finally:
+        _PLOT_FRAME_REF[0] = prev
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    Anzeige-Updates (set, update_plot) im with-Block sammeln und beim Verlassen einmal pro Element
+    ausführen (letzter Wert gewinnt). Verschachtelt: nur der äußerste Block führt aus.
+    """
+    if _BATCH_REF[0] is not None:
+        yield
+        return
+    pending: dict[int, list] = {}
+    _BATCH_REF[0] = pending
+    try:
+        yield
+    finally:
+        _BATCH_REF[0] = None
+        _flush(pending)
+
+
+def _flush(pending: dict[int, list]) -> None:
+    for w, kind, args in pending.values():
+        BATCH_STATS["flushed"] += 1
+        try:
+            _apply(w, kind, args)
+        except Exception:
+            pass  # z. B. Client inzwischen getrennt
+
+
+def _apply(w: Any, kind: str, args: Any) -> None:
+    """Ein Anzeige-Update ausführen (Widget-Setter bzw. .value + update())."""
+    if kind == "state":
+        w.set_state(args)
+    elif kind == "value":
+        w.set_value(args)
+    elif kind == "content":
+        w.set_content(args)
+    elif kind == "input":
+        w.value = args
+        if hasattr(w, "update"):
+            w.update()
+    elif kind == "plot":
+        data, layout, config, restyle_only = args
+        w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
+    elif kind == "append":
+        # trace_idx → [x-Blöcke, y-Blöcke, max_points]
+        for trace_idx, (xs, ys, max_points) in args.items():
+            w.append_samples(trace_idx, _concat(xs), _concat(ys), max_points)
+    elif kind == "rows":
+        w.push_rows(args)
+
+
+def _concat(chunks: list) -> Any:
+    """Gesammelte append_plot-Blöcke zu einem Array verbinden (None: kein x)."""
+    if len(chunks) == 1 or chunks[0] is None:
+        return chunks[0]
+    import numpy as np
+    return np.concatenate([np.asarray(c) for c in chunks])
+
+
+def _emit(w: Any, kind: str, args: Any) -> None:
+    """Update sofort ausführen oder im aktiven batch() vormerken (pro Element letzter Wert)."""
+    BATCH_STATS["requested"] += 1
+    pending = _BATCH_REF[0]
+    if pending is None:
+        BATCH_STATS["flushed"] += 1
+        _apply(w, kind, args)
+        return
+    if kind == "append":
+        # Anhängen summiert sich (kein letzter-Wert-gewinnt): Blöcke pro Trace sammeln
+        entry = pending.get((id(w), "append"))
+        if entry is None:
+            pending[(id(w), "append")] = [w, kind, {i: [list(c[0]), list(c[1]), c[2]] for i, c in args.items()}]
+            return
+        for i, (xs, ys, max_points) in args.items():
+            acc = entry[2].setdefault(i, [[], [], max_points])
+            acc[0].extend(xs)
+            acc[1].extend(ys)
+            acc[2] = max_points
+        return
+    if kind == "rows":
+        # Wasserfall: jede Zeile zählt – in Reihenfolge anhängen
+        entry = pending.get(id(w))
+        if entry is None:
+            pending[id(w)] = [w, kind, list(args)]
+        else:
+            entry[2].extend(args)
+        return
+    if kind == "plot":
+        # Volles Figure-Update ersetzt vorher gesammelte Samples desselben Widgets
+        pending.pop((id(w), "append"), None)
+    prev = pending.get(id(w))
+    if kind == "plot" and prev is not None:
+        # Layout/Config eines früheren Updates nicht verlieren, wenn das spätere nur restyle ist
+        _, p_layout, p_config, p_restyle = prev[2]
+        data, layout, config, restyle_only = args
+        args = (
+            data,
+            layout if layout is not None else p_layout,
+            config if config is not None else p_config,
+            restyle_only and p_restyle,
+        )
+    pending[id(w)] = [w, kind, args]
+
+
+@contextmanager
+def recording(state: dict[str, Any]) -> Iterator[list[tuple]]:
+    """
+    Aufzeichnungsmodus für den Worker-Prozess: get() liest aus state (Snapshot der gebundenen Werte),
+    set()/update_plot() hängen Operationen an die gelieferte Liste an, ohne GUI-Zugriff.
+    """
+    prev = _RECORDER_REF[0]
+    rec: dict[str, Any] = {"state": state, "ops": []}
+    _RECORDER_REF[0] = rec
+    try:
+        yield rec["ops"]
+    finally:
+        _RECORDER_REF[0] = prev
+
+
+def bound_state_snapshot() -> dict[str, Any]:
+    """path_id → Wert für alle gebundenen Keys (SEMANTIC_BINDING) aus dem State des aktuellen Kontexts."""
+    state, _, _ = _client_state_and_registry()
+    if state is None:
+        return {}
+    return {pid: state.get(pid) for pid in SEMANTIC_BINDING.values() if pid in state}
+
+
+def apply_ops(ops: Iterable[tuple]) -> None:
+    """Im Worker aufgezeichnete Operationen (set, update_plot, append_plot, push_row) im UI-Prozess ausführen."""
+    for op in ops:
+        kind = op[0]
+        if kind == "set":
+            set(op[1], op[2])
+        elif kind == "update_plot":
+            _, key, data, layout, config, fallback_to_any, restyle_only = op
+            update_plot(key, data, layout, config, fallback_to_any=fallback_to_any, restyle_only=restyle_only)
+        elif kind == "append_plot":
+            _, key, trace_idx, x, y, max_points, fallback_to_any = op
+            append_plot(key, trace_idx, x, y, max_points, fallback_to_any=fallback_to_any)
+        elif kind == "push_row":
+            push_row(op[1], op[2])
+
+
 def get(key: str, default: Any = None) -> Any:
     """
     Liest den Wert der fachlichen Größe key (über SEMANTIC_BINDING → path_id → state).
@@ -59,12 +281,60 @@ def get(key: str, default: Any = None) -> Any:
     path_id = SEMANTIC_BINDING.get(key)
     if not path_id:
         return default
+    rec = _RECORDER_REF[0]
+    if rec is not None:
+        return rec["state"].get(path_id, default)
     state, _, _ = _client_state_and_registry()
     if state is None:
         return default
     return state.get(path_id, default)
 
 
+def set_deadband(key: str, rel: float = 0.0, abs_: float = 0.0) -> None:
+    """
+    Totband für numerische Anzeigen (z. B. VU-Meter): neuer Wert wird nur gesendet, wenn
+    |neu - alt| > max(rel * |alt|, abs_). rel=0 und abs_=0 entfernt das Totband (exakter Vergleich).
+    """
+    if rel <= 0 and abs_ <= 0:
+        DEADBAND.pop(key, None)
+    else:
+        DEADBAND[key] = (max(0.0, rel), max(0.0, abs_))
+
+
+def get_binding_stats() -> dict[str, Any]:
+    """Zähler: unterdrückte/gesendete set()-Updates, Batching, dezimierte Plot-Updates."""
+    return {
+        "set_sent": SET_STATS["sent"],
+        "set_suppressed": SET_STATS["suppressed"],
+        "set_suppressed_by_key": dict(SET_STATS["suppressed_by_key"]),
+        "batch_requested": BATCH_STATS["requested"],
+        "batch_flushed": BATCH_STATS["flushed"],
+        "plots_suppressed": PLOT_STATS["suppressed"],
+    }
+
+
+def _unchanged(w: Any, key: str, value: Any) -> bool:
+    """True, wenn w bereits value anzeigt (bzw. innerhalb des Totbands); sonst value als gesendet merken."""
+    last = getattr(w, _LAST_SENT_ATTR, _NOTHING)
+    if last is not _NOTHING:
+        if isinstance(value, float) and isinstance(last, float) and key in DEADBAND:
+            rel, abs_ = DEADBAND[key]
+            same = abs(value - last) <= max(rel * abs(last), abs_)
+        else:
+            same = type(value) is type(last) and value == last
+        if same:
+            SET_STATS["suppressed"] += 1
+            by_key = SET_STATS["suppressed_by_key"]
+            by_key[key] = by_key.get(key, 0) + 1
+            return True
+    try:
+        setattr(w, _LAST_SENT_ATTR, value)
+    except Exception:
+        pass  # Widget ohne Attribut-Zugriff → immer senden
+    SET_STATS["sent"] += 1
+    return False
+
+
 def set(key: str, value: Any) -> None:
     """
     Setzt die fachliche Größe key: schreibt in State und aktualisiert die Anzeige.
@@ -75,27 +345,39 @@ def set(key: str, value: Any) -> None:
     path_id = SEMANTIC_BINDING.get(key)
     if not path_id:
         return
-    state, registry, state_input_registry = _client_state_and_registry()
+    rec = _RECORDER_REF[0]
+    if rec is not None:
+        rec["state"][path_id] = value
+        rec["ops"].append(("set", key, value))
+        return
     str_value = str(value) if value is not None else ""
-    if state is not None:
-        state[path_id] = value
-    if registry is not None and path_id in registry:
-        w = registry[path_id]
-        if hasattr(w, "set_state"):
-            w.set_state(value)
-        elif hasattr(w, "set_value"):
-            try:
-                w.set_value(float(value))
-            except (TypeError, ValueError):
-                pass
-        elif hasattr(w, "set_content"):
-            w.set_content(str_value)
-    if state_input_registry is not None and path_id in state_input_registry:
-        inp = state_input_registry[path_id]
-        if hasattr(inp, "value"):
-            inp.value = str_value
-            if hasattr(inp, "update"):
-                inp.update()
+    for state, registry, state_input_registry in _target_contexts():
+        if state is not None:
+            state[path_id] = value
+        if registry is not None and path_id in registry:
+            w = registry[path_id]
+            if hasattr(w, "set_state"):
+                if not _unchanged(w, key, value):
+                    _emit(w, "state", value)
+            elif hasattr(w, "set_value"):
+                try:
+                    num = float(value)
+                except (TypeError, ValueError):
+                    num = None
+                if num is not None and not _unchanged(w, key, num):
+                    _emit(w, "value", num)
+            elif hasattr(w, "set_content"):
+                if not _unchanged(w, key, str_value):
+                    _emit(w, "content", str_value)
+        if state_input_registry is not None and path_id in state_input_registry:
+            inp = state_input_registry[path_id]
+            if hasattr(inp, "value"):
+                # Vergleich mit dem aktuellen Inhalt (der Nutzer kann die Textarea selbst ändern)
+                if inp.value == str_value:
+                    SET_STATS["suppressed"] += 1
+                else:
+                    SET_STATS["sent"] += 1
+                    _emit(inp, "input", str_value)
 
 
 def clear_markdown(key: str) -> None:
@@ -119,14 +401,38 @@ def update_plot(
     Aktualisiert ein Plotly-Widget über die User-ID (key).
     key muss im Layout als user_id des Plot-Widgets gesetzt sein (SEMANTIC_BINDING).
     data: Liste von Traces (dict mit x, y, mode, …); x/y dürfen Listen oder NumPy-Arrays sein.
+    Feste x-Achse (Zeit, Frequenz): statt x besser x0/dx (gleichmäßig) oder "x_axis_id" (siehe
+    register_plot_axis) – dann geht pro Update nur y an den Browser.
     restyle_only: Bei True nur x/y per restyle (weniger Daten, oft flüssiger bei Animation).
     fallback_to_any: Wenn key nicht gebunden ist, erstes Plotly-Widget in der Registry nutzen (Default True).
     Nur in GUI-Kontext aufrufen (Callbacks, Timer).
     """
+    if not _PLOT_FRAME_REF[0]:
+        PLOT_STATS["suppressed"] += 1
+        return
+    rec = _RECORDER_REF[0]
+    if rec is not None:
+        rec["ops"].append(("update_plot", key, data, layout, config, fallback_to_any, restyle_only))
+        return
     import os as _os
     _debug = _os.environ.get("DEBUG_GUI_BINDING", "").strip().lower() in ("1", "true", "yes")
     path_id = SEMANTIC_BINDING.get(key)
-    _, registry, _ = _client_state_and_registry()
+    for _, registry, _ in _target_contexts():
+        _update_plot_in(registry, key, path_id, data, layout, config, fallback_to_any, restyle_only, _debug)
+
+
+def _update_plot_in(
+    registry: dict[str, Any] | None,
+    key: str,
+    path_id: str | None,
+    data: Any,
+    layout: dict[str, Any] | None,
+    config: dict[str, Any] | None,
+    fallback_to_any: bool,
+    restyle_only: bool,
+    _debug: bool,
+) -> None:
+    """update_plot für eine einzelne Widget-Registry (ein Client)."""
     if registry is None:
         if _debug:
             print("[update_plot] widget_registry ist None (kein GUI-Kontext?)")
@@ -140,13 +446,72 @@ def update_plot(
         if fallback_to_any:
             for pid, w in registry.items():
                 if hasattr(w, "update_figure"):
-                    w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
+                    _emit(w, "plot", (data, layout, config, restyle_only))
                     if _debug and not path_id:
                         print(f"[update_plot] Fallback: erstes Plotly-Widget {pid!r} aktualisiert (setze user_id={key!r} für feste Zuordnung)")
                     return
         return
     w = registry[path_id]
     if hasattr(w, "update_figure"):
-        w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
+        _emit(w, "plot", (data, layout, config, restyle_only))
     elif _debug:
         print(f"[update_plot] Widget {path_id!r} hat keine update_figure-Methode")
+
+
+def register_plot_axis(axis_id: str, x: Any) -> bool:
+    """
+    x-Achse einmalig registrieren (z. B. Frequenz-Bins eines Spektrums); Traces in update_plot
+    verweisen mit "x_axis_id": axis_id statt x darauf. Jeder Plot bekommt x nur beim ersten Mal und
+    nach einer Änderung (erneuter Aufruf mit anderen Werten). True = Achse neu oder geändert.
+    """
+    from widgets.plotly_graph import register_axis
+    return register_axis(axis_id, x)
+
+
+def append_plot(
+    key: str,
+    trace_idx: int,
+    x: Any,
+    y: Any,
+    max_points: int | None = None,
+    *,
+    fallback_to_any: bool = True,
+) -> None:
+    """
+    Hängt neue Samples an Trace trace_idx des Plotly-Widgets (user_id = key) an – für rollende
+    Zeitplots (Strip-Chart). Übertragen werden nur die neuen Werte; max_points begrenzt die Trace
+    (ältere Punkte fallen heraus). x=None: nur y anhängen. x/y: Listen oder NumPy-Arrays.
+    Anders als update_plot() nicht durch Plot-Frames dezimiert: jedes Sample kommt an.
+    """
+    rec = _RECORDER_REF[0]
+    if rec is not None:
+        rec["ops"].append(("append_plot", key, trace_idx, x, y, max_points, fallback_to_any))
+        return
+    path_id = SEMANTIC_BINDING.get(key)
+    args = {int(trace_idx): [[x], [y], max_points]}
+    for _, registry, _ in _target_contexts():
+        if registry is None:
+            continue
+        w = registry.get(path_id) if path_id else None
+        if w is None and fallback_to_any:
+            w = next((v for v in registry.values() if hasattr(v, "append_samples")), None)
+        if w is not None and hasattr(w, "append_samples"):
+            _emit(w, "append", args)
+
+
+def push_row(key: str, row_db: Any) -> None:
+    """
+    Schiebt eine neue Spektrumzeile (dB-Werte, Liste oder NumPy-Array) in das Wasserfall-Widget
+    (user_id = key). Übertragen wird nur diese Zeile (uint8-quantisiert); der Browser scrollt und färbt ein.
+    """
+    path_id = SEMANTIC_BINDING.get(key)
+    if not path_id:
+        return
+    rec = _RECORDER_REF[0]
+    if rec is not None:
+        rec["ops"].append(("push_row", key, row_db))
+        return
+    for _, registry, _ in _target_contexts():
+        w = registry.get(path_id) if registry is not None else None
+        if w is not None and hasattr(w, "push_rows"):
+            _emit(w, "rows", [row_db])
@@ -0,0 +1,288 @@
+"""
+Prozess-Isolation für Studierenden-Code (timer_tick, solve_task).
+
+Optionaler Ausführungsmodus (ASSIGNMENT_ISOLATION=process): Das aktive Assignment läuft in
+einem Worker-Prozess statt auf dem NiceGUI-Event-Loop. Eine langsame FFT oder ein versehentliches
+`while True` friert dann nicht mehr UI und Websocket aller Clients ein.
+
+- Pro Aufruf wird ein Snapshot der gebundenen Werte (gui_binding.bound_state_snapshot) gesendet;
+  der Worker führt die Funktion im gui_binding.recording()-Modus aus und liefert die Operationen
+  (set, update_plot) als reine Daten zurück. Der UI-Prozess spielt sie mit gui_binding.apply_ops() ein.
+- Deadline pro Tick (TICK_DEADLINE_SEC, Default = TIMER_INTERVAL_SEC): Überschreitungen werden gezählt.
+- Watchdog: Antwortet der Worker nicht innerhalb WORKER_KILL_AFTER_SEC (Default 2 s), wird er
+  beendet und beim nächsten Aufruf neu gestartet.
+- Frame-Skipping: Ist der Worker noch beschäftigt, wird der Tick übersprungen (keine Warteschlange).
+- Fehler im Studierenden-Code werden mit Traceback ausgegeben (gleicher Fehler nur einmal).
+
+Im Klassenraum-Modus (CLASSROOM_MODE=1) ist die Isolation aus: dort hat jede Studierenden-ID
+eine eigene Modul-Instanz im UI-Prozess (classroom).
+
+Ohne ASSIGNMENT_ISOLATION läuft alles wie bisher im UI-Prozess (call_assignment ruft direkt auf).
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+import traceback
+from typing import Any
+
+from . import gui_binding
+from .assignment_registry import _parent_package, get_assignment
+from .classroom import classroom_enabled, current_assignment
+
+# Letzte ausgegebene Fehlermeldung (gleicher Fehler bei 10 Hz nur einmal drucken)
+_LAST_ERROR_REF: list = [None]
+# Singleton-Runner (None = noch nicht erzeugt / Isolation aus)
+_RUNNER_REF: list = [None]
+# Start des Workers (Import von App-Paket + Assignment) zählt nicht zur Tick-Deadline
+_WORKER_START_TIMEOUT_SEC = 30.0
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def isolation_enabled() -> bool:
+    return os.environ.get("ASSIGNMENT_ISOLATION", "").strip().lower() in ("process", "1", "true", "yes")
+
+
+def report_assignment_error(where: str, text: str) -> None:
+    """Fehler aus Studierenden-Code ausgeben; identische Wiederholungen werden unterdrückt."""
+    if text == _LAST_ERROR_REF[0]:
+        return
+    _LAST_ERROR_REF[0] = text
+    print(f"[assignment] Fehler in {where}:\n{text}")
+
+
+def _worker_main(conn: Any, env: dict[str, str]) -> None:
+    """Einstieg im Worker-Prozess: Aufträge (seq, entry, state, binding, plot_frame) abarbeiten bis None kommt."""
+    os.environ.update(env)
+    try:
+        get_assignment()  # Assignment vorab importieren; Startzeit zählt nicht zur Deadline
+    except Exception:
+        pass
+    conn.send((0, [], None, (None, None)))  # bereit
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            return
+        if msg is None:
+            return
+        seq, entry, state, binding, is_plot_frame = msg
+        gui_binding.SEMANTIC_BINDING.clear()
+        gui_binding.SEMANTIC_BINDING.update(binding)
+        err = None
+        rates = (None, None)
+        with gui_binding.plot_frame(is_plot_frame), gui_binding.recording(state) as ops:
+            try:
+                mod = get_assignment()
+                if mod is not None:
+                    rates = (getattr(mod, "TICK_TARGET_HZ", None), getattr(mod, "TICK_MIN_HZ", None))
+                fn = getattr(mod, entry, None) if mod is not None else None
+                if fn is not None:
+                    fn()
+            except BaseException:
+                err = traceback.format_exc()
+        try:
+            conn.send((seq, ops, err, rates))
+        except Exception:
+            # z. B. nicht picklebare Objekte in update_plot-Daten
+            conn.send((seq, [], traceback.format_exc(), rates))
+
+
+class IsolatedRunner:
+    """Worker-Prozess mit Deadline, Überlauf-Zählung, Watchdog (Kill/Restart) und Frame-Skipping."""
+
+    def __init__(self, deadline_sec: float, kill_after_sec: float) -> None:
+        self.deadline_sec = max(0.001, deadline_sec)
+        self.kill_after_sec = max(self.deadline_sec, kill_after_sec)
+        self._ctx = multiprocessing.get_context("spawn")
+        self._proc: Any = None
+        self._conn: Any = None
+        self._seq = 0
+        self._lock = asyncio.Lock()
+        # (TICK_TARGET_HZ, TICK_MIN_HZ) des Assignments im Worker (für den Tick-Scheduler)
+        self.rates: tuple[Any, Any] = (None, None)
+        self.stats: dict[str, Any] = {
+            "calls": 0,
+            "completed": 0,
+            "overruns": 0,
+            "skipped": 0,
+            "restarts": 0,
+            "errors": 0,
+            "last_ms": 0.0,
+        }
+
+    async def _ensure_started(self) -> bool:
+        """Worker bei Bedarf (neu) starten und auf die Bereit-Meldung warten."""
+        if self._proc is not None and self._proc.is_alive():
+            return True
+        if self._proc is not None:
+            self.stats["restarts"] += 1  # Worker unerwartet beendet
+            self._close()
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        env = {k: v for k, v in os.environ.items() if k in ("USE_SUBMISSIONS", "TIMER_INTERVAL_SEC")}
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, env),
+            name=f"assignment-worker-{_parent_package() or 'app'}",
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        self._proc = proc
+        self._conn = parent_conn
+        try:
+            ready = await asyncio.to_thread(parent_conn.poll, _WORKER_START_TIMEOUT_SEC)
+            if ready:
+                parent_conn.recv()
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            report_assignment_error("worker", "Worker-Prozess konnte nicht gestartet werden.")
+            self._close()
+        return bool(ready)
+
+    def _close(self) -> None:
+        if self._proc is not None and self._proc.is_alive():
+            self._proc.kill()
+            self._proc.join(timeout=1.0)
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._proc = None
+        self._conn = None
+
+    def stop(self) -> None:
+        """Worker sauber beenden (App-Shutdown)."""
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except Exception:
+                pass
+        if self._proc is not None:
+            self._proc.join(timeout=1.0)
+        self._close()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def run(
+        self,
+        entry: str,
+        state: dict[str, Any],
+        *,
+        skip_if_busy: bool = False,
+        is_plot_frame: bool = True,
+    ) -> list[tuple] | None:
+        """
+        entry (z. B. "timer_tick") im Worker ausführen; liefert die aufgezeichneten Operationen
+        oder None (übersprungen, Fehler, Watchdog-Kill).
+        skip_if_busy=True: Frame-Skipping für Timer-Ticks, wenn der vorige Aufruf noch läuft.
+        is_plot_frame=False: update_plot() wird schon im Worker verworfen (Scheduler-Dezimierung).
+        """
+        if skip_if_busy and self.busy:
+            self.stats["skipped"] += 1
+            return None
+        async with self._lock:
+            if not await self._ensure_started():
+                return None
+            self._seq += 1
+            seq = self._seq
+            self.stats["calls"] += 1
+            t0 = time.perf_counter()
+            try:
+                self._conn.send((seq, entry, state, dict(gui_binding.SEMANTIC_BINDING), is_plot_frame))
+                ready = await asyncio.to_thread(self._conn.poll, self.deadline_sec)
+                if not ready:
+                    self.stats["overruns"] += 1
+                    ready = await asyncio.to_thread(self._conn.poll, self.kill_after_sec - self.deadline_sec)
+                if not ready:
+                    report_assignment_error(
+                        entry,
+                        f"Keine Antwort nach {self.kill_after_sec:.1f} s – Worker wird neu gestartet (Endlosschleife?).",
+                    )
+                    self.stats["restarts"] += 1
+                    self._close()
+                    return None
+                while True:
+                    r_seq, ops, err, rates = self._conn.recv()
+                    if r_seq == seq:
+                        break
+                self.rates = rates
+            except (EOFError, OSError):
+                self.stats["restarts"] += 1
+                self._close()  # Worker abgestürzt → Neustart beim nächsten Aufruf
+                return None
+            self.stats["last_ms"] = (time.perf_counter() - t0) * 1000.0
+            self.stats["completed"] += 1
+            if err:
+                self.stats["errors"] += 1
+                report_assignment_error(entry, err)
+            return ops
+
+
+def get_runner() -> IsolatedRunner | None:
+    """Singleton-Runner, falls ASSIGNMENT_ISOLATION aktiv ist (und kein Klassenraum-Modus); sonst None."""
+    if not isolation_enabled() or classroom_enabled():
+        return None
+    if _RUNNER_REF[0] is None:
+        interval = _env_float("TIMER_INTERVAL_SEC", 0.1)
+        deadline = _env_float("TICK_DEADLINE_SEC", interval if interval > 0 else 0.1)
+        kill_after = _env_float("WORKER_KILL_AFTER_SEC", 2.0)
+        runner = IsolatedRunner(deadline, kill_after)
+        _RUNNER_REF[0] = runner
+        try:
+            from nicegui import app
+            app.on_shutdown(runner.stop)
+        except Exception:
+            pass
+    return _RUNNER_REF[0]
+
+
+def get_isolation_stats() -> dict[str, Any] | None:
+    """Zähler des Workers (calls, completed, overruns, skipped, restarts, errors, last_ms) oder None."""
+    runner = _RUNNER_REF[0]
+    return dict(runner.stats) if runner is not None else None
+
+
+async def _run_and_apply(runner: IsolatedRunner, entry: str, state: dict[str, Any]) -> None:
+    ops = await runner.run(entry, state)
+    if ops:
+        from .tick_engine import connected_clients
+        with gui_binding.broadcast(connected_clients()), gui_binding.batch():
+            gui_binding.apply_ops(ops)
+
+
+def call_assignment(entry: str = "solve_task") -> None:
+    """
+    Funktion entry des aktiven Assignments aus einem Callback aufrufen (z. B. in user_callbacks.py).
+    Mit Isolation: asynchron im Worker, Ergebnis wird an alle Clients verteilt. Sonst: direkter Aufruf.
+    """
+    runner = get_runner()
+    if runner is None:
+        mod = current_assignment()
+        fn = getattr(mod, entry, None) if mod is not None else None
+        if fn is None:
+            return
+        try:
+            with gui_binding.batch():
+                fn()
+        except Exception:
+            report_assignment_error(entry, traceback.format_exc())
+        return
+    state = gui_binding.bound_state_snapshot()
+    try:
+        from nicegui import background_tasks
+        background_tasks.create(_run_and_apply(runner, entry, state), name=f"assignment-{entry}")
+    except Exception:
+        asyncio.get_event_loop().create_task(_run_and_apply(runner, entry, state))
@@ -0,0 +1,238 @@
+"""
+Session-Persistenz: atomar, journalisiert, außerhalb des Event-Loops.
+
+- Snapshot session_state.json (vollständiger State, wie bisher lesbar) + Journal
+  session_state.journal.jsonl: pro Speichervorgang eine Zeile mit nur den geänderten Keys.
+- submit(state) ist billig (flache Kopie, kein I/O) und darf bei jeder Änderung und jedem
+  Disconnect aufgerufen werden. Ein Writer-Thread sammelt Aufträge aller Clients im
+  Zeitfenster STATE_SAVE_DELAY_SEC (Default 1.5 s) und schreibt nur den letzten Stand.
+- Kompaktierung: Überschreitet das Journal STATE_JOURNAL_MAX_BYTES (Default 256 KiB), wird der
+  Snapshot neu geschrieben (Temp-Datei + fsync + os.replace) und das Journal geleert.
+  Journal-Zeilen enthalten absolute Werte → erneutes Einspielen nach einem Absturz zwischen
+  Snapshot und Leeren ist unschädlich; eine abgeschnittene letzte Zeile wird ignoriert.
+- Ladezeit bleibt konstant: Snapshot + höchstens STATE_JOURNAL_MAX_BYTES Journal.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .model_schema import STATE_DEFAULTS, _coerce_like_default
+
+# Pfad → StateStore (ein Writer-Thread pro Datei und Prozess)
+_STORES: dict[str, "StateStore"] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Datei über Temp-Datei + os.replace schreiben (nie halb geschrieben sichtbar)."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class StateStore:
+    """Snapshot + Delta-Journal für einen Session-State; Schreiben im Hintergrund-Thread."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.stem + ".journal.jsonl")
+        self.delay_sec = max(0.0, _env_float("STATE_SAVE_DELAY_SEC", 1.5))
+        self.journal_max_bytes = int(_env_float("STATE_JOURNAL_MAX_BYTES", 256 * 1024))
+        self._cond = threading.Condition()
+        self._pending: dict[str, Any] | None = None
+        self._pending_since = 0.0  # Zeitpunkt des ersten noch nicht geschriebenen Auftrags
+        self._flush_requested = False
+        self._writing = False
+        self._closed = False
+        # Zuletzt geschriebener Stand (Basis für Deltas)
+        self._persisted: dict[str, Any] = {}
+        self._journal_bytes = 0
+        self._thread: threading.Thread | None = None
+        self.stats: dict[str, Any] = {
+            "submits": 0,
+            "writes": 0,
+            "compactions": 0,
+            "errors": 0,
+            "last_write_ms": 0.0,
+        }
+
+    # --- Laden ---
+
+    def load(self) -> dict[str, Any]:
+        """State aus Snapshot + Journal; unbekannte Keys werden verworfen, Zahlen wie Defaults typisiert."""
+        data: dict[str, Any] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    loaded = json.load(f)
+                if isinstance(loaded, dict):
+                    data.update(loaded)
+            except (OSError, ValueError):
+                self.stats["errors"] += 1
+        self._journal_bytes = 0
+        if self.journal_path.exists():
+            try:
+                with open(self.journal_path, "rb") as f:
+                    raw = f.read()
+                self._journal_bytes = len(raw)
+                for line in raw.splitlines():
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        break  # abgeschnittene Zeile (Absturz beim Anhängen)
+                    if isinstance(delta, dict):
+                        data.update(delta)
+            except OSError:
+                self.stats["errors"] += 1
+        out = STATE_DEFAULTS.copy()
+        for k, v in data.items():
+            if k in out:
+                out[k] = _coerce_like_default(v, out[k])
+        self._persisted = dict(out)
+        return out
+
+    # --- Speichern ---
+
+    def submit(self, state: dict[str, Any]) -> None:
+        """Aktuellen State zum Speichern vormerken (kein I/O; neuere Aufträge ersetzen ältere)."""
+        with self._cond:
+            if self._closed:
+                return
+            if self._pending is None:
+                self._pending_since = time.monotonic()
+            self._pending = dict(state)
+            self.stats["submits"] += 1
+            self._cond.notify()
+        self._ensure_thread()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Warten, bis alle vorgemerkten Stände geschrieben sind (z. B. beim Shutdown)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            # Sammelfenster des Writer-Threads abkürzen
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._thread is None or not self._thread.is_alive():
+                    break
+                self._cond.wait(remaining)
+            done = self._pending is None and not self._writing
+            self._flush_requested = False
+        thread_alive = self._thread is not None and self._thread.is_alive()
+        if not done and not thread_alive and self._pending is not None:
+            # Thread läuft nicht (mehr): im aufrufenden Thread schreiben. Läuft er noch (Timeout),
+            # nicht parallel ins Journal schreiben → False
+            with self._cond:
+                pending, self._pending = self._pending, None
+            if pending is not None:
+                self._write(pending)
+            done = True
+        return done
+
+    def close(self) -> None:
+        """Restliche Änderungen schreiben, Journal in den Snapshot kompaktieren, Thread beenden."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.flush()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        # Schreibt der Thread noch (hängendes Dateisystem), nicht parallel kompaktieren
+        if self._journal_bytes and not (self._thread is not None and self._thread.is_alive()):
+            try:
+                self._compact()
+            except OSError:
+                self.stats["errors"] += 1
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=f"state-store-{self.path.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None and self._closed:
+                    return
+                # Zeitfenster ab dem ersten Auftrag: weitere Änderungen (auch anderer Clients) sammeln.
+                # submit() weckt den Thread zwar, verlängert oder beendet das Fenster aber nicht;
+                # nur flush()/close() kürzen es ab.
+                deadline = self._pending_since + self.delay_sec
+                while not self._closed and not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._flush_requested = False
+                pending, self._pending = self._pending, None
+                self._writing = True
+            try:
+                if pending is not None:
+                    self._write(pending)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, state: dict[str, Any]) -> None:
+        t0 = time.perf_counter()
+        delta = {k: v for k, v in state.items() if k not in self._persisted or self._persisted[k] != v}
+        if not delta:
+            return
+        try:
+            line = (json.dumps(delta, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            with open(self.journal_path, "ab") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_bytes += len(line)
+            self._persisted.update(delta)
+            self.stats["writes"] += 1
+            if self._journal_bytes > self.journal_max_bytes:
+                self._compact()
+        except (OSError, TypeError, ValueError) as e:
+            self.stats["errors"] += 1
+            print(f"[state_store] Speichern fehlgeschlagen ({self.path.name}): {e}")
+        self.stats["last_write_ms"] = (time.perf_counter() - t0) * 1000.0
+
+    def _compact(self) -> None:
+        """Snapshot atomar neu schreiben, danach Journal leeren."""
+        _write_atomic(self.path, json.dumps(self._persisted, indent=2, ensure_ascii=False))
+        _write_atomic(self.journal_path, "")
+        self._journal_bytes = 0
+        self.stats["compactions"] += 1
+
+
+def get_state_store(path: Path | str) -> StateStore:
+    """StateStore für path (einmal pro Prozess; schreibt beim App-Shutdown den Snapshot)."""
+    key = str(Path(path).resolve())
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = StateStore(path)
+            _STORES[key] = store
+            try:
+                from nicegui import app
+                app.on_shutdown(store.close)
+            except Exception:
+                pass
+    return store
@@ -0,0 +1,180 @@
+"""
+Tick-Engine: ein gemeinsamer Server-Timer pro App-Prozess.
+
+Statt eines ui.timer pro Browser-Tab ruft die Engine timer_tick() des aktiven Assignments
+genau einmal pro Periode auf. Während des Ticks verteilen gui_binding.set()/update_plot()
+die Ergebnisse an die Widget-Registries aller verbundenen Clients (gui_binding.broadcast).
+Die CPU-Last bleibt damit konstant, egal wie viele Tabs (Beamer, Studierende, Dozent) offen sind.
+
+- register_client(client): in build_root() aufrufen; startet den Timer beim ersten Client.
+- Rate über Umgebungsvariable TIMER_INTERVAL_SEC (z. B. 0.1 = 10 Hz; <= 0 = kein Timer) oder
+  pro Assignment über TICK_TARGET_HZ / TICK_MIN_HZ (scheduler.TickScheduler: Driftkompensation,
+  Dezimierung der Plot-Updates bei Überlast, verpasste Ticks werden verworfen statt gestaut).
+- Browser-Sättigung: Die Frame-Statistik der PlotlyGraphs (Zeichendauer, zusammengefasste Frames)
+  fließt pro Tick in den Scheduler (report_client_load) und erscheint in get_scheduler_stats()["client"].
+- Jeder Tick läuft in gui_binding.batch(): pro Element höchstens ein Update pro Tick.
+- Mit CLASSROOM_MODE=1 (classroom) läuft timer_tick() einmal pro Studierenden-ID mit verbundenem Tab,
+  jeweils in deren Modul-Instanz und nur an deren Tabs verteilt.
+- Mit ASSIGNMENT_ISOLATION=process läuft timer_tick() im Worker-Prozess (isolation); die
+  zurückgelieferten Operationen werden hier per gui_binding.apply_ops() verteilt.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import traceback
+from typing import Any
+
+from . import gui_binding
+from .assignment_registry import get_assignment
+from .classroom import classroom_enabled, get_student_assignment, group_clients_by_student
+from .isolation import get_runner, report_assignment_error
+from .scheduler import TickScheduler
+
+# client.id → Client; nur registrierte Clients (mit widget_registry) bekommen Tick-Ergebnisse
+_CLIENTS: dict[str, Any] = {}
+# Die eine Tick-Schleife pro Prozess (asyncio-Task, nicht an einen Client gebunden)
+_LOOP_TASK_REF: list = [None]
+# Scheduler (wird beim Start aus TIMER_INTERVAL_SEC erzeugt, pro Assignment nachkonfiguriert)
+_SCHEDULER_REF: list = [None]
+# (TICK_TARGET_HZ, TICK_MIN_HZ), mit denen der Scheduler zuletzt konfiguriert wurde
+_CONFIGURED_RATES_REF: list = [None]
+
+
+def get_timer_interval() -> float:
+    """Tick-Intervall in Sekunden aus TIMER_INTERVAL_SEC (Default 0.1 = 10 Hz)."""
+    try:
+        return float(os.environ.get("TIMER_INTERVAL_SEC", "0.1"))
+    except ValueError:
+        return 0.1
+
+
+def register_client(client: Any) -> None:
+    """Client für die Tick-Verteilung anmelden (Reload desselben Clients überschreibt den Eintrag)."""
+    _CLIENTS[client.id] = client
+    ensure_started()
+
+
+def unregister_client(client: Any) -> None:
+    _CLIENTS.pop(getattr(client, "id", None), None)
+
+
+def connected_clients() -> list[Any]:
+    """Registrierte Clients mit aktiver Verbindung; gelöschte Clients werden dabei entfernt."""
+    try:
+        from nicegui import Client
+        instances = Client.instances
+    except Exception:
+        instances = None
+    out = []
+    for cid, client in list(_CLIENTS.items()):
+        if instances is not None and cid not in instances:
+            _CLIENTS.pop(cid, None)
+            continue
+        if getattr(client, "has_socket_connection", True):
+            out.append(client)
+    return out
+
+
+def ensure_started() -> None:
+    """Startet die gemeinsame Tick-Schleife einmalig (idempotent)."""
+    if _LOOP_TASK_REF[0] is not None:
+        return
+    interval = get_timer_interval()
+    if interval <= 0:
+        return
+    _SCHEDULER_REF[0] = TickScheduler(1.0 / interval)
+    try:
+        from nicegui import background_tasks
+        _LOOP_TASK_REF[0] = background_tasks.create(_run_loop(), name="tick-engine")
+    except Exception:
+        _LOOP_TASK_REF[0] = asyncio.get_event_loop().create_task(_run_loop())
+
+
+def get_scheduler_stats() -> dict[str, Any] | None:
+    """Kennzahlen des Tick-Schedulers (Raten, Laufzeit, Headroom, Plot-Teiler) oder None."""
+    sched = _SCHEDULER_REF[0]
+    if sched is None:
+        return None
+    out = sched.stats()
+    out["suppressed_plots"] = gui_binding.PLOT_STATS["suppressed"]
+    out["client"] = _client_frame_stats()
+    return out
+
+
+def _client_frame_stats() -> dict[str, Any] | None:
+    """Zusammengefasste Frame-Statistik der Browser (PlotlyGraph) oder None ohne widgets-Paket."""
+    try:
+        from widgets.plotly_graph import get_client_frame_stats
+    except ImportError:
+        return None
+    return get_client_frame_stats()
+
+
+def _configure_rates(target_hz: Any, min_hz: Any) -> None:
+    """TICK_TARGET_HZ / TICK_MIN_HZ des Assignments übernehmen (nur wenn sie sich geändert haben)."""
+    sched = _SCHEDULER_REF[0]
+    if sched is None or (target_hz, min_hz) == _CONFIGURED_RATES_REF[0]:
+        return
+    _CONFIGURED_RATES_REF[0] = (target_hz, min_hz)
+    try:
+        sched.configure(float(target_hz or 1.0 / get_timer_interval()), float(min_hz) if min_hz else None)
+    except (TypeError, ValueError):
+        pass
+
+
+async def _run_loop() -> None:
+    """Tick-Schleife: auf den nächsten fälligen Zeitpunkt warten, Tick ausführen, Laufzeit melden."""
+    sched = _SCHEDULER_REF[0]
+    while True:
+        await asyncio.sleep(sched.next_delay(time.perf_counter()))
+        t0 = time.perf_counter()
+        is_plot_frame = sched.begin_tick()
+        try:
+            await _tick(is_plot_frame)
+        except Exception:
+            report_assignment_error("tick_engine", traceback.format_exc())
+        client = _client_frame_stats()
+        if client is not None and client["graphs"]:
+            sched.report_client_load(client["draw_ms_avg"], client["drop_ratio"])
+        sched.end_tick(time.perf_counter() - t0)
+
+
+async def _tick(is_plot_frame: bool = True) -> None:
+    """Ein Tick: timer_tick() einmal ausführen, Ausgaben gehen per broadcast an alle Clients."""
+    clients = connected_clients()
+    if not clients:
+        return  # niemand schaut zu → keine DSP-Last
+    runner = get_runner()
+    if runner is not None:
+        # Assignment wird nur im Worker importiert; Raten kommen mit jeder Antwort zurück
+        with gui_binding.broadcast(clients):
+            snapshot = gui_binding.bound_state_snapshot()
+        ops = await runner.run("timer_tick", snapshot, skip_if_busy=True, is_plot_frame=is_plot_frame)
+        _configure_rates(*runner.rates)
+        if ops:
+            with gui_binding.broadcast(connected_clients()), gui_binding.batch():
+                gui_binding.apply_ops(ops)
+        return
+    mod = get_assignment()
+    _configure_rates(getattr(mod, "TICK_TARGET_HZ", None), getattr(mod, "TICK_MIN_HZ", None))
+    if mod is None or not hasattr(mod, "timer_tick"):
+        return
+    if classroom_enabled():
+        # Pro Studierenden-ID eigene Modul-Instanz, Ergebnisse nur an deren Tabs
+        for student_id, group in group_clients_by_student(clients).items():
+            student_mod = get_student_assignment(student_id)
+            if student_mod is None or not hasattr(student_mod, "timer_tick"):
+                continue
+            with gui_binding.broadcast(group), gui_binding.plot_frame(is_plot_frame), gui_binding.batch():
+                try:
+                    student_mod.timer_tick()
+                except Exception:
+                    report_assignment_error(f"timer_tick [{student_id}]", traceback.format_exc())
+        return
+    with gui_binding.broadcast(clients), gui_binding.plot_frame(is_plot_frame), gui_binding.batch():
+        try:
+            mod.timer_tick()
+        except Exception:
+            report_assignment_error("timer_tick", traceback.format_exc())
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .._core.assignment_registry import get_assignment
+from .._core.isolation import call_assignment
 
 # widget: user_id=header-text
 def on_header_text_change(value: Any) -> None:
@@ -30,9 +30,8 @@ def on_row_1_widget_5_change(value: Any) -> None:
 def on_my_text_change(value: Any) -> None:
     """Path-ID: row_2.widget_3. Widget: 'markdown', label: 'widget_3'. Callback args: value: Any"""
 #begin user code
-    assignment = get_assignment()
-    if assignment is not None and hasattr(assignment, "solve_task"):
-        assignment.solve_task()
+    # Direkt oder (ASSIGNMENT_ISOLATION=process) im Worker-Prozess
+    call_assignment("solve_task")
 #end user code
 
 # widget: user_id=code_table
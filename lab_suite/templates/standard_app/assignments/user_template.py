@@ -16,23 +16,27 @@ Stand get() / set() / update_plot():
 - Wenn SEMANTIC_BINDING korrekt befüllt ist (user_id pro Widget gesetzt), reicht
   get("power"), set("led_status", "on"), update_plot("sine_plot", data) etc.
 
-Timer: Die App startet einen Timer (einstellbare Rate, z. B. 10 Hz) und ruft
-timer_tick() in diesem Modul auf, falls vorhanden. So können Plots/Logik periodisch
-laufen, unabhängig von Button-Callbacks.
+Timer: Die App startet einen gemeinsamen Timer pro App-Prozess (tick_engine, einstellbare
+Rate, z. B. 10 Hz) und ruft timer_tick() in diesem Modul einmal pro Periode auf, falls
+vorhanden; set()/update_plot() wirken dabei auf alle offenen Tabs. So können Plots/Logik
+periodisch laufen, unabhängig von Button-Callbacks.
 
 Performance: ENABLE_PERF_STATS=True oder DEBUG_PERF=1 aktiviert Laufzeit-Messung
 (perf_counter) und optional Prozess-CPU (psutil). Budget = Timer-Intervall;
-Headroom = verbleibende Zeit für DSP pro Tick.
+Headroom = verbleibende Zeit für DSP pro Tick. Mit CLIENT_PERF_PROBE=1 melden die Browser
+FPS, Long Tasks, Plot-Dauer und Websocket-Last (client_perf.get_perf_overview).
 """
 from __future__ import annotations
 
 import math
 import os
-import random
 import time
 
+import numpy as np
+from dsp import awgn
+
 # Zugriff auf die GUI über fachliche Größen (User-IDs aus dem Layout)
-from .._core import gui_binding
+from .._core import client_perf, gui_binding
 
 # Demo: Phasenverschiebung für animierten Sinus (wird in timer_tick erhöht)
 _sine_phase = 0.0
@@ -57,6 +61,14 @@ except ImportError:
     print("psutil not found")
     _perf_process = None
 
+# Tick-Raten für den Scheduler der App: timer_tick() läuft mit TICK_TARGET_HZ (None = TIMER_INTERVAL_SEC);
+# reicht das Budget nicht, werden Plot-Updates bis auf TICK_MIN_HZ dezimiert (Fachlogik läuft weiter).
+TICK_TARGET_HZ: float | None = None
+TICK_MIN_HZ: float = 2.0
+
+# VU-Meter: Änderungen unter 0,5 % nicht senden (gui_binding-Totband; unveränderte Werte werden nie gesendet)
+gui_binding.set_deadband("vu_level", rel=0.005)
+
 # Scattergl (WebGL): flüssigere Animation, bessere Performance bei vielen Punkten (PLOT_SCATTERGL=1)
 USE_SCATTERGL = True #os.environ.get("PLOT_SCATTERGL", "").strip().lower() in ("1", "true", "yes")
 
@@ -142,6 +154,10 @@ _SINE_LAYOUT = {
 }
 
 
+# x-Raster der Sinus-Demo (einmal berechnet): 2000 Punkte über [0, 4π]
+_SINE_RAMP = np.linspace(0.0, 4 * math.pi, 2000)
+
+
 def _update_sine_demo() -> None:
     """
     Demo: Einfache Sinusfunktion im Plot anzeigen.
@@ -149,12 +165,12 @@ def _update_sine_demo() -> None:
     Layout wird immer mitgegeben, damit der Client die Achsen per relayout fix halten kann.
     """
     global _sine_layout_sent
-    n = 2000
-    x = [4 * math.pi * i / (n - 1) for i in range(n)]
-    # Sinus + AWGN, damit man Updates (z. B. mit scattergl) besser erkennt
-    noise_sigma = 0.12
-    y = [math.sin(xi + _sine_phase) + random.gauss(0, noise_sigma) for xi in x]
-    trace = {"x": x, "y": y, "mode": "lines", "name": "sin(x)+noise"}
+    dx = float(_SINE_RAMP[1])
+    # Sinus + AWGN (vektorisiert, SNR ≈ 15 dB), damit man Updates (z. B. mit scattergl) besser erkennt
+    y = np.sin(_SINE_RAMP + _sine_phase)
+    awgn(y, snr_db=15.0, signal_power=0.5, out=y)
+    # Implizite x-Achse (x = x0 + i·dx): pro Tick geht nur y an den Browser
+    trace = {"x0": 0.0, "dx": dx, "y": y, "mode": "lines", "name": "sin(x)+noise"}
     if USE_SCATTERGL:
         trace["type"] = "scattergl"
     data = [trace]
@@ -196,6 +212,10 @@ def timer_tick(timer_interval_sec: float | None = None) -> None:
             )
             if s.get("cpu_pct") is not None:
                 msg += f", CPU={s['cpu_pct']:.1f}%"
+            # Browser-Seite (nur mit CLIENT_PERF_PROBE=1); Gesamtsicht: client_perf.get_perf_overview(s)
+            browser = client_perf.format_client_perf_line()
+            if browser:
+                msg += f" | {browser}"
             print(f"[perf] {msg}")
             # Optional: in GUI anzeigen, wenn ein Label mit user_id "perf_status" existiert
             try:
@@ -15,5 +15,6 @@ from .image_icon_demo import ImageIconDemo
 from .led import Led
 from .plotly_graph import PlotlyGraph
 from .vu_meter import VuMeter
+from .waterfall import Waterfall
 
-__all__ = ["Banner", "GainControlVue", "ImageIconDemo", "Led", "PlotlyGraph", "VuMeter"]
+__all__ = ["Banner", "GainControlVue", "ImageIconDemo", "Led", "PlotlyGraph", "VuMeter", "Waterfall"]
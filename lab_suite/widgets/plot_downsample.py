@@ -0,0 +1,155 @@
+"""
+Pixel-bezogenes Downsampling für PlotlyGraph (serverseitig, vor der Serialisierung).
+
+Ein Plot ist typischerweise ~800 px breit; mehr als ein paar Punkte pro Pixel-Spalte sind
+unsichtbar, kosten aber Serialisierung, Websocket und Rendering im Browser.
+
+- minmax_envelope(x, y, n_buckets): pro Bucket Minimum und Maximum (in Index-Reihenfolge).
+  Erhält Spitzen und Einhüllende – richtig für Oszilloskop/Zeitsignale (Linien).
+- lttb(x, y, n_out): Largest-Triangle-Three-Buckets; wählt pro Bucket den Punkt mit der
+  größten Dreiecksfläche – formtreu für Scatter/Marker-Darstellungen.
+- visible_slice(x, x0, x1): Indexbereich des sichtbaren Ausschnitts (x aufsteigend sortiert).
+
+Nur NumPy; x muss für visible_slice aufsteigend sortiert sein (Zeit-/Frequenzachse).
+Traces ohne x (implizite Achse x0 + i·dx) bleiben bei minmax implizit: die Punkte eines Buckets
+liegen auf einem gleichmäßigen Raster (Abweichung < 1 Bucket ≈ 1 Pixel), gesendet werden nur y, x0, dx.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def minmax_envelope(x: np.ndarray, y: np.ndarray, n_buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Auf höchstens 2 * n_buckets Punkte reduzieren (Min und Max pro Bucket, Reihenfolge wie im Original)."""
+    if len(y) <= 2 * max(1, int(n_buckets)):
+        return x, y
+    idx, _ = _minmax_indices(y, n_buckets)
+    return x[idx], y[idx]
+
+
+def _minmax_indices(y: np.ndarray, n_buckets: int) -> tuple[np.ndarray, int]:
+    """Indizes von Min und Max pro Bucket (2 pro Bucket, aufsteigend) und Bucket-Größe."""
+    n = len(y)
+    n_buckets = max(1, int(n_buckets))
+    size = -(-n // n_buckets)  # ceil
+    n_buckets = -(-n // size)
+    # Auf volle Buckets auffüllen (Randwert wiederholen), dann zeilenweise argmin/argmax
+    padded = np.pad(y, (0, n_buckets * size - n), mode="edge").reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    i_min = offsets + np.argmin(padded, axis=1)
+    i_max = offsets + np.argmax(padded, axis=1)
+    idx = np.minimum(np.stack([np.minimum(i_min, i_max), np.maximum(i_min, i_max)], axis=1).ravel(), n - 1)
+    return idx, size
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets: n_out Punkte (erster und letzter bleiben erhalten)."""
+    n = len(y)
+    n_out = max(3, int(n_out))
+    if n <= n_out:
+        return x, y
+    xf = x.astype(np.float64, copy=False) if x.dtype.kind in "iuf" else np.arange(n, dtype=np.float64)
+    yf = y.astype(np.float64, copy=False)
+    # Bucket-Grenzen für die inneren Punkte (1 … n-2)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+    # Mittelwerte des jeweils nächsten Buckets vorab (vektorisiert)
+    sums_x = np.add.reduceat(xf[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(yf[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(np.append(edges[:-1], n - 1))
+    avg_x = np.append(sums_x / counts, xf[-1])
+    avg_y = np.append(sums_y / counts, yf[-1])
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        cx, cy = avg_x[b + 1], avg_y[b + 1]
+        ax, ay = xf[a], yf[a]
+        area = np.abs((ax - cx) * (yf[lo:hi] - ay) - (ax - xf[lo:hi]) * (cy - ay))
+        a = lo + int(np.argmax(area)) if hi > lo else lo
+        idx[b + 1] = a
+    return x[idx], y[idx]
+
+
+def visible_slice(x: np.ndarray, x0: float, x1: float) -> slice:
+    """Indexbereich für x in [x0, x1] plus je ein Punkt Rand (Linie läuft bis an den Plotrand)."""
+    if x0 > x1:
+        x0, x1 = x1, x0
+    i0, i1 = np.searchsorted(x, [x0, x1])
+    return slice(max(0, int(i0) - 1), min(len(x), int(i1) + 1))
+
+
+def reduce_trace(
+    trace: dict[str, Any],
+    method: str,
+    width_px: int,
+    view: tuple[float, float] | None = None,
+) -> dict[str, Any]:
+    """
+    Trace (dict mit x/y) für width_px Pixel reduzieren. method: auto|minmax|lttb|off.
+    auto: minmax für Linien, lttb für reine Marker; andere Trace-Typen (bar, heatmap, 3D) unverändert.
+    view: sichtbarer x-Bereich (nach Zoom) – nur dieser Ausschnitt wird gesendet.
+    """
+    if method == "off" or trace.get("type", "scatter") not in ("scatter", "scattergl"):
+        return trace
+    y = trace.get("y")
+    if y is None or isinstance(y, (str, bytes)) or len(y) <= 2 * width_px:
+        return trace
+    y = np.asarray(y)
+    if y.ndim != 1 or y.dtype.kind not in "iuf":
+        return trace
+    if method == "auto":
+        mode = str(trace.get("mode") or "lines")
+        method = "lttb" if "lines" not in mode else "minmax"
+    x = trace.get("x")
+    if x is None:
+        return _reduce_implicit(trace, y, method, width_px, view)
+    x = np.asarray(x)
+    if x.shape != y.shape:
+        return trace
+    if view is not None and x.dtype.kind in "iuf":
+        sl = visible_slice(x, view[0], view[1])
+        x, y = x[sl], y[sl]
+    if method == "lttb":
+        xs, ys = lttb(x, y, width_px)
+    else:
+        xs, ys = minmax_envelope(x, y, width_px)
+    out = dict(trace)
+    out["x"] = xs
+    out["y"] = ys
+    return out
+
+
+def _reduce_implicit(
+    trace: dict[str, Any],
+    y: np.ndarray,
+    method: str,
+    width_px: int,
+    view: tuple[float, float] | None,
+) -> dict[str, Any]:
+    """Trace ohne x (x0 + i·dx): minmax bleibt implizit (neues x0/dx), lttb liefert explizites x."""
+    x0 = float(trace.get("x0", 0.0))
+    dx = float(trace.get("dx", 1.0)) or 1.0
+    start = 0
+    if view is not None:
+        lo, hi = sorted(((view[0] - x0) / dx, (view[1] - x0) / dx))
+        start = min(len(y), max(0, int(np.floor(lo)) - 1))
+        y = y[start:max(start, int(np.ceil(hi)) + 2)]
+    out = dict(trace)
+    if method == "lttb":
+        out["x"], out["y"] = lttb(x0 + dx * np.arange(start, start + len(y)), y, width_px)
+        out.pop("x0", None)
+        out.pop("dx", None)
+        return out
+    out["x0"] = x0 + start * dx
+    out["dx"] = dx
+    if len(y) > 2 * width_px:
+        # Punkte j·size und j·size + size/2 im Bucket j: Raster mit Schritt size/2
+        idx, size = _minmax_indices(y, width_px)
+        y = y[idx]
+        out["dx"] = dx * size / 2.0
+    out["y"] = y
+    return out
@@ -1,6 +1,67 @@
 // Generisches Plotly-Graph-Widget – eine Vue-Komponente für alle Modi (Spektrum, Oszilloskop, Scatter, 3D).
-// Lädt plotly.js bei Bedarf von CDN (NiceGUI setzt window.Plotly oft nicht).
-const PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.27.0.min.js";
+// Lädt plotly.js einmal pro Seite von /widgets-static (kein CDN); die App setzt dafür <link rel=preload>.
+const PLOTLY_DEFAULT_URL = "/widgets-static/plotly.min.js";
+// Gemeinsames Laden für alle Graphen der Seite (ein <script>, ein Download)
+let plotlyLoading = null;
+
+function loadPlotlyOnce(url) {
+  if (window.Plotly) return Promise.resolve();
+  if (!plotlyLoading) {
+    plotlyLoading = new Promise((resolve, reject) => {
+      const script = document.createElement("script");
+      script.src = url;
+      script.onload = () => resolve();
+      script.onerror = () => {
+        plotlyLoading = null; // erneuter Versuch beim nächsten Mount
+        reject(new Error("plotly.js konnte nicht geladen werden: " + url));
+      };
+      document.head.appendChild(script);
+    });
+  }
+  return plotlyLoading;
+}
+
+// Abstand der Frame-Statistik-Meldungen an den Server (plot_stats)
+const STATS_INTERVAL_MS = 1000;
+
+/** Nächsten Animations-Frame abwarten (ohne rAF, z. B. in Tests: sofort). */
+function nextFrame() {
+  return new Promise((resolve) => (typeof requestAnimationFrame === "function" ? requestAnimationFrame(resolve) : resolve()));
+}
+
+// Binäre Trace-Daten vom Server (plotly_graph.py): {dtype, bdata (Base64, Little Endian), shape}
+const TYPED_ARRAYS = {
+  i1: Int8Array, u1: Uint8Array, u1c: Uint8ClampedArray, i2: Int16Array, u2: Uint16Array,
+  i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array,
+};
+
+function decodeTypedArray(v) {
+  const Ctor = TYPED_ARRAYS[v.dtype];
+  const bin = atob(v.bdata);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  const arr = new Ctor(bytes.buffer);
+  const shape = String(v.shape || "").split(",").map(Number);
+  if (shape.length === 2 && shape[0] > 0) {
+    // 2D (z. B. Heatmap z): Zeilen als Sichten auf denselben Puffer
+    const rows = [];
+    for (let r = 0; r < shape[0]; r++) rows.push(arr.subarray(r * shape[1], (r + 1) * shape[1]));
+    return rows;
+  }
+  return arr;
+}
+
+/** Traces kopieren und alle {dtype, bdata}-Objekte durch TypedArrays ersetzen. */
+function decodeBinary(obj) {
+  if (Array.isArray(obj)) return obj.map(decodeBinary);
+  if (obj && typeof obj === "object") {
+    if (typeof obj.bdata === "string" && TYPED_ARRAYS[obj.dtype]) return decodeTypedArray(obj);
+    const out = {};
+    for (const k of Object.keys(obj)) out[k] = decodeBinary(obj[k]);
+    return out;
+  }
+  return obj;
+}
 
 export default {
   template: `
@@ -14,14 +75,36 @@ export default {
     layout: { type: Object, default: () => ({}) },
     config: { type: Object, default: () => ({ responsive: true }) },
     height: { type: String, default: "400px" },
-    /** Leer = CDN (Internet). Für Offline: z. B. "/static/plotly.min.js" (Datei lokal ausliefern). */
+    /** URL von plotly.js (Server setzt die Hash-URL aus /widgets-static; leer = /widgets-static/plotly.min.js). */
     plotlyScriptUrl: { type: String, default: "" },
     /** Bei true: nur Trace-Daten (x/y) per restyle aktualisieren, kein voller react – flüssiger bei Animation. */
     restyleOnly: { type: Boolean, default: false },
+    /** Version von data/layout/config (steigt mit jedem Server-Update); Updates kommen per applyFigure. */
+    version: { type: Number, default: 0 },
+    /** Serverseitiges Downsampling (auto|minmax|lttb|off): Breite und Zoom an den Server melden. */
+    downsample: { type: String, default: "auto" },
+    /** Registrierte x-Achsen (axis_id → Werte); Traces verweisen per x_axis_id darauf. */
+    axes: { type: Object, default: () => ({}) },
   },
   data() {
     return { plotlyReady: false, loadStarted: false };
   },
+  created() {
+    // Nicht reaktiv: große Arrays sollen nicht von Vue durchlaufen werden
+    this._figure = { data: this.data, layout: this.layout, config: this.config };
+    this._version = this.version; // neueste empfangene Version
+    this._drawnVersion = -1; // zuletzt gezeichnete Version
+    this._restyle = false; // true = alle ausstehenden Versionen sind reine restyle-Updates
+    this._drawing = false;
+    // Frame-Statistik seit der letzten Meldung: gezeichnete / zusammengefasste Versionen, Zeichendauer
+    this._stats = { draws: 0, dropped: 0, drawMsSum: 0, drawMsMax: 0, since: 0 };
+    // append_samples vor dem ersten newPlot bzw. während eines draw: puffern und danach anhängen
+    this._pendingAppends = [];
+    // Registrierte x-Achsen (dekodiert), Updates per setAxis; true = zuletzt gezeichnete Traces ohne x
+    this._axes = {};
+    for (const id of Object.keys(this.axes || {})) this._axes[id] = decodeBinary(this.axes[id]);
+    this._implicitX = null;
+  },
   computed: {
     wrapperStyle() {
       return `width: 100%; height: ${this.height}; min-height: 200px; position: relative;`;
@@ -32,43 +115,176 @@ export default {
   },
   mounted() {
     if (typeof window === "undefined") return;
+    this.observeWidth();
     if (window.Plotly) {
       this.plotlyReady = true;
-      this.$nextTick(() => this.draw());
+      this.$nextTick(() => this.flush());
       return;
     }
     this.loadPlotly();
   },
+  beforeUnmount() {
+    if (this._resizeObserver) this._resizeObserver.disconnect();
+    clearTimeout(this._resizeTimer);
+  },
   methods: {
+    observeWidth() {
+      // Breite der Zeichenfläche melden (entprellt), damit der Server auf Pixelbreite reduziert
+      if (this.downsample === "off" || typeof ResizeObserver === "undefined") return;
+      const el = this.$refs.container;
+      if (!el) return;
+      this._resizeObserver = new ResizeObserver((entries) => {
+        const width = Math.round(entries[0].contentRect.width);
+        if (!width || width === this._reportedWidth) return;
+        clearTimeout(this._resizeTimer);
+        this._resizeTimer = setTimeout(() => {
+          this._reportedWidth = width;
+          this.$emit("plot_resize", width);
+        }, 200);
+      });
+      this._resizeObserver.observe(el);
+    },
+    onRelayout(ev) {
+      // Nur Zoom/Pan des Nutzers melden (nicht die eigenen relayout-Aufrufe in draw)
+      if (this._ownRelayout || this.downsample === "off" || !ev) return;
+      const keys = Object.keys(ev).filter((k) => k.startsWith("xaxis.range") || k === "xaxis.autorange");
+      if (!keys.length) return;
+      const args = {};
+      for (const k of keys) args[k] = ev[k];
+      this.$emit("plot_relayout", args);
+    },
+    /** Server: PlotlyGraph._send_axes – registrierte x-Achse (neu oder geändert); kommt vor applyFigure. */
+    setAxis(axisId, x) {
+      this._axes[axisId] = decodeBinary(x);
+    },
+    /** Trace mit x_axis_id: x aus der registrierten Achse einsetzen. */
+    resolveAxis(trace) {
+      if (!trace || trace.x_axis_id === undefined) return trace;
+      const { x_axis_id: axisId, x_axis_version: _v, ...rest } = trace;
+      const x = this._axes[axisId];
+      if (x) rest.x = x;
+      return rest;
+    },
+    /**
+     * Server: PlotlyGraph._push – neue Figur-Version. Genau ein react/restyle pro gezeichneter Version;
+     * trifft eine neuere ein, bevor die vorige gezeichnet ist, wird die ältere verworfen.
+     * data/layout/config = null: unverändert.
+     */
+    applyFigure(version, data, layout, config, restyleOnly) {
+      if (version <= this._version) return; // veraltet (z. B. Nachricht nach Props-Update)
+      // Traces kommen als einmal serialisierter JSON-Text (für alle Clients derselbe)
+      if (typeof data === "string") data = JSON.parse(data);
+      const pending = this._drawnVersion < this._version;
+      this._version = version;
+      if (data !== null && data !== undefined) this._figure.data = data;
+      if (layout !== null && layout !== undefined) this._figure.layout = layout;
+      if (config !== null && config !== undefined) this._figure.config = config;
+      // restyle nur, wenn keine der zusammengefassten Versionen ein volles react braucht
+      this._restyle = Boolean(restyleOnly) && (!pending || this._restyle);
+      this.flush();
+    },
+    async flush() {
+      if (this._drawing || !this.plotlyReady) return; // laufender draw holt danach die neueste Version
+      this._drawing = true;
+      try {
+        while (this._drawnVersion < this._version) {
+          // Höchstens ein draw pro Animations-Frame; bis dahin eintreffende Versionen ersetzen die wartende
+          await nextFrame();
+          const version = this._version;
+          const restyle = this._restyle;
+          if (this._drawnVersion >= 0) this._stats.dropped += Math.max(0, version - this._drawnVersion - 1);
+          await this.draw(restyle);
+          this._drawnVersion = version;
+        }
+      } finally {
+        this._drawing = false;
+      }
+      const pending = this._pendingAppends.splice(0);
+      for (const args of pending) await this.appendSamples(...args);
+    },
+    recordDraw(durationMs) {
+      // Browser-Telemetrie (client_perf, CLIENT_PERF_PROBE=1)
+      if (window.__perfProbe) window.__perfProbe.plotDraw(durationMs);
+      const st = this._stats;
+      st.draws += 1;
+      st.drawMsSum += durationMs;
+      st.drawMsMax = Math.max(st.drawMsMax, durationMs);
+      const now = performance.now();
+      if (!st.since) st.since = now;
+      if (now - st.since < STATS_INTERVAL_MS) return;
+      // Sättigung im Browser an den Server melden (Tick-Scheduler, Perf-Anzeige)
+      this.$emit("plot_stats", {
+        draws: st.draws,
+        dropped: st.dropped,
+        draw_ms_avg: st.drawMsSum / st.draws,
+        draw_ms_max: st.drawMsMax,
+        interval_ms: now - st.since,
+      });
+      this._stats = { draws: 0, dropped: 0, drawMsSum: 0, drawMsMax: 0, since: now };
+    },
+    /** Server: PlotlyGraph.append_samples – neue Samples anhängen, Trace auf maxPoints begrenzen (Ringpuffer). */
+    async appendSamples(traceIdx, x, y, maxPoints) {
+      const el = this.$refs.container;
+      if (!el || !window.Plotly || !el.data || this._drawing || this._drawnVersion < this._version) {
+        this._pendingAppends.push([traceIdx, x, y, maxPoints]);
+        return;
+      }
+      const trace = el.data[traceIdx];
+      if (!trace) return;
+      // Plotly verkettet TypedArrays nur mit TypedArrays; bestehende Listen-Traces als Liste erweitern
+      const match = (arr, current) => (ArrayBuffer.isView(current) || !ArrayBuffer.isView(arr) ? arr : Array.from(arr));
+      const update = { y: [match(decodeBinary(y), trace.y)] };
+      if (x !== null && x !== undefined) update.x = [match(decodeBinary(x), trace.x)];
+      try {
+        if (maxPoints) await window.Plotly.extendTraces(el, update, [traceIdx], maxPoints);
+        else await window.Plotly.extendTraces(el, update, [traceIdx]);
+      } catch (err) {
+        console.warn("PlotlyGraph appendSamples:", err);
+      }
+    },
     loadPlotly() {
       if (this.loadStarted) return;
       this.loadStarted = true;
-      const script = document.createElement("script");
-      script.src = (this.plotlyScriptUrl && this.plotlyScriptUrl.trim()) ? this.plotlyScriptUrl.trim() : PLOTLY_CDN;
-      script.onload = () => {
-        this.plotlyReady = true;
-        this.$nextTick(() => this.draw());
-      };
-      script.onerror = () => {
-        this.loadStarted = false;
-        console.warn("PlotlyGraph: CDN load failed");
-      };
-      document.head.appendChild(script);
+      const url = (this.plotlyScriptUrl && this.plotlyScriptUrl.trim()) || PLOTLY_DEFAULT_URL;
+      loadPlotlyOnce(url)
+        .then(() => {
+          this.plotlyReady = true;
+          this.$nextTick(() => this.flush());
+        })
+        .catch((err) => {
+          this.loadStarted = false;
+          console.warn("PlotlyGraph:", err.message);
+        });
     },
-    async draw() {
+    async draw(restyleOnly) {
       const el = this.$refs.container;
       if (!el || !window.Plotly) return;
-      const data = Array.isArray(this.data) && this.data.length ? this.data : [{ x: [], y: [], mode: "lines" }];
-      const layout = this.layout && typeof this.layout === "object" ? { ...this.layout } : {};
-      const config = this.config && typeof this.config === "object" ? this.config : { responsive: true };
+      const fig = this._figure;
+      const data = Array.isArray(fig.data) && fig.data.length
+        ? decodeBinary(fig.data).map((t) => this.resolveAxis(t))
+        : [{ x: [], y: [], mode: "lines" }];
+      // Implizite x-Achse (x0/dx statt x): restyle nur, wenn sich die Art der Achse nicht ändert
+      const implicitX = data.map((t) => t.x === undefined);
+      const sameAxes = this._implicitX !== null && implicitX.join() === this._implicitX.join();
+      const allImplicit = implicitX.every(Boolean);
+      const layout = fig.layout && typeof fig.layout === "object" ? { ...fig.layout } : {};
+      // Zoom/Pan des Nutzers bei react() beibehalten (Server sendet bei Zoom neu reduzierte Daten)
+      if (layout.uirevision === undefined) layout.uirevision = "plotly-graph";
+      const config = fig.config && typeof fig.config === "object" ? fig.config : { responsive: true };
       const t0 = typeof performance !== "undefined" ? performance.now() : 0;
       try {
         if (!el.data) {
           await window.Plotly.newPlot(el, data, layout, config);
-        } else if (this.restyleOnly && data.length > 0) {
-          const xArr = data.map((t) => t.x || []);
-          const yArr = data.map((t) => t.y || []);
-          await window.Plotly.restyle(el, { x: xArr, y: yArr });
+          el.on("plotly_relayout", (ev) => this.onRelayout(ev));
+        } else if (restyleOnly && data.length > 0 && sameAxes && (allImplicit || !implicitX.some(Boolean))) {
+          const update = { y: data.map((t) => t.y || []) };
+          if (allImplicit) {
+            update.x0 = data.map((t) => t.x0 ?? 0);
+            update.dx = data.map((t) => t.dx ?? 1);
+          } else {
+            update.x = data.map((t) => t.x);
+          }
+          await window.Plotly.restyle(el, update);
           // Achsen fix halten: Plotly reaktiviert bei restyle oft autorange – relayout mit flachen Keys
           const relayoutArg = {};
           if (layout.xaxis) {
@@ -79,13 +295,22 @@ export default {
             if (layout.yaxis.range) relayoutArg["yaxis.range"] = layout.yaxis.range;
             if (layout.yaxis.autorange === false) relayoutArg["yaxis.autorange"] = false;
           }
-          if (Object.keys(relayoutArg).length) await window.Plotly.relayout(el, relayoutArg);
+          if (Object.keys(relayoutArg).length) {
+            this._ownRelayout = true;
+            try {
+              await window.Plotly.relayout(el, relayoutArg);
+            } finally {
+              this._ownRelayout = false;
+            }
+          }
         } else {
           await window.Plotly.react(el, data, layout, config);
         }
+        this._implicitX = implicitX;
         if (typeof window !== "undefined" && t0 > 0) {
           const durationMs = performance.now() - t0;
           window.__lastPlotDurationMs = durationMs;
+          this.recordDraw(durationMs);
           if (typeof console !== "undefined" && console.log) {
             console.log("[PlotlyGraph] draw:", durationMs.toFixed(2), "ms");
           }
@@ -96,8 +321,9 @@ export default {
     },
   },
   watch: {
-    data: { handler() { if (this.plotlyReady) this.$nextTick(() => this.draw()); }, deep: true },
-    layout: { handler() { if (this.plotlyReady && !this.restyleOnly) this.$nextTick(() => this.draw()); }, deep: true },
-    restyleOnly: { handler() { if (this.plotlyReady) this.$nextTick(() => this.draw()); } },
+    // Nur die Versionsnummer beobachten (flach): Props-Update vom Server (z. B. nach Reconnect) nachziehen
+    version() {
+      this.applyFigure(this.version, this.data, this.layout, this.config, this.restyleOnly);
+    },
   },
 };
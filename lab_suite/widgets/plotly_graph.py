@@ -5,35 +5,269 @@ Spektrum, Oszilloskop (Time-Domain), Scatter, 3D: ein gemeinsamer Graph-Containe
 Steuerung und Defaults (RBW, Time-Base, …) bleiben in spezialisierten Wrappern oder
 in der App (z. B. SpectrumPanel mit PlotlyGraph + Frequenz-/Pegel-Controls).
 
-Daten: data/layout können NumPy-Arrays enthalten (x, y, z in Traces); sie werden
-intern zu Listen konvertiert (JSON-Serialisierung, Performance: .tolist() ist schnell).
+Daten: data/layout können NumPy-Arrays enthalten (x, y, z in Traces). In Traces werden
+numerische Arrays binär übertragen (Plotly-Typed-Array-Format {"dtype", "bdata", "shape"},
+bdata = Base64 der Little-Endian-Bytes); plotly_graph.js dekodiert sie in TypedArrays.
+Gleitkomma wird als float32 gesendet (PLOTLY_BINARY=f8: float64, PLOTLY_BINARY=off: JSON-Listen);
+x-Achsen, die float32 nicht fein genug auflöst (Zeitstempel, Frequenzen in Hz), immer als float64.
+Kleine Arrays (< _BINARY_MIN_SIZE Werte) und layout bleiben JSON-Listen.
+
+Downsampling (plot_downsample): Vor der Serialisierung werden lange Linien-/Marker-Traces auf die
+Pixelbreite reduziert (downsample="auto"|"minmax"|"lttb"|"off"). Der Browser meldet die Breite
+(Event plot_resize) und Zoom/Pan (plot_relayout); dann wird aus den zuletzt übergebenen Originaldaten
+der sichtbare Ausschnitt neu reduziert und gesendet – Details gehen beim Zoomen nicht verloren.
+
+Update-Kanal: Nach dem ersten Aufbau gehen Figur-Updates nicht über Props (kein tiefer Vue-Watcher
+über große Arrays), sondern per run_method("applyFigure", version, …) mit fortlaufender Version.
+Der Browser zeichnet genau einmal pro Version und verwirft überholte Versionen. Die Props werden still
+mitgeführt, damit ein Neuaufbau des Elements den aktuellen Stand zeigt.
+
+Frame-Takt im Browser: höchstens ein draw pro Animations-Frame; dazwischen eintreffende Versionen
+werden zusammengefasst (gezählt als dropped). Etwa einmal pro Sekunde meldet der Browser Zeichendauer
+und verworfene Versionen (Event plot_stats); get_client_frame_stats() fasst die Meldungen aller
+Graphen zusammen (für Tick-Scheduler und Perf-Anzeige).
+
+Geteilte Payloads: Zeigen mehrere Tabs denselben Plot (broadcast im Tick), wird dasselbe data-Objekt
+nur einmal reduziert, binär kodiert und per orjson in einen JSON-Text serialisiert; alle Clients mit
+gleicher Reduktion (Breite, Zoom) bekommen denselben Text (Cache gilt für einen Event-Loop-Durchlauf,
+also einen Tick). Der Text ist per Digest adressiert: unveränderte Figuren werden gar nicht erst gesendet.
+Grenze: run_method übergibt den Text als String-Argument, NiceGUI kodiert die Nachricht (mit Escaping
+des Strings) pro Client erneut. Pro Client bleibt also ein linearer Kopier-/Escape-Durchlauf über den
+Text; entfallen sind Reduktion, Base64 und das Serialisieren der Zahlen. Zähler: PAYLOAD_STATS.
+
+Implizite x-Achse: Zeit- und Frequenzplots brauchen x meist nicht pro Update. Traces ohne x mit
+x0/dx (Plotly: x = x0 + i·dx) senden nur y; das Downsampling hält sie implizit. Für nicht gleichmäßige
+Achsen register_axis(axis_id, x) einmalig aufrufen und im Trace "x_axis_id": axis_id statt x angeben:
+x geht pro Graph nur einmal (und nach Änderung erneut, setAxis) an den Browser, danach nur y.
+
+Streaming (append_samples): Für Strip-Charts nur neue Samples senden; der Browser hängt sie per
+Plotly.extendTraces an und begrenzt die Trace auf max_points (Ringpuffer). Bandbreite ∝ neue Daten.
 """
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
 from typing import Any
 
 from nicegui.element import Element
 
+from .static_assets import resolve_asset_url
+
+# Ab dieser Länge lohnt sich Base64 gegenüber JSON-Zahlenlisten
+_BINARY_MIN_SIZE = 32
+# Ganzzahl-Typen, die Plotly als Typed Array kennt (numpy dtype.str ohne Byte-Order → Plotly dtype)
+_INT_DTYPES = {"i1": "i1", "u1": "u1", "i2": "i2", "u2": "u2", "i4": "i4", "u4": "u4"}
+
+
+def _binary_mode() -> str:
+    """PLOTLY_BINARY: f4 (Default), f8 oder off."""
+    mode = os.environ.get("PLOTLY_BINARY", "f4").strip().lower()
+    return mode if mode in ("f4", "f8", "off") else "f4"
+
+
+def _encode_array(arr: Any, float_dtype: str) -> dict[str, str] | None:
+    """NumPy-Array → {"dtype", "bdata", "shape"} (Plotly-Typed-Array) oder None (nicht geeignet)."""
+    import numpy as np
+    if arr.ndim not in (1, 2) or arr.size < _BINARY_MIN_SIZE:
+        return None
+    kind = arr.dtype.kind
+    if kind == "f":
+        dtype = float_dtype
+    elif kind in "iu":
+        dtype = _INT_DTYPES.get(arr.dtype.str[1:])
+        if dtype is None:  # 64-Bit-Ganzzahlen: int32, wenn der Wertebereich passt
+            lo, hi = int(arr.min()), int(arr.max())
+            dtype = "i4" if -2**31 <= lo and hi < 2**31 else "f8"
+    else:
+        return None
+    buf = np.ascontiguousarray(arr, dtype=np.dtype(dtype).newbyteorder("<"))
+    return {
+        "dtype": dtype,
+        "bdata": base64.b64encode(buf.tobytes()).decode("ascii"),
+        "shape": ",".join(str(n) for n in arr.shape),
+    }
+
 
-def _to_serializable(obj: Any) -> Any:
-    """Konvertiert NumPy-Arrays/Skalare in listen/json-serialisierbare Python-Typen (für Plotly/Vue)."""
+def _axis_binary(arr: Any, binary: str) -> str:
+    """
+    Binärmodus für x-/Zeitachsen: f4 nur, wenn float32 die Abstände der Werte noch auflöst.
+    Große Absolutwerte (Zeitstempel, HF-Frequenzen wie 1.42e9 Hz) würden sonst zu Stufen → f8.
+    """
+    import numpy as np
+    if binary != "f4" or not isinstance(arr, np.ndarray) or arr.dtype.kind != "f" or arr.size < _BINARY_MIN_SIZE:
+        return binary
+    lo, hi = float(np.min(arr)), float(np.max(arr))
+    step = (hi - lo) / (arr.size - 1)
+    # Rundungsfehler (halbe ULP bei max|x|) klein gegen den mittleren Abstand
+    ulp = float(np.spacing(np.float32(max(abs(lo), abs(hi)))))
+    return "f4" if step > 0 and ulp * 64 <= step else "f8"
+
+
+def _to_serializable(obj: Any, binary: str = "off") -> Any:
+    """
+    Konvertiert NumPy-Arrays/Skalare in JSON-serialisierbare Python-Typen (für Plotly/Vue).
+    binary="f4"/"f8": numerische Arrays als Plotly-Typed-Array (Base64) statt Liste; "x" nur als f4,
+    wenn die Auflösung reicht (_axis_binary).
+    """
     if obj is None:
         return None
     try:
         import numpy as np
         if isinstance(obj, np.ndarray):
+            if binary != "off":
+                encoded = _encode_array(obj, binary)
+                if encoded is not None:
+                    return encoded
             return obj.tolist()
         if isinstance(obj, (np.floating, np.integer)):
             return float(obj) if isinstance(obj, np.floating) else int(obj)
     except ImportError:
         pass
     if isinstance(obj, dict):
-        return {k: _to_serializable(v) for k, v in obj.items()}
+        return {k: _to_serializable(v, _axis_binary(v, binary) if k == "x" else binary) for k, v in obj.items()}
     if isinstance(obj, list):
-        return [_to_serializable(v) for v in obj]
+        return [_to_serializable(v, binary) for v in obj]
     return obj
 
 
+def _traces_to_serializable(data: Any) -> Any:
+    """Traces serialisieren; numerische Arrays binär (PLOTLY_BINARY)."""
+    return _to_serializable(data, _binary_mode())
+
+
+def _dumps(obj: Any) -> str:
+    """JSON-Text (orjson, sonst json)."""
+    try:
+        import orjson
+        return orjson.dumps(obj).decode("utf-8")
+    except ImportError:
+        return json.dumps(obj, separators=(",", ":"))
+
+
+# Serialisierte Trace-Payloads des laufenden Event-Loop-Durchlaufs:
+# (id(data), Reduktion, Binärmodus) → (data, serialisierbare Traces, JSON-Text, Digest).
+# data wird mitgehalten, damit id(data) bis zum Leeren eindeutig bleibt.
+_PAYLOAD_CACHE: dict[tuple, tuple[Any, Any, str, str]] = {}
+# encoded: serialisiert, reused: aus dem Cache (weiterer Client), unchanged: nicht gesendet (gleicher Digest)
+PAYLOAD_STATS: dict[str, int] = {"encoded": 0, "reused": 0, "unchanged": 0}
+
+
+# append_samples ohne max_points: Fenster begrenzen (Server und Browser), PLOTLY_APPEND_MAX_POINTS
+_APPEND_MAX_POINTS = 100_000
+# Nach append_samples die Props (Neuaufbau/Reconnect) höchstens so oft aus dem Fenster neu berechnen
+_PROPS_SYNC_SEC = 1.0
+
+
+def _append_max_points() -> int:
+    try:
+        return max(1, int(os.environ.get("PLOTLY_APPEND_MAX_POINTS", "") or _APPEND_MAX_POINTS))
+    except ValueError:
+        return _APPEND_MAX_POINTS
+
+
+class _StripBuffer:
+    """
+    Fenster der letzten cap Werte als zusammenhängende Sicht (für Reduktion/Serialisierung).
+    Puffer 2·cap: anhängen kopiert nur die neuen Werte, beim Überlauf wird das Fenster einmal
+    an den Anfang verschoben – amortisiert O(neue Werte) statt O(Fenster) pro append.
+    """
+
+    def __init__(self, cap: int, initial: Any) -> None:
+        import numpy as np
+        self.cap = cap
+        self._buf = np.empty(2 * cap, dtype=np.asarray(initial).dtype if len(initial) else np.float64)
+        self._start = 0
+        self._end = 0
+        self.view: Any = None  # zuletzt ausgegebene Sicht (erkennt fremde Änderungen an der Trace)
+        self.extend(initial)
+
+    def extend(self, new: Any) -> Any:
+        import numpy as np
+        new = np.asarray(new)[-self.cap:]
+        n = len(new)
+        dtype = np.result_type(self._buf.dtype, new.dtype)
+        if dtype != self._buf.dtype:
+            buf = np.empty(2 * self.cap, dtype=dtype)
+            buf[:self._end - self._start] = self._buf[self._start:self._end]
+            self._buf, self._end, self._start = buf, self._end - self._start, 0
+        if self._end + n > len(self._buf):
+            keep = min(self.cap - n, self._end - self._start)
+            self._buf[:keep] = self._buf[self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        self._buf[self._end:self._end + n] = new
+        self._end += n
+        self._start = max(self._start, self._end - self.cap)
+        self.view = self._buf[self._start:self._end]
+        return self.view
+
+
+# Registrierte x-Achsen: axis_id → (Version, Array); Version steigt, wenn sich die Werte ändern
+_AXES: dict[str, tuple[int, Any]] = {}
+
+
+def register_axis(axis_id: str, x: Any) -> bool:
+    """
+    x-Achse unter axis_id registrieren (Traces: "x_axis_id": axis_id statt x).
+    Gleiche Werte erneut registrieren ist billig und sendet nichts; True = Achse neu oder geändert.
+    """
+    import numpy as np
+    arr = np.array(x)  # Kopie: spätere Änderungen am Original wirken erst nach erneutem register_axis
+    prev = _AXES.get(axis_id)
+    if prev is not None and prev[1].shape == arr.shape and np.array_equal(prev[1], arr):
+        return False
+    _AXES[axis_id] = ((prev[0] + 1) if prev else 1, arr)
+    return True
+
+
+def _cache_payload(key: tuple, entry: tuple[Any, Any, str, str]) -> None:
+    """Nur mit laufendem Event-Loop cachen; geleert wird im nächsten Durchlauf (nach dem Tick)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if not _PAYLOAD_CACHE:
+        loop.call_soon(_PAYLOAD_CACHE.clear)
+    _PAYLOAD_CACHE[key] = entry
+
+
+# Letzte Frame-Statistik pro Graph: id(Element) → (Zeitpunkt, Meldung aus plot_stats)
+_CLIENT_FRAME_STATS: dict[int, tuple[float, dict[str, float]]] = {}
+# Meldungen, die älter sind, zählen nicht mehr (Tab geschlossen, Graph entfernt)
+_CLIENT_STATS_MAX_AGE_SEC = 5.0
+
+
+def get_client_frame_stats() -> dict[str, Any]:
+    """
+    Zusammenfassung der Browser-Meldungen aller PlotlyGraphs (letzte _CLIENT_STATS_MAX_AGE_SEC):
+    graphs, draws, dropped, drop_ratio, draw_ms_avg, draw_ms_max.
+    """
+    now = time.monotonic()
+    for key in [k for k, (t, _) in _CLIENT_FRAME_STATS.items() if now - t > _CLIENT_STATS_MAX_AGE_SEC]:
+        _CLIENT_FRAME_STATS.pop(key, None)
+    reports = [r for _, r in _CLIENT_FRAME_STATS.values()]
+    draws = sum(r["draws"] for r in reports)
+    dropped = sum(r["dropped"] for r in reports)
+    return {
+        "graphs": len(reports),
+        "draws": draws,
+        "dropped": dropped,
+        "drop_ratio": dropped / (draws + dropped) if draws + dropped else 0.0,
+        "draw_ms_avg": sum(r["draw_ms_avg"] * r["draws"] for r in reports) / draws if draws else 0.0,
+        "draw_ms_max": max((r["draw_ms_max"] for r in reports), default=0.0),
+    }
+
+
+_DOWNSAMPLE_MODES = ("auto", "minmax", "lttb", "off")
+# Plotbreite (px), bis der Browser die tatsächliche Breite meldet
+_DEFAULT_WIDTH_PX = 800
+# Gemeldete Breiten auf Vielfache davon runden (Tabs mit ähnlicher Breite teilen die Payload)
+_WIDTH_STEP_PX = 64
+
+
 class PlotlyGraph(Element, component="plotly_graph.js"):
 
     def __init__(
@@ -44,13 +278,185 @@ class PlotlyGraph(Element, component="plotly_graph.js"):
         *,
         height: str = "400px",
         plotly_script_url: str = "",
+        downsample: str = "auto",
     ) -> None:
         super().__init__()
-        self._props["data"] = _to_serializable(data or [])
+        self._downsample = downsample if downsample in _DOWNSAMPLE_MODES else "auto"
+        self._width_px = _DEFAULT_WIDTH_PX
+        # Sichtbarer x-Bereich nach Zoom (None = gesamte Daten) und letzte Originaldaten (für Neuberechnung)
+        self._view_range: tuple[float, float] | None = None
+        self._raw_data: list[dict] = data or []
+        self._version = 0
+        # Digest der zuletzt gesendeten Traces (unveränderte Figur nicht erneut senden)
+        self._sent_digest: str | None = None
+        # Im Browser vorhandene registrierte Achsen: axis_id → Version
+        self._sent_axes: dict[str, int] = {}
+        # append_samples: (trace_idx, "x"|"y") → Fenster; Props-Abgleich verzögert (_PROPS_SYNC_SEC)
+        self._strips: dict[tuple[int, str], _StripBuffer] = {}
+        self._props_sync: Any = None
+        self._props["axes"] = {}
+        self._props["data"] = _traces_to_serializable(self._reduce(self._raw_data))
+        self._send_axes(self._props["data"], initial=True)
         self._props["layout"] = _to_serializable(layout or {})
         self._props["config"] = config or {"responsive": True}
         self._props["height"] = height
-        self._props["plotlyScriptUrl"] = plotly_script_url
+        # "" bzw. /widgets-static/plotly.min.js → Hash-URL (immutable gecacht, vorkomprimiert)
+        self._props["plotlyScriptUrl"] = resolve_asset_url(plotly_script_url)
+        self._props["downsample"] = self._downsample
+        self._props["version"] = 0
+        self.on("plot_resize", self._on_plot_resize)
+        self.on("plot_relayout", self._on_plot_relayout)
+        self.on("plot_stats", self._on_plot_stats)
+        # Letzte Frame-Statistik dieses Graphen aus dem Browser (siehe get_client_frame_stats)
+        self.client_stats: dict[str, float] = {}
+
+    def _reduce(self, data: list[dict]) -> list[dict]:
+        """Traces auf Pixelbreite / sichtbaren Bereich reduzieren (downsample-Modus)."""
+        if not isinstance(data, list):
+            return data
+        reduce_trace = None
+        if self._downsample != "off":
+            try:
+                from .plot_downsample import reduce_trace
+            except ImportError:
+                pass
+        return [self._reduce_trace(t, reduce_trace) if isinstance(t, dict) else t for t in data]
+
+    def _reduce_trace(self, trace: dict, reduce_trace: Any | None) -> dict:
+        """
+        Einen Trace reduzieren. Mit "x_axis_id": bleibt die Referenz (plus Achsen-Version), solange nicht
+        reduziert wird; sonst geht das reduzierte x explizit mit.
+        """
+        axis_id = trace.get("x_axis_id")
+        if axis_id is None:
+            if reduce_trace is None:
+                return trace
+            return reduce_trace(trace, self._downsample, self._width_px, self._view_range)
+        entry = _AXES.get(axis_id)
+        if entry is None:
+            raise ValueError(f"PlotlyGraph: x-Achse {axis_id!r} nicht registriert (register_axis)")
+        if reduce_trace is not None:
+            resolved = {k: v for k, v in trace.items() if k != "x_axis_id"}
+            resolved["x"] = entry[1]
+            reduced = reduce_trace(resolved, self._downsample, self._width_px, self._view_range)
+            if reduced is not resolved:
+                return reduced
+        # Version im Trace: neue Achse → anderer Digest → Figur wird neu gesendet
+        return {**trace, "x_axis_version": entry[0]}
+
+    def _send_axes(self, traces: Any, initial: bool = False) -> None:
+        """Registrierte Achsen, die der Browser (in dieser Version) noch nicht hat, vorab senden (setAxis)."""
+        if not isinstance(traces, list):
+            return
+        for t in traces:
+            if not isinstance(t, dict) or "x_axis_id" not in t:
+                continue
+            axis_id, version = t["x_axis_id"], t.get("x_axis_version")
+            if self._sent_axes.get(axis_id) == version:
+                continue
+            self._sent_axes[axis_id] = version
+            axis = _AXES[axis_id][1]
+            x = _to_serializable(axis, _axis_binary(axis, _binary_mode()))
+            self._props["axes"][axis_id] = x  # für Neuaufbau/Reconnect
+            if not initial:
+                self.run_method("setAxis", axis_id, x)
+
+    def _resend(self) -> None:
+        """Letzte Originaldaten neu reduzieren und senden (Layout unverändert; Zoom bleibt per uirevision)."""
+        if self._downsample == "off" or not self._raw_data:
+            return
+        self._push(self._payload(self._raw_data))
+
+    def _payload(self, data: Any) -> tuple[Any, str, str]:
+        """(serialisierbare Traces, JSON-Text, Digest) – pro Tick einmal je data-Objekt und Reduktion."""
+        key = (id(data), self._downsample, self._width_px, self._view_range, _binary_mode())
+        hit = _PAYLOAD_CACHE.get(key)
+        if hit is not None and hit[0] is data:
+            PAYLOAD_STATS["reused"] += 1
+            return hit[1], hit[2], hit[3]
+        obj = _traces_to_serializable(self._reduce(data))
+        text = _dumps(obj)
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        PAYLOAD_STATS["encoded"] += 1
+        _cache_payload(key, (data, obj, text, digest))
+        return obj, text, digest
+
+    def _push(
+        self,
+        payload: tuple[Any, str, str] | None,
+        layout: dict | None = None,
+        config: dict | None = None,
+        restyle_only: bool = False,
+    ) -> None:
+        """
+        Neue Version an den Browser (applyFigure); None = unverändert. Traces gehen als fertiger
+        JSON-Text (payload aus _payload); NiceGUI kodiert die Nachricht dennoch pro Client (String-Escaping). Props ohne update() mitführen (für Neuaufbau/Reconnect),
+        damit nichts doppelt gesendet wird.
+        """
+        if (
+            payload is not None
+            and payload[2] == self._sent_digest
+            and (layout is None or layout == self._props["layout"])
+            and (config is None or config == self._props["config"])
+        ):
+            PAYLOAD_STATS["unchanged"] += 1
+            return
+        self._version += 1
+        text = None
+        if payload is not None:
+            self._props["data"], text, self._sent_digest = payload
+            self._send_axes(self._props["data"])
+        if layout is not None:
+            self._props["layout"] = layout
+        if config is not None:
+            self._props["config"] = config
+        self._props["restyleOnly"] = restyle_only
+        self._props["version"] = self._version
+        self.run_method("applyFigure", self._version, text, layout, config, restyle_only)
+
+    def _on_plot_resize(self, e: Any) -> None:
+        try:
+            width = int(float(e.args))
+        except (TypeError, ValueError):
+            return
+        if width <= 0:
+            return
+        width = max(_WIDTH_STEP_PX, round(width / _WIDTH_STEP_PX) * _WIDTH_STEP_PX)
+        if abs(width - self._width_px) < 0.1 * self._width_px:
+            return
+        self._width_px = width
+        self._resend()
+
+    def _on_plot_relayout(self, e: Any) -> None:
+        args = e.args if isinstance(e.args, dict) else {}
+        view = self._view_range
+        if args.get("xaxis.autorange"):
+            view = None
+        elif "xaxis.range[0]" in args and "xaxis.range[1]" in args:
+            view = (args["xaxis.range[0]"], args["xaxis.range[1]"])
+        elif isinstance(args.get("xaxis.range"), list) and len(args["xaxis.range"]) == 2:
+            view = tuple(args["xaxis.range"])
+        if view is not None:
+            try:
+                view = (float(view[0]), float(view[1]))
+            except (TypeError, ValueError):
+                view = None  # z. B. Datumsachse: ganzer Bereich
+        if view == self._view_range:
+            return
+        self._view_range = view
+        self._resend()
+
+    def _on_plot_stats(self, e: Any) -> None:
+        args = e.args if isinstance(e.args, dict) else {}
+        try:
+            report = {
+                k: float(args.get(k) or 0.0)
+                for k in ("draws", "dropped", "draw_ms_avg", "draw_ms_max", "interval_ms")
+            }
+        except (TypeError, ValueError):
+            return
+        self.client_stats = report
+        _CLIENT_FRAME_STATS[id(self)] = (time.monotonic(), report)
 
     def update_figure(
         self,
@@ -62,25 +468,101 @@ class PlotlyGraph(Element, component="plotly_graph.js"):
     ) -> None:
         """
         Graphen aktualisieren (neue Traces/Layout).
-        data/traces dürfen NumPy-Arrays in x/y/z enthalten.
+        data/traces dürfen NumPy-Arrays in x/y/z enthalten (werden binär übertragen, siehe Modul-Doku).
         restyle_only=True: nur x/y per restyle senden (weniger Daten, oft flüssiger bei Animation).
         """
-        self._props["data"] = _to_serializable(data)
-        self._props["restyleOnly"] = restyle_only
-        if layout is not None:
-            self._props["layout"] = _to_serializable(layout)
-        if config is not None:
-            self._props["config"] = config
-        self.update()
+        self._raw_data = data
+        self._push(
+            self._payload(data),
+            _to_serializable(layout) if layout is not None else None,
+            config,
+            restyle_only,
+        )
+
+    def append_samples(
+        self,
+        trace_idx: int,
+        x: Any,
+        y: Any,
+        max_points: int | None = None,
+    ) -> None:
+        """
+        Neue Samples an Trace trace_idx anhängen (Strip-Chart/Rollender Zeitplot).
+        Gesendet werden nur die neuen Werte (Plotly.extendTraces); max_points begrenzt die Trace im
+        Browser als Ringpuffer (älteste Punkte fallen heraus; ohne Angabe PLOTLY_APPEND_MAX_POINTS,
+        Default 100000). x=None: nur y anhängen (nur für Traces ohne explizites x).
+        Die Originaldaten auf dem Server werden im gleichen Fenster mitgeführt (_StripBuffer, ohne
+        Umkopieren des ganzen Fensters), damit ein späteres Neusenden (Resize, Zoom, Reconnect) den
+        aktuellen Stand zeigt.
+        """
+        import numpy as np
+        y = np.asarray(y)
+        x = None if x is None else np.asarray(x)
+        if y.ndim != 1 or (x is not None and x.shape != y.shape):
+            raise ValueError("append_samples: x und y müssen 1D und gleich lang sein")
+        if len(y) == 0:
+            return
+        max_points = max(1, int(max_points)) if max_points is not None else _append_max_points()
+        if len(y) > max_points:  # nur das Ende ist nach dem Anhängen noch sichtbar
+            y = y[-max_points:]
+            x = None if x is None else x[-max_points:]
+        raw = list(self._raw_data) if isinstance(self._raw_data, list) else []
+        while len(raw) <= trace_idx:
+            raw.append({"x": [], "y": [], "mode": "lines"})
+        trace = dict(raw[trace_idx])
+        has_x = trace.get("x") is not None and len(trace["x"]) > 0
+        has_y = trace.get("y") is not None and len(trace["y"]) > 0
+        if x is None and has_x:
+            raise ValueError("append_samples: Trace hat explizites x, x=None würde x und y verschieden lang machen")
+        if x is not None and has_y and not has_x:
+            raise ValueError("append_samples: Trace ohne x (implizite Achse), hier kein x angeben")
+        for k, new in (("x", x), ("y", y)):
+            if new is None:
+                continue
+            old = trace.get(k)
+            strip = self._strips.get((trace_idx, k))
+            if strip is None or strip.cap != max_points or strip.view is not old:
+                # Erstes append bzw. Trace inzwischen per update() ersetzt: Fenster neu aufsetzen
+                strip = _StripBuffer(max_points, np.asarray(old if old is not None else []))
+                self._strips[(trace_idx, k)] = strip
+            trace[k] = strip.extend(new)
+        raw[trace_idx] = trace
+        self._raw_data = raw
+        self._sent_digest = None  # Browser-Stand weicht jetzt von der letzten Payload ab
+        self._schedule_props_sync()
+        binary = _binary_mode()
+        self.run_method(
+            "appendSamples",
+            int(trace_idx),
+            None if x is None else _to_serializable(x, _axis_binary(x, binary)),
+            _to_serializable(y, binary),
+            max_points,
+        )
+
+    def _schedule_props_sync(self) -> None:
+        """Props (für Neuaufbau/Reconnect) nach append_samples nachziehen – gebündelt, nicht pro append."""
+        if self._props_sync is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._sync_props()
+            return
+        self._props_sync = loop.call_later(_PROPS_SYNC_SEC, self._sync_props)
+
+    def _sync_props(self) -> None:
+        self._props_sync = None
+        self._props["data"] = self._payload(self._raw_data)[0]
 
     def update_from_figure(self, fig: Any) -> None:
         """Figure von plotly.graph_objects (go.Figure) übernehmen (z. B. fig.to_plotly_json())."""
         try:
             out = fig.to_plotly_json()
-            self._props["data"] = _to_serializable(out.get("data", []))
-            self._props["layout"] = _to_serializable(out.get("layout", {}))
-            if "config" in out:
-                self._props["config"] = out["config"]
-            self.update()
+            self._raw_data = out.get("data", [])
+            self._push(
+                self._payload(self._raw_data),
+                _to_serializable(out.get("layout", {})),
+                out.get("config"),
+            )
         except Exception:
             pass
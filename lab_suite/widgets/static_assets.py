@@ -0,0 +1,171 @@
+"""
+Statische Widget-Assets (/widgets-static): Content-Hash-Dateinamen, vorkomprimierte Varianten, Caching.
+
+- build_assets(static_dir): für jede Quelldatei (z. B. plotly.min.js) eine Kopie mit Inhalts-Hash im
+  Namen (plotly.min.<hash>.js) plus .gz und – falls das Paket brotli installiert ist – .br anlegen;
+  manifest.json ordnet logischen Namen → Hash-Namen zu. Veraltete Hash-Dateien werden entfernt.
+- ensure_assets(static_dir): build_assets nur, wenn manifest.json fehlt oder eine Quelle sich geändert hat
+  (App-Start; schnell, wenn alles aktuell ist).
+- asset_url(name) / resolve_asset_url(url): "/widgets-static/plotly.min.js" → Hash-URL (sonst unverändert).
+- register_static_route(app, static_dir): Route /widgets-static/{name}. Hash-Dateien mit
+  "Cache-Control: immutable" (ein Jahr), Auslieferung als .br/.gz je nach Accept-Encoding.
+- preload_html(): <link rel="preload"> für Plotly – der Download startet beim Laden der Seite,
+  nicht erst beim Mount des ersten PlotlyGraph.
+
+Kein CDN: plotly_graph.js lädt ausschließlich von /widgets-static (einmal pro Seite).
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+URL_PREFIX = "/widgets-static"
+PLOTLY_ASSET = "plotly.min.js"
+MANIFEST_NAME = "manifest.json"
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+# Quelldateien, die gehasht werden (alles andere in static/ wird unverändert ausgeliefert)
+_SOURCE_SUFFIXES = (".js", ".css")
+# Hash-Dateiname: <stamm>.<12 Hex-Zeichen><endung>
+_HASHED_RE = re.compile(r"\.[0-9a-f]{12}\.(js|css)$")
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_MEDIA_TYPES = {".js": "application/javascript", ".css": "text/css", ".json": "application/json"}
+
+# Geladenes Manifest pro static-Verzeichnis: {logischer Name: {"file", "sha256", "size", "mtime_ns"}}
+_MANIFEST_REF: list = [None]
+
+
+def _is_source(path: Path) -> bool:
+    return path.is_file() and path.suffix in _SOURCE_SUFFIXES and not _HASHED_RE.search(path.name)
+
+
+def _hashed_name(path: Path, digest: str) -> str:
+    # plotly.min.js → plotly.min.<hash>.js
+    return f"{path.stem}.{digest[:12]}{path.suffix}"
+
+
+def build_assets(static_dir: Path = STATIC_DIR, brotli_quality: int = 11) -> dict[str, dict[str, Any]]:
+    """Hash-Kopien, .gz/.br-Varianten und manifest.json für alle Quelldateien in static_dir erzeugen."""
+    static_dir = Path(static_dir)
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    manifest: dict[str, dict[str, Any]] = {}
+    keep: set[str] = {MANIFEST_NAME}
+    for src in sorted(p for p in static_dir.iterdir() if _is_source(p)):
+        data = src.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        name = _hashed_name(src, digest)
+        target = static_dir / name
+        if not target.exists():
+            target.write_bytes(data)
+        variants = {name}
+        gz = static_dir / (name + ".gz")
+        if not gz.exists():
+            gz.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        variants.add(gz.name)
+        if brotli is not None:
+            br = static_dir / (name + ".br")
+            if not br.exists():
+                br.write_bytes(brotli.compress(data, quality=brotli_quality))
+            variants.add(br.name)
+        keep |= variants
+        st = src.stat()
+        manifest[src.name] = {"file": name, "sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    # Veraltete Hash-Dateien (frühere Versionen) entfernen
+    for p in static_dir.iterdir():
+        base = p.name[:-3] if p.name.endswith((".gz", ".br")) else p.name
+        if _HASHED_RE.search(base) and p.name not in keep:
+            p.unlink()
+    (static_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    _MANIFEST_REF[0] = manifest
+    return manifest
+
+
+def load_manifest(static_dir: Path = STATIC_DIR) -> dict[str, dict[str, Any]]:
+    """manifest.json lesen (leer, wenn nicht vorhanden)."""
+    if _MANIFEST_REF[0] is None:
+        try:
+            _MANIFEST_REF[0] = json.loads((Path(static_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _MANIFEST_REF[0] = {}
+    return _MANIFEST_REF[0]
+
+
+def ensure_assets(static_dir: Path = STATIC_DIR) -> dict[str, dict[str, Any]]:
+    """
+    Manifest aktuell halten: neu bauen, wenn eine Quelldatei neu/geändert ist (Größe, mtime).
+    Beim App-Start mit Brotli-Stufe 9 (Sekundenbruchteile statt ~10 s für Stufe 11 bei 3,5 MB).
+    """
+    static_dir = Path(static_dir)
+    _MANIFEST_REF[0] = None
+    manifest = load_manifest(static_dir)
+    sources = {p.name: p.stat() for p in static_dir.iterdir() if _is_source(p)} if static_dir.exists() else {}
+    stale = set(sources) != set(manifest) or any(
+        manifest[n].get("size") != st.st_size
+        or manifest[n].get("mtime_ns") != st.st_mtime_ns
+        or not (static_dir / manifest[n]["file"]).exists()
+        for n, st in sources.items()
+    )
+    if stale and sources:
+        manifest = build_assets(static_dir, brotli_quality=9)
+    return manifest
+
+
+def asset_url(name: str) -> str:
+    """URL für eine Datei aus widgets/static (Hash-Name, falls im Manifest)."""
+    entry = load_manifest().get(name)
+    return f"{URL_PREFIX}/{entry['file'] if entry else name}"
+
+
+def resolve_asset_url(url: str) -> str:
+    """"" oder "/widgets-static/<name>" → asset_url(name); andere URLs (z. B. /static/… pro App) unverändert."""
+    url = (url or "").strip()
+    if not url:
+        return asset_url(PLOTLY_ASSET)
+    if url.startswith(URL_PREFIX + "/"):
+        return asset_url(url[len(URL_PREFIX) + 1:])
+    return url
+
+
+def preload_html(name: str = PLOTLY_ASSET) -> str:
+    """<link rel="preload"> für ein Script aus widgets/static (für ui.add_head_html)."""
+    return f'<link rel="preload" href="{asset_url(name)}" as="script">'
+
+
+def _pick_encoding(path: Path, accept_encoding: str) -> tuple[Path, str | None]:
+    """Vorkomprimierte Variante passend zu Accept-Encoding (br vor gzip) oder die Datei selbst."""
+    accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+    for enc, suffix in (("br", ".br"), ("gzip", ".gz")):
+        candidate = path.with_name(path.name + suffix)
+        if enc in accepted and candidate.exists():
+            return candidate, enc
+    return path, None
+
+
+def register_static_route(app: Any, static_dir: Path = STATIC_DIR) -> None:
+    """GET /widgets-static/{name}: Hash-Dateien immutable (1 Jahr), sonst no-cache; br/gzip nach Accept-Encoding."""
+    from fastapi import HTTPException, Request
+    from fastapi.responses import FileResponse
+
+    root = Path(static_dir).resolve()
+    ensure_assets(root)
+
+    @app.get(URL_PREFIX + "/{name}", include_in_schema=False)
+    def _widgets_static(name: str, request: Request) -> FileResponse:
+        path = (root / name).resolve()
+        if path.parent != root or not path.is_file() or name.endswith((".gz", ".br")):
+            raise HTTPException(status_code=404)
+        served, encoding = _pick_encoding(path, request.headers.get("accept-encoding", ""))
+        headers = {
+            "Cache-Control": _IMMUTABLE if _HASHED_RE.search(name) else "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return FileResponse(served, media_type=_MEDIA_TYPES.get(path.suffix, "application/octet-stream"), headers=headers)
@@ -0,0 +1,155 @@
+// Wasserfall / Spektrogramm – Ringpuffer auf einem Canvas (eine Zeile pro pushRows-Eintrag).
+// Zeilen kommen als Base64-uint8 (0…255 = dbMin…dbMax) und werden über eine Farbtabelle eingefärbt.
+// Ringpuffer: Offscreen-Canvas (bins × rows); neueste Zeile bei `head`, Anzeige oben = neueste.
+
+// Stützpunkte der Farbtabellen (gleichmäßig über 0…255), linear interpoliert
+const COLORMAP_STOPS = {
+  viridis: ["#440154", "#482878", "#3e4989", "#31688e", "#26828e", "#1f9e89", "#35b779", "#6ece58", "#b5de2b", "#fde725"],
+  inferno: ["#000004", "#1b0c41", "#4a0c6b", "#781c6d", "#a52c60", "#cf4446", "#ed6925", "#fb9b06", "#f7d13d", "#fcffa4"],
+  gray: ["#000000", "#ffffff"],
+};
+
+function buildLut(name) {
+  const stops = (COLORMAP_STOPS[name] || COLORMAP_STOPS.viridis).map((h) => [
+    parseInt(h.slice(1, 3), 16), parseInt(h.slice(3, 5), 16), parseInt(h.slice(5, 7), 16),
+  ]);
+  const lut = new Uint8ClampedArray(256 * 4);
+  for (let i = 0; i < 256; i++) {
+    const pos = (i / 255) * (stops.length - 1);
+    const k = Math.min(stops.length - 2, Math.floor(pos));
+    const f = pos - k;
+    for (let c = 0; c < 3; c++) lut[i * 4 + c] = stops[k][c] + (stops[k + 1][c] - stops[k][c]) * f;
+    lut[i * 4 + 3] = 255;
+  }
+  return lut;
+}
+
+function decodeRow(b64) {
+  const bin = atob(b64);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  return bytes;
+}
+
+export default {
+  template: `
+    <div class="waterfall" :style="wrapperStyle">
+      <canvas ref="canvas" :style="canvasStyle"></canvas>
+      <div v-if="xMin !== null || xMax !== null" class="waterfall-axis" style="display:flex;justify-content:space-between;font-size:11px;color:#666;">
+        <span>{{ formatX(xMin) }}</span>
+        <span>{{ dbMin }} … {{ dbMax }} dB</span>
+        <span>{{ formatX(xMax) }}</span>
+      </div>
+    </div>
+  `,
+  props: {
+    rows: { type: Number, default: 200 },
+    dbMin: { type: Number, default: -100 },
+    dbMax: { type: Number, default: 0 },
+    colormap: { type: String, default: "viridis" },
+    height: { type: String, default: "300px" },
+    xMin: { type: Number, default: null },
+    xMax: { type: Number, default: null },
+    xUnit: { type: String, default: "Hz" },
+  },
+  computed: {
+    wrapperStyle() {
+      return `width: 100%; height: ${this.height}; display: flex; flex-direction: column;`;
+    },
+    canvasStyle() {
+      return "width: 100%; flex: 1; min-height: 0; image-rendering: pixelated; background: #000;";
+    },
+  },
+  created() {
+    // Nicht reaktiv (kein Vue-Overhead pro Zeile)
+    this._lut = buildLut(this.colormap);
+    this._buffer = null; // Offscreen-Canvas bins × rows
+    this._bins = 0;
+    this._head = 0;
+    this._filled = 0;
+    this._frame = 0;
+  },
+  beforeUnmount() {
+    if (this._frame) cancelAnimationFrame(this._frame);
+  },
+  methods: {
+    formatX(v) {
+      if (v === null || v === undefined) return "";
+      const a = Math.abs(v);
+      if (a >= 1e9) return (v / 1e9).toFixed(3) + " G" + this.xUnit;
+      if (a >= 1e6) return (v / 1e6).toFixed(3) + " M" + this.xUnit;
+      if (a >= 1e3) return (v / 1e3).toFixed(2) + " k" + this.xUnit;
+      return v.toFixed(1) + " " + this.xUnit;
+    },
+    resetBuffer(bins) {
+      const buf = document.createElement("canvas");
+      buf.width = bins;
+      buf.height = this.rows;
+      this._buffer = buf;
+      this._bins = bins;
+      this._head = 0;
+      this._filled = 0;
+      this._row = buf.getContext("2d").createImageData(bins, 1);
+      const canvas = this.$refs.canvas;
+      if (canvas) {
+        canvas.width = bins;
+        canvas.height = this.rows;
+      }
+    },
+    /** Server: Waterfall.push_rows – Zeilen (älteste zuerst) in den Ringpuffer schreiben. */
+    pushRows(rows) {
+      for (const b64 of rows) {
+        const values = decodeRow(b64);
+        if (!values.length) continue;
+        if (values.length !== this._bins || !this._buffer) this.resetBuffer(values.length);
+        const px = this._row.data;
+        const lut = this._lut;
+        for (let i = 0; i < values.length; i++) {
+          const o = values[i] * 4;
+          px[i * 4] = lut[o];
+          px[i * 4 + 1] = lut[o + 1];
+          px[i * 4 + 2] = lut[o + 2];
+          px[i * 4 + 3] = 255;
+        }
+        this._head = (this._head - 1 + this.rows) % this.rows;
+        this._buffer.getContext("2d").putImageData(this._row, 0, this._head);
+        this._filled = Math.min(this.rows, this._filled + 1);
+      }
+      this.scheduleDraw();
+    },
+    clear() {
+      if (this._bins) this.resetBuffer(this._bins);
+      this.scheduleDraw();
+    },
+    scheduleDraw() {
+      // Mehrere Zeilen pro Frame → ein Zeichenvorgang
+      if (this._frame) return;
+      this._frame = requestAnimationFrame(() => {
+        this._frame = 0;
+        this.draw();
+      });
+    },
+    draw() {
+      const canvas = this.$refs.canvas;
+      if (!canvas || !this._buffer) return;
+      const ctx = canvas.getContext("2d");
+      const w = this._bins;
+      const h = this.rows;
+      ctx.clearRect(0, 0, w, h);
+      // Ringpuffer ab head (neueste) nach unten, Rest (0…head) darunter
+      const top = h - this._head;
+      ctx.drawImage(this._buffer, 0, this._head, w, top, 0, 0, w, top);
+      if (this._head > 0) ctx.drawImage(this._buffer, 0, 0, w, this._head, 0, top, w, this._head);
+      if (this._filled < h) ctx.clearRect(0, this._filled, w, h - this._filled);
+    },
+  },
+  watch: {
+    colormap() {
+      this._lut = buildLut(this.colormap);
+    },
+    rows() {
+      if (this._bins) this.resetBuffer(this._bins);
+      this.scheduleDraw();
+    },
+  },
+};
@@ -0,0 +1,95 @@
+"""
+Wasserfall / Spektrogramm – Canvas-Ringpuffer im Browser, Vue/JS.
+
+Der Server sendet pro Tick nur eine neue Spektrumzeile (push_row), quantisiert auf uint8
+(0 = db_min, 255 = db_max) und Base64-kodiert: bei 1024 Bins ~1,4 KB statt einer ganzen Heatmap.
+waterfall.js hält die letzten `rows` Zeilen als Ringpuffer auf einem Canvas, färbt sie über eine
+Farbtabelle ein und zeichnet höchstens einmal pro Frame (kein Plotly-relayout).
+
+Zeilen mit mehr als max_bins Werten werden vor dem Senden per Block-Maximum verkleinert
+(Spitzen bleiben sichtbar). Änderungen von db_min/db_max wirken auf neue Zeilen.
+"""
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from nicegui.element import Element
+
+_COLORMAPS = ("viridis", "inferno", "gray")
+
+
+def quantize_row(row_db: Any, db_min: float, db_max: float, max_bins: int = 0) -> bytes:
+    """dB-Zeile → uint8-Bytes (0…255 über db_min…db_max); max_bins > 0: Block-Maximum auf höchstens max_bins."""
+    import numpy as np
+    row = np.asarray(row_db, dtype=np.float32).ravel()
+    if max_bins and len(row) > max_bins:
+        size = -(-len(row) // max_bins)  # ceil
+        pad = (-len(row)) % size
+        if pad:
+            row = np.concatenate((row, np.full(pad, row[-1], dtype=row.dtype)))
+        row = row.reshape(-1, size).max(axis=1)
+    span = float(db_max - db_min) or 1.0
+    q = np.clip((row - db_min) * (255.0 / span), 0.0, 255.0)
+    return np.nan_to_num(q, nan=0.0).astype(np.uint8).tobytes()
+
+
+class Waterfall(Element, component="waterfall.js"):
+
+    def __init__(
+        self,
+        *,
+        rows: int = 200,
+        db_min: float = -100.0,
+        db_max: float = 0.0,
+        colormap: str = "viridis",
+        height: str = "300px",
+        max_bins: int = 1024,
+        x_min: float | None = None,
+        x_max: float | None = None,
+        x_unit: str = "Hz",
+    ) -> None:
+        super().__init__()
+        self._db_min = float(db_min)
+        self._db_max = float(db_max)
+        self._max_bins = max(0, int(max_bins))
+        self._props["rows"] = max(1, int(rows))
+        self._props["dbMin"] = self._db_min
+        self._props["dbMax"] = self._db_max
+        self._props["colormap"] = colormap if colormap in _COLORMAPS else "viridis"
+        self._props["height"] = height
+        self._props["xMin"] = x_min
+        self._props["xMax"] = x_max
+        self._props["xUnit"] = x_unit
+
+    def push_row(self, row_db: Any) -> None:
+        """Eine Spektrumzeile (dB, Liste oder NumPy-Array) oben anfügen; älteste Zeile fällt heraus."""
+        self.push_rows([row_db])
+
+    def push_rows(self, rows_db: list[Any]) -> None:
+        """Mehrere Zeilen (älteste zuerst) in einer Nachricht senden, z. B. gesammelt in gui_binding.batch()."""
+        if not rows_db:
+            return
+        encoded = [
+            base64.b64encode(quantize_row(r, self._db_min, self._db_max, self._max_bins)).decode("ascii")
+            for r in rows_db
+        ]
+        self.run_method("pushRows", encoded)
+
+    def set_range(self, db_min: float, db_max: float) -> None:
+        """Pegelbereich der Farbskala (gilt für folgende Zeilen)."""
+        self._db_min = float(db_min)
+        self._db_max = float(db_max)
+        self._props["dbMin"] = self._db_min
+        self._props["dbMax"] = self._db_max
+        self.update()
+
+    def set_x_range(self, x_min: float | None, x_max: float | None) -> None:
+        """Beschriftung der x-Achse (z. B. Frequenz von/bis)."""
+        self._props["xMin"] = x_min
+        self._props["xMax"] = x_max
+        self.update()
+
+    def clear(self) -> None:
+        """Verlauf im Browser löschen."""
+        self.run_method("clear")